@@ -21,7 +21,7 @@ import logging
 import requests
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, TextIO, Union
 
 logger = logging.getLogger(__name__)
 
@@ -63,8 +63,10 @@ class BRollFetcher:
         self.cache_dir = cache_dir or Path("data/temp/broll_cache")
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-        # Rate limiting state file
+        # Rate limiting state file, plus its parsed contents once loaded
+        # (this instance writes through, so the file is only read once)
         self.rate_limit_file = self.cache_dir / "rate_limit.json"
+        self._rl_cache: Optional[Dict] = None
         self._init_rate_limit()
 
     def fetch_from_plan(self, csv_path: Path) -> List[Dict[str, Any]]:
@@ -192,12 +194,13 @@ class BRollFetcher:
             logger.error(f"Unexpected error downloading '{query}': {e}")
             return None
 
-    def _parse_csv(self, csv_path: Path) -> List[Dict[str, Any]]:
+    def _parse_csv(self, csv_source: Union[Path, TextIO]) -> List[Dict[str, Any]]:
         """
         Parse B-roll plan CSV.
 
         Args:
-            csv_path: Path to CSV file
+            csv_source: Path to CSV file, or an open text stream (e.g.,
+                ``io.StringIO``) positioned at the header row
 
         Returns:
             List of clip dicts
@@ -206,45 +209,63 @@ class BRollFetcher:
             FileNotFoundError: If CSV not found
             ValueError: If CSV has invalid format
         """
-        if not csv_path.exists():
-            raise FileNotFoundError(f"B-roll plan CSV not found: {csv_path}")
+        if hasattr(csv_source, 'read'):
+            return self._parse_csv_rows(csv_source)
 
+        if not csv_source.exists():
+            raise FileNotFoundError(f"B-roll plan CSV not found: {csv_source}")
+
+        with open(csv_source, 'r', encoding='utf-8') as f:
+            return self._parse_csv_rows(f)
+
+    def _parse_csv_rows(self, f: TextIO) -> List[Dict[str, Any]]:
+        """
+        Parse and validate the rows of an open B-roll plan CSV stream.
+
+        Args:
+            f: Text stream positioned at the header row
+
+        Returns:
+            List of clip dicts
+
+        Raises:
+            ValueError: If CSV has invalid format
+        """
         clips = []
         required_cols = ['start_sec', 'end_sec', 'type', 'search_query']
 
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+        reader = csv.DictReader(f)
 
-            # Validate headers
-            if not all(col in reader.fieldnames for col in required_cols):
-                raise ValueError(
-                    f"CSV missing required columns. "
-                    f"Required: {required_cols}, Got: {reader.fieldnames}"
-                )
+        # Validate headers
+        if not all(col in (reader.fieldnames or ()) for col in required_cols):
+            raise ValueError(
+                f"CSV missing required columns. "
+                f"Required: {required_cols}, Got: {reader.fieldnames}"
+            )
 
-            for i, row in enumerate(reader, 1):
-                try:
-                    clip = {
-                        "start_time": float(row['start_sec']),
-                        "end_time": float(row['end_sec']),
-                        "type": row['type'].strip().lower(),
-                        "search_query": row['search_query'].strip(),
-                        "fade_in": float(row.get('fade_in', 0.5)),
-                        "fade_out": float(row.get('fade_out', 0.5)),
-                    }
+        for i, row in enumerate(reader, 1):
+            try:
+                clip = {
+                    "start_time": float(row['start_sec']),
+                    "end_time": float(row['end_sec']),
+                    "type": row['type'].strip().lower(),
+                    "search_query": row['search_query'].strip(),
+                    "fade_in": float(row.get('fade_in', 0.5)),
+                    "fade_out": float(row.get('fade_out', 0.5)),
+                }
 
-                    # Validate type
-                    if clip["type"] not in ['pip', 'fullframe']:
-                        raise ValueError(f"Invalid type: {clip['type']} (must be 'pip' or 'fullframe')")
+                # Validate type
+                if clip["type"] not in ['pip', 'fullframe']:
+                    raise ValueError(f"Invalid type: {clip['type']} (must be 'pip' or 'fullframe')")
 
-                    # Validate timing
-                    if clip["end_time"] <= clip["start_time"]:
-                        raise ValueError(f"end_sec must be > start_sec")
+                # Validate timing
+                if clip["end_time"] <= clip["start_time"]:
+                    raise ValueError(f"end_sec must be > start_sec")
 
-                    clips.append(clip)
+                clips.append(clip)
 
-                except (ValueError, KeyError) as e:
-                    raise ValueError(f"Invalid CSV row {i}: {e}")
+            except (ValueError, KeyError) as e:
+                raise ValueError(f"Invalid CSV row {i}: {e}")
 
         return clips
 
@@ -495,17 +516,22 @@ class BRollFetcher:
                 time.sleep(wait_time + 1)  # +1s buffer
 
     def _load_rate_limit_state(self) -> Dict:
-        """Load rate limit state from file."""
+        """Load rate limit state, reading the file only on first use."""
+        if self._rl_cache is not None:
+            return self._rl_cache
+
         try:
             with open(self.rate_limit_file, 'r') as f:
-                return json.load(f)
+                self._rl_cache = json.load(f)
         except (FileNotFoundError, json.JSONDecodeError):
             return {"requests": [], "last_reset": time.time()}
+        return self._rl_cache
 
     def _save_rate_limit_state(self, state: Dict) -> None:
-        """Save rate limit state to file."""
+        """Save rate limit state to file and keep it as the cached state."""
         with open(self.rate_limit_file, 'w') as f:
             json.dump(state, f)
+        self._rl_cache = state
 
     def clear_cache(self) -> None:
         """Clear all cached B-roll videos and metadata."""
@@ -513,4 +539,5 @@ class BRollFetcher:
             for file in self.cache_dir.glob("*"):
                 if file.is_file():
                     file.unlink()
+            self._rl_cache = None
             logger.info(f"Cleared cache: {self.cache_dir}")
@@ -175,7 +175,7 @@ def process(
         audio_dir.mkdir(parents=True, exist_ok=True)
 
         # Stage 1: Audio Extraction
-        click.echo("\n[Stage 1/7] Extracting audio...")
+        print_stage_header(1, 7, "Audio Extraction")
         audio_extractor = AudioExtractor(cfg)
         audio_output = audio_dir / f"{video.stem}.wav"
 
@@ -193,7 +193,7 @@ def process(
             sys.exit(1)
 
         # Stage 2: Force Alignment
-        click.echo("\n[Stage 2/7] Force Alignment")
+        print_stage_header(2, 7, "Force Alignment")
         from src.modules.alignment import ForceAligner
 
         aligner = ForceAligner(cfg)
@@ -215,7 +215,7 @@ def process(
             sys.exit(1)
 
         # Stage 3: Caption Generation
-        click.echo("\n[Stage 3/7] Caption Generation")
+        print_stage_header(3, 7, "Caption Generation")
         from src.modules.captions import CaptionGenerator
 
         caption_generator = CaptionGenerator(cfg)
@@ -242,7 +242,7 @@ def process(
             sys.exit(1)
 
         # Stage 4: Caption Styling
-        click.echo("\n[Stage 4/7] Caption Styling")
+        print_stage_header(4, 7, "Caption Styling")
         from src.modules.styling import CaptionStyler
 
         styler = CaptionStyler(cfg)
@@ -265,7 +265,7 @@ def process(
             sys.exit(1)
 
         # Stage 5: B-roll Integration
-        click.echo("\n[Stage 5/7] B-roll Integration")
+        print_stage_header(5, 7, "B-roll Integration")
 
         # Check for B-roll plan CSV (optional)
         if broll_plan is None:
@@ -301,7 +301,7 @@ def process(
             click.echo("  Skipping B-roll integration (optional)")
 
         # Stage 6: Video Composition
-        click.echo("\n[Stage 6/7] Video Composition")
+        print_stage_header(6, 7, "Video Composition")
         from src.modules.composer import VideoComposer
 
         composer = VideoComposer(cfg)
@@ -352,7 +352,7 @@ def process(
             sys.exit(1)
 
         # Stage 7: Video Encoding
-        click.echo("\n[Stage 7/7] Video Encoding")
+        print_stage_header(7, 7, "Video Encoding")
         from src.modules.encoding import VideoEncoder
 
         encoder = VideoEncoder(cfg)
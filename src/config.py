@@ -223,6 +223,13 @@ class ExportConfig(BaseModel):
     """Export configuration for all platforms."""
 
     platforms: Dict[str, PlatformExportConfig] = Field(default_factory=dict)
+    cascade_encode: bool = Field(
+        default=False,
+        description=(
+            "Scale a rung from the previous rung's output when it is strictly "
+            "smaller with the same aspect ratio"
+        ),
+    )
     naming: Dict[str, str] = Field(
         default_factory=lambda: {"template": "{brand}_{timestamp}_{platform}"}
     )
@@ -293,23 +300,12 @@ class ConfigLoader:
             FileNotFoundError: If config file doesn't exist
             ValueError: If config validation fails
         """
-        import json
-        import yaml
-        from pathlib import Path
+        from src.utils.config_loader import load_config_file
 
         path = Path(config_path)
 
-        if not path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {path}")
-
-        # Load file based on extension
-        with open(path, 'r') as f:
-            if path.suffix in ['.yaml', '.yml']:
-                config_dict = yaml.safe_load(f)
-            elif path.suffix == '.json':
-                config_dict = json.load(f)
-            else:
-                raise ValueError(f"Unsupported config format: {path.suffix}. Use .yaml, .yml, or .json")
+        # Parse based on extension (memoized while the file is unchanged)
+        config_dict = load_config_file(path)
 
         if not config_dict:
             raise ValueError(f"Empty configuration file: {path}")
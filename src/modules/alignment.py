@@ -29,9 +29,8 @@ from src.core.processor import BaseProcessor, ProcessorResult
 from src.utils.text_processing import (
     clean_script_file,
     merge_short_gaps,
-    normalize_for_alignment,
     restore_original_words,
-    split_into_words,
+    tokenize,
     validate_script_format,
 )
 
@@ -115,8 +114,8 @@ class ForceAligner(BaseProcessor):
             logger.info(f"Script length: {len(script_text)} chars")
 
             # Normalize script for alignment
-            normalized_script = normalize_for_alignment(script_text)
-            expected_words = split_into_words(normalized_script)
+            expected_words = tokenize(script_text)
+            normalized_script = ' '.join(expected_words)
             logger.info(f"Expected words: {len(expected_words)}")
 
             # Import forcealign (lazy import in case models not installed)
@@ -90,25 +90,50 @@ class CaptionGenerator(BaseProcessor):
         Raises:
             CaptionError: If caption generation fails
         """
+        logger.info(f"Starting caption generation: {input_path.name}")
+
+        try:
+            words = self._load_alignment(input_path)
+        except CaptionError:
+            raise
+        except Exception as e:
+            logger.error(f"Caption generation failed: {e}")
+            raise CaptionError(f"Caption generation failed: {e}")
+
+        return self.process_words(words, output_path, **kwargs)
+
+    def process_words(
+        self,
+        words: List[Dict],
+        output_path: Path,
+        **kwargs: Any,
+    ) -> ProcessorResult:
+        """
+        Generate SRT caption file from already-loaded word timings.
+
+        Same as ``process`` without reading the alignment JSON, for callers
+        that already hold the words in memory. ``words`` is not modified.
+
+        Args:
+            words: Word timing dicts with "word", "start" and "end" keys
+            output_path: Path for SRT output
+            **kwargs: Same options as ``process``
+
+        Returns:
+            ProcessorResult with SRT file and metadata
+
+        Raises:
+            CaptionError: If words is empty or caption generation fails
+        """
         start_time = time.time()
         words_per_caption = kwargs.get("words_per_caption", 1)
         merge_short_words = kwargs.get("merge_short_words", True)
         min_duration_ms = kwargs.get("min_duration_ms", self.min_duration_ms)
 
-        logger.info(f"Starting caption generation: {input_path.name}")
         logger.info(f"Words per caption: {words_per_caption}")
         logger.info(f"Merge short words: {merge_short_words}")
 
         try:
-            # Load alignment JSON
-            logger.info(f"Loading alignment data from {input_path}")
-            with open(input_path, "r", encoding="utf-8") as f:
-                alignment_data = json.load(f)
-
-            if "words" not in alignment_data:
-                raise CaptionError("Invalid alignment JSON: missing 'words' field")
-
-            words = alignment_data["words"]
             if not words:
                 raise CaptionError("No words found in alignment data")
 
@@ -168,6 +193,28 @@ class CaptionGenerator(BaseProcessor):
             logger.error(f"Caption generation failed: {e}")
             raise CaptionError(f"Caption generation failed: {e}")
 
+    def _load_alignment(self, input_path: Path) -> List[Dict]:
+        """
+        Load word timings from a Stage 2 alignment JSON file.
+
+        Args:
+            input_path: Path to alignment JSON
+
+        Returns:
+            List of word timing dicts
+
+        Raises:
+            CaptionError: If the JSON has no 'words' field
+        """
+        logger.info(f"Loading alignment data from {input_path}")
+        with open(input_path, "r", encoding="utf-8") as f:
+            alignment_data = json.load(f)
+
+        if "words" not in alignment_data:
+            raise CaptionError("Invalid alignment JSON: missing 'words' field")
+
+        return alignment_data["words"]
+
     def _merge_short_words(
         self, words: List[Dict], threshold_ms: float
     ) -> List[Dict]:
@@ -340,22 +387,16 @@ class CaptionGenerator(BaseProcessor):
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            for i, caption in enumerate(captions, start=1):
-                # Caption number
-                f.write(f"{i}\n")
-
-                # Timestamps in SRT format: HH:MM:SS,mmm --> HH:MM:SS,mmm
-                start_time = self._format_srt_time(caption["start"])
-                end_time = self._format_srt_time(caption["end"])
-                f.write(f"{start_time} --> {end_time}\n")
-
-                # Caption text
-                f.write(f"{caption['word']}\n")
+        # Build the whole file in memory and write it with one call;
+        # entries are separated by a blank line (none after the last)
+        entries = []
+        for i, caption in enumerate(captions, start=1):
+            # Timestamps in SRT format: HH:MM:SS,mmm --> HH:MM:SS,mmm
+            start_time = self._format_srt_time(caption["start"])
+            end_time = self._format_srt_time(caption["end"])
+            entries.append(f"{i}\n{start_time} --> {end_time}\n{caption['word']}\n")
 
-                # Blank line separator (except after last caption)
-                if i < len(captions):
-                    f.write("\n")
+        output_path.write_text("\n".join(entries), encoding="utf-8")
 
         logger.info(f"SRT file saved: {output_path}")
 
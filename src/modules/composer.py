@@ -50,6 +50,14 @@ class CompositionError(Exception):
     pass
 
 
+def _file_size(path: Path) -> Optional[int]:
+    """Return a file's size from a single stat call, or None if it can't be stat'ed."""
+    try:
+        return path.stat().st_size
+    except OSError:
+        return None
+
+
 class VideoComposer(BaseProcessor):
     """
     Compose final video with all overlays using FFmpeg filter graphs.
@@ -523,17 +531,19 @@ class VideoComposer(BaseProcessor):
         """
         errors = []
 
-        # Check main video
-        if not input_path.exists():
+        # Check main video (one stat covers existence and size)
+        video_size = _file_size(input_path)
+        if video_size is None:
             errors.append(f"Main video not found: {input_path}")
-        elif input_path.stat().st_size == 0:
+        elif video_size == 0:
             errors.append("Main video file is empty")
 
         # Check captions (if provided)
         if captions_path:
-            if not captions_path.exists():
+            captions_size = _file_size(captions_path)
+            if captions_size is None:
                 errors.append(f"Captions file not found: {captions_path}")
-            elif captions_path.stat().st_size == 0:
+            elif captions_size == 0:
                 errors.append("Captions file is empty")
             elif not captions_path.suffix.lower() == '.ass':
                 errors.append(f"Captions must be ASS format, got: {captions_path.suffix}")
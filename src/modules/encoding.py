@@ -28,12 +28,13 @@ import logging
 import subprocess
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import ffmpeg
 
-from src.config import Config
+from src.config import Config, PlatformExportConfig
 from src.core.processor import BaseProcessor, ProcessorResult
+from src.utils.ffmpeg_utils import run_ffmpeg
 
 logger = logging.getLogger(__name__)
 
@@ -195,6 +196,143 @@ class VideoEncoder(BaseProcessor):
             logger.error(f"Video encoding failed: {e}", exc_info=True)
             raise EncodingError(f"Video encoding failed: {e}")
 
+    @staticmethod
+    def order_rungs(
+        platforms: Dict[str, PlatformExportConfig],
+    ) -> List[Tuple[str, PlatformExportConfig]]:
+        """
+        Order enabled platform rungs from highest to lowest resolution.
+
+        Args:
+            platforms: Platform export configs keyed by platform name
+
+        Returns:
+            List of (platform, config) tuples, largest frame first
+        """
+        enabled = [(name, cfg) for name, cfg in platforms.items() if cfg.enabled]
+        return sorted(
+            enabled,
+            key=lambda item: item[1].resolution[0] * item[1].resolution[1],
+            reverse=True,
+        )
+
+    @staticmethod
+    def _can_cascade(source_res: Tuple[int, int], target_res: Tuple[int, int]) -> bool:
+        """
+        Check whether a rung can be scaled from a previous rung's output.
+
+        Only strict downscales with the same aspect ratio qualify; anything
+        else (equal size, other aspect ratio) would re-encode an already
+        lossy output or distort/crop it again.
+
+        Args:
+            source_res: (width, height) of the previous rung
+            target_res: (width, height) of the rung to encode
+
+        Returns:
+            True if target is strictly smaller with the same aspect ratio
+        """
+        src_w, src_h = source_res
+        dst_w, dst_h = target_res
+        return dst_w < src_w and dst_h < src_h and dst_w * src_h == dst_h * src_w
+
+    def encode_platforms(
+        self,
+        input_path: Path,
+        output_dir: Path,
+        **kwargs: Any,
+    ) -> Dict[str, Path]:
+        """
+        Encode one output per enabled export platform.
+
+        Rungs are encoded largest-first from the source. With
+        ``export.cascade_encode`` enabled (off by default), a rung that is
+        strictly smaller than the previous one and has the same aspect ratio
+        is scaled from the previous rung's output instead, so it decodes a
+        smaller frame; every other rung still encodes from the source.
+
+        Args:
+            input_path: Path to composed video from Stage 6
+            output_dir: Directory for per-platform outputs
+            **kwargs: Additional parameters
+                - audio_bitrate: Audio bitrate override (default: 192k)
+
+        Returns:
+            Dict mapping platform name to encoded output path
+
+        Raises:
+            EncodingError: If any rung fails to encode
+        """
+        audio_bitrate = kwargs.get("audio_bitrate", "192k")
+        cascade = self.config.export.cascade_encode
+
+        outputs: Dict[str, Path] = {}
+        previous: Optional[Tuple[Path, Tuple[int, int]]] = None
+
+        for name, platform_cfg in self.order_rungs(self.config.export.platforms):
+            width, height = platform_cfg.resolution[:2]
+            rung_output = output_dir / f"{input_path.stem}_{name}.mp4"
+
+            source = input_path
+            if cascade and previous and self._can_cascade(previous[1], (width, height)):
+                source = previous[0]
+
+            logger.info(f"Encoding {name} rung at {width}×{height} from {source.name}")
+            try:
+                self._encode_rung(source, rung_output, width, height, platform_cfg, audio_bitrate)
+            except ffmpeg.Error as e:
+                raise EncodingError(
+                    f"Encoding {name} failed: {e.stderr.decode() if e.stderr else str(e)}"
+                )
+
+            outputs[name] = rung_output
+            previous = (rung_output, (width, height))
+
+        return outputs
+
+    def _encode_rung(
+        self,
+        input_path: Path,
+        output_path: Path,
+        width: int,
+        height: int,
+        platform_cfg: PlatformExportConfig,
+        audio_bitrate: str,
+    ) -> None:
+        """
+        Scale and encode a single platform rung.
+
+        Uses VideoToolbox when available, falling back to libx264.
+
+        Raises:
+            ffmpeg.Error: If encoding fails
+        """
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        stream = ffmpeg.input(str(input_path))
+        video = stream.video.filter('scale', width, height)
+
+        if self.videotoolbox_available:
+            settings = self.VIDEOTOOLBOX_SETTINGS.copy()
+            settings["b:v"] = platform_cfg.bitrate
+        else:
+            settings = self.LIBX264_SETTINGS.copy()
+        settings["b:a"] = audio_bitrate
+        settings["r"] = platform_cfg.fps
+
+        output = ffmpeg.output(video, stream.audio, str(output_path), **settings)
+        try:
+            ffmpeg.run(output, overwrite_output=True, capture_stderr=True)
+        except ffmpeg.Error:
+            if not self.videotoolbox_available:
+                raise
+            logger.warning("VideoToolbox rung encoding failed, falling back to libx264")
+            settings = self.LIBX264_SETTINGS.copy()
+            settings["b:a"] = audio_bitrate
+            settings["r"] = platform_cfg.fps
+            output = ffmpeg.output(video, stream.audio, str(output_path), **settings)
+            ffmpeg.run(output, overwrite_output=True, capture_stderr=True)
+
     def _encode_videotoolbox(
         self,
         input_path: Path,
@@ -272,12 +410,7 @@ class VideoEncoder(BaseProcessor):
             True if hevc_videotoolbox encoder is available
         """
         try:
-            result = subprocess.run(
-                ["ffmpeg", "-hide_banner", "-encoders"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
+            result = run_ffmpeg(["-hide_banner", "-encoders"], timeout=5)
             return "hevc_videotoolbox" in result.stdout
         except (subprocess.TimeoutExpired, FileNotFoundError):
             return False
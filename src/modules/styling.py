@@ -30,7 +30,7 @@ import re
 import subprocess
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, TextIO, Union
 
 from src.config import Config
 from src.core.processor import BaseProcessor, ProcessorResult
@@ -114,7 +114,7 @@ class CaptionStyler(BaseProcessor):
 
     def process(
         self,
-        input_path: Path,
+        input_path: Union[Path, TextIO],
         output_path: Path,
         **kwargs: Any,
     ) -> ProcessorResult:
@@ -122,7 +122,8 @@ class CaptionStyler(BaseProcessor):
         Apply ASS styling to SRT captions with TikTok-style word highlighting.
 
         Args:
-            input_path: Path to SRT caption file
+            input_path: Path to SRT caption file, or an open text stream
+                (e.g., ``io.StringIO``) with the SRT content
             output_path: Path for styled ASS output
             **kwargs: Additional parameters
                 - video_width: Video width in pixels (default: 1280)
@@ -142,7 +143,7 @@ class CaptionStyler(BaseProcessor):
         font_size = kwargs.get("font_size", self.font_size)
         alignment_json = kwargs.get("alignment_json", None)
 
-        logger.info(f"Starting caption styling: {input_path.name}")
+        logger.info(f"Starting caption styling: {getattr(input_path, 'name', '<stream>')}")
         logger.info(f"Video resolution: {video_width}×{video_height}")
         logger.info(f"Font: {self.font_family} {font_size}pt")
         if self.enable_word_highlight:
@@ -196,20 +197,36 @@ class CaptionStyler(BaseProcessor):
             logger.error(f"Caption styling failed: {e}")
             raise StylingError(f"Caption styling failed: {e}")
 
-    def _parse_srt(self, srt_path: Path) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _read_srt(srt_source: Union[Path, TextIO]) -> str:
+        """
+        Read SRT text from a file path or an open text stream.
+
+        Args:
+            srt_source: Path to SRT file, or a stream positioned at its start
+
+        Returns:
+            SRT content
+        """
+        if hasattr(srt_source, "read"):
+            return srt_source.read()
+
+        with open(srt_source, "r", encoding="utf-8") as f:
+            return f.read()
+
+    def _parse_srt(self, srt_source: Union[Path, TextIO]) -> List[Dict[str, Any]]:
         """
         Parse SRT file into list of caption dicts.
 
         Args:
-            srt_path: Path to SRT file
+            srt_source: Path to SRT file, or an open text stream
 
         Returns:
             List of caption dicts with start, end, text
         """
         captions = []
 
-        with open(srt_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        content = self._read_srt(srt_source)
 
         # Split by blank lines
         blocks = re.split(r'\n\n+', content.strip())
@@ -524,12 +541,12 @@ class CaptionStyler(BaseProcessor):
 
         return f"{hours}:{minutes:02d}:{secs:02d}.{centisecs:02d}"
 
-    def validate(self, input_path: Path, **kwargs: Any) -> List[str]:
+    def validate(self, input_path: Union[Path, TextIO], **kwargs: Any) -> List[str]:
         """
         Validate SRT caption file before styling.
 
         Args:
-            input_path: Path to SRT file
+            input_path: Path to SRT file, or an open text stream with its content
             **kwargs: Additional parameters
 
         Returns:
@@ -537,20 +554,25 @@ class CaptionStyler(BaseProcessor):
         """
         errors = []
 
-        # Check file exists
-        if not input_path.exists():
-            errors.append(f"Caption file not found: {input_path}")
-            return errors
+        if not hasattr(input_path, "read"):
+            # Check file exists
+            if not input_path.exists():
+                errors.append(f"Caption file not found: {input_path}")
+                return errors
 
-        # Check file is not empty
-        if input_path.stat().st_size == 0:
-            errors.append("Caption file is empty")
-            return errors
+            # Check file is not empty
+            if input_path.stat().st_size == 0:
+                errors.append("Caption file is empty")
+                return errors
 
         # Validate SRT format
         try:
-            with open(input_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            content = self._read_srt(input_path)
+
+            # Streams skip the size check above
+            if not content:
+                errors.append("Caption file is empty")
+                return errors
 
             # Check for timestamp pattern
             if not re.search(r'\d{2}:\d{2}:\d{2},\d{3}\s*-->\s*\d{2}:\d{2}:\d{2},\d{3}', content):
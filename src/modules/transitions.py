@@ -30,6 +30,7 @@ import ffmpeg
 
 from src.config import Config
 from src.core.processor import BaseProcessor, ProcessorResult
+from src.utils.ffmpeg_utils import run_ffmpeg
 
 logger = logging.getLogger(__name__)
 
@@ -318,7 +319,7 @@ class TransitionEngine(BaseProcessor):
                 input_args.extend(['-ss', str(start), '-t', str(duration), '-i', str(source)])
 
             # Build FFmpeg command
-            cmd = ['ffmpeg', '-y']  # -y to overwrite output
+            cmd = ['-y']  # -y to overwrite output
             cmd.extend(input_args)
             cmd.extend([
                 '-filter_complex', filter_complex,
@@ -333,15 +334,10 @@ class TransitionEngine(BaseProcessor):
             ])
 
             logger.info("Executing FFmpeg with xfade transitions...")
-            logger.debug(f"FFmpeg command: {' '.join(cmd)}")
+            logger.debug(f"FFmpeg command: ffmpeg {' '.join(cmd)}")
 
             # Run FFmpeg command
-            import subprocess
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True
-            )
+            result = run_ffmpeg(cmd)
 
             if result.returncode != 0:
                 raise TransitionError(f"FFmpeg failed: {result.stderr}")
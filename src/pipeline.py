@@ -27,7 +27,7 @@ Example:
 """
 
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from src.config import Config
 
@@ -41,22 +41,60 @@ class ProcessingResult:
         outputs: Dictionary mapping platform names to output file paths
         metadata: Processing metadata (duration, file sizes, etc.)
         errors: List of errors encountered during processing
+
+    The containers are allocated on first access, so batch runs that only
+    check ``success`` on many results don't pay for empty dicts and lists.
     """
 
+    __slots__ = ("success", "_outputs", "_metadata", "_errors")
+
     def __init__(
         self,
         success: bool,
         outputs: Optional[Dict[str, Path]] = None,
-        metadata: Optional[Dict[str, any]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
         errors: Optional[List[str]] = None,
     ):
         self.success = success
-        self.outputs = outputs or {}
-        self.metadata = metadata or {}
-        self.errors = errors or []
+        self._outputs = outputs or None
+        self._metadata = metadata or None
+        self._errors = errors or None
+
+    @property
+    def outputs(self) -> Dict[str, Path]:
+        """Output file paths keyed by platform."""
+        if self._outputs is None:
+            self._outputs = {}
+        return self._outputs
+
+    @outputs.setter
+    def outputs(self, value: Dict[str, Path]) -> None:
+        self._outputs = value
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Processing metadata such as timings and stats."""
+        if self._metadata is None:
+            self._metadata = {}
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, value: Dict[str, Any]) -> None:
+        self._metadata = value
+
+    @property
+    def errors(self) -> List[str]:
+        """Error messages collected during processing."""
+        if self._errors is None:
+            self._errors = []
+        return self._errors
+
+    @errors.setter
+    def errors(self, value: List[str]) -> None:
+        self._errors = value
 
     def __repr__(self) -> str:
-        return f"ProcessingResult(success={self.success}, outputs={len(self.outputs)})"
+        return f"ProcessingResult(success={self.success}, outputs={len(self._outputs or ())})"
 
 
 class VideoProcessor:
@@ -205,7 +243,7 @@ class VideoProcessor:
         # Rule of thumb: ~2-3x video duration for complete pipeline
         raise NotImplementedError("Duration estimation not yet implemented")
 
-    def get_progress(self) -> Dict[str, any]:
+    def get_progress(self) -> Dict[str, Any]:
         """
         Get current processing progress.
 
@@ -293,8 +331,9 @@ class BatchProcessor:
         Returns:
             List of ProcessingResult objects for each video
         """
-        # TODO: Find all matching video files
-        # TODO: Match each video with its script
+        # TODO: Find and pair videos with scripts via
+        #       src.utils.cli_helpers.bulk_validate(input_dir), which validates
+        #       the whole directory in a single os.scandir pass
         # TODO: Create worker pool
         # TODO: Process videos in parallel
         # TODO: Aggregate results
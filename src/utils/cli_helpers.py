@@ -10,14 +10,45 @@ Example:
     ...     result = extract_audio(video)
 """
 
+import json
 import logging
+import os
 import time
 from contextlib import contextmanager
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 
+from src.utils.logging import get_progress_logger
+from src.utils.validation import (
+    CONFIG_EXTENSIONS,
+    ERR_NOT_FOUND,
+    ERR_UNSUPPORTED_CONFIG,
+    ERR_UNSUPPORTED_VIDEO,
+    SCRIPT_EXTENSIONS,
+    VIDEO_EXTENSIONS,
+    stat_once,
+)
+
 logger = logging.getLogger(__name__)
 
+# Unsupported-format messages used by validate_inputs ({suffix} is filled in)
+_UNSUPPORTED_VIDEO = (
+    f"{ERR_UNSUPPORTED_VIDEO}: {{suffix}}. "
+    f"Supported formats: {', '.join(VIDEO_EXTENSIONS)}"
+)
+_MISSING_PEXELS_KEY = (
+    "PEXELS_API_KEY not found in environment. "
+    "Set it in .env file or environment variables."
+)
+_UNSUPPORTED_BROLL_PLAN = "B-roll plan must be CSV format, got: {suffix}"
+_UNSUPPORTED_CONFIG = (
+    f"{ERR_UNSUPPORTED_CONFIG}: {{suffix}}. "
+    f"Supported formats: {', '.join(CONFIG_EXTENSIONS)}"
+)
+
+# Preferred script extension when several share a video's basename
+_SCRIPT_PRIORITY = {ext: rank for rank, ext in enumerate(SCRIPT_EXTENSIONS)}
+
 
 @contextmanager
 def stage_timer(stage_name: str, logger_instance: Optional[logging.Logger] = None):
@@ -105,6 +136,30 @@ def safe_stage_execution(
             time.sleep(wait_time)
 
 
+def _check_input(
+    path: Optional[Path],
+    label: str,
+    extensions: Optional[tuple],
+    unsupported: Optional[str],
+    allow_empty: bool,
+    stat_cache: Dict[str, os.stat_result],
+) -> Optional[str]:
+    """Return the first validation error for one input path, if any."""
+    if not path:
+        return None
+    if extensions and path.suffix.lower() not in extensions:
+        return unsupported.format(suffix=path.suffix)
+
+    result = stat_once(path, stat_cache)
+    if isinstance(result, OSError):
+        return f"{label} {ERR_NOT_FOUND}: {path}"
+    size = result.st_size
+
+    if not allow_empty and size == 0:
+        return f"{label} is empty"
+    return None
+
+
 def validate_inputs(
     video_path: Optional[Path] = None,
     script_path: Optional[Path] = None,
@@ -133,54 +188,84 @@ def validate_inputs(
         >>> if errors:
         ...     print("\\n".join(errors))
     """
-    import os
+    # One row per input: (path, label, allowed suffixes, unsupported-format
+    # message, allow empty file). Suffixes are checked before any syscall.
+    checks = (
+        (video_path, "Video file", VIDEO_EXTENSIONS, _UNSUPPORTED_VIDEO, True),
+        (script_path, "Script file", None, None, False),
+        (broll_plan_path, "B-roll plan", ('.csv',), _UNSUPPORTED_BROLL_PLAN, True),
+        (config_path, "Config file", CONFIG_EXTENSIONS, _UNSUPPORTED_CONFIG, True),
+    )
+
+    # Stats are shared within this call only, so later calls see fresh files
+    stat_cache: Dict[str, os.stat_result] = {}
+    # Every check yields an error or None; one pass keeps the errors
+    results = (
+        *(_check_input(*check, stat_cache) for check in checks),
+        _MISSING_PEXELS_KEY if require_pexels_key and not os.getenv('PEXELS_API_KEY') else None,
+    )
+    return [error for error in results if error]
+
+
+def bulk_validate(input_dir: Path) -> Dict[Path, List[str]]:
+    """
+    Validate every video in a directory and its matching script in one pass.
 
-    errors = []
+    Batch mode pairs each video with a script sharing its basename (if
+    several exist, the first extension in ``SCRIPT_EXTENSIONS`` wins). Rather
+    than calling ``validate_inputs`` per video (several stat calls each),
+    this reads the directory once with ``os.scandir`` and validates from
+    the cached directory entries.
 
-    # Check video format
-    if video_path:
-        if not video_path.exists():
-            errors.append(f"Video file not found: {video_path}")
-        elif video_path.suffix.lower() not in ['.mp4', '.mov', '.avi']:
-            errors.append(
-                f"Unsupported video format: {video_path.suffix}. "
-                "Supported formats: .mp4, .mov, .avi"
-            )
+    Args:
+        input_dir: Directory containing videos and scripts
 
-    # Check script not empty
-    if script_path:
-        if not script_path.exists():
-            errors.append(f"Script file not found: {script_path}")
-        elif script_path.stat().st_size == 0:
-            errors.append("Script file is empty")
-
-    # Check B-roll plan format
-    if broll_plan_path:
-        if not broll_plan_path.exists():
-            errors.append(f"B-roll plan not found: {broll_plan_path}")
-        elif broll_plan_path.suffix.lower() != '.csv':
-            errors.append(
-                f"B-roll plan must be CSV format, got: {broll_plan_path.suffix}"
-            )
+    Returns:
+        Dict mapping each video path to its validation errors
+        (empty list if valid)
 
-    # Check config exists
-    if config_path:
-        if not config_path.exists():
-            errors.append(f"Config file not found: {config_path}")
-        elif config_path.suffix.lower() not in ['.yaml', '.yml', '.json']:
+    Example:
+        >>> results = bulk_validate(Path("data/input"))
+        >>> valid = [video for video, errors in results.items() if not errors]
+    """
+    videos: List[os.DirEntry] = []
+    # stem -> (extension priority, script size); scandir order varies by
+    # filesystem, so several scripts for one video are ranked by extension
+    scripts: Dict[str, Tuple[int, int]] = {}
+
+    with os.scandir(input_dir) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            stem, ext = os.path.splitext(entry.name)
+            ext = ext.lower()
+            if ext in VIDEO_EXTENSIONS:
+                videos.append(entry)
+            elif ext in _SCRIPT_PRIORITY:
+                priority = _SCRIPT_PRIORITY[ext]
+                if stem not in scripts or priority < scripts[stem][0]:
+                    scripts[stem] = (priority, entry.stat().st_size)
+
+    results: Dict[Path, List[str]] = {}
+    for entry in sorted(videos, key=lambda e: e.name):
+        errors = []
+        stem = os.path.splitext(entry.name)[0]
+
+        if entry.stat().st_size == 0:
+            errors.append(f"Video file is empty: {entry.name}")
+
+        script = scripts.get(stem)
+        if script is None:
             errors.append(
-                f"Unsupported config format: {config_path.suffix}. "
-                "Supported formats: .yaml, .yml, .json"
+                f"Script file not found for {entry.name} "
+                f"(expected {stem} with one of: {', '.join(SCRIPT_EXTENSIONS)})"
             )
+        elif script[1] == 0:
+            errors.append(f"Script file is empty for {entry.name}")
 
-    # Check Pexels API key
-    if require_pexels_key and not os.getenv('PEXELS_API_KEY'):
-        errors.append(
-            "PEXELS_API_KEY not found in environment. "
-            "Set it in .env file or environment variables."
-        )
+        results[Path(entry.path)] = errors
 
-    return errors
+    return results
 
 
 def format_file_size(size_bytes: int) -> str:
@@ -204,6 +289,32 @@ def format_file_size(size_bytes: int) -> str:
     return f"{size_bytes:.1f} TB"
 
 
+def log_progress_event(event: str, **fields: Any) -> None:
+    """
+    Emit a one-line JSON progress event for machine consumers.
+
+    Events are only serialized when a consumer has attached a handler
+    (e.g. via ``attach_progress_queue``); otherwise this is a no-op.
+
+    Args:
+        event: Event name (e.g., "stage_start", "pipeline_complete")
+        **fields: Additional JSON-serializable event fields
+
+    Example:
+        >>> log_progress_event("stage_start", n=1, of=7, name="Audio Extraction")
+        # {"event":"stage_start","n":1,"of":7,"name":"Audio Extraction"}
+    """
+    progress_logger = get_progress_logger()
+    # Only the default NullHandler attached: nobody reads the event
+    if not progress_logger.isEnabledFor(logging.INFO) or all(
+        isinstance(handler, logging.NullHandler) for handler in progress_logger.handlers
+    ):
+        return
+    progress_logger.info(
+        json.dumps({"event": event, **fields}, separators=(',', ':'), default=str)
+    )
+
+
 def print_stage_header(stage_num: int, total_stages: int, stage_name: str):
     """
     Print formatted stage header.
@@ -218,6 +329,8 @@ def print_stage_header(stage_num: int, total_stages: int, stage_name: str):
         [Stage 1/7] Audio Extraction
     """
     import click
+
+    log_progress_event("stage_start", n=stage_num, of=total_stages, name=stage_name)
     click.echo(f"\n[Stage {stage_num}/{total_stages}] {stage_name}")
 
 
@@ -243,16 +356,31 @@ def print_success_summary(
     """
     import click
 
-    click.echo()
-    click.secho("✓ Pipeline complete - All stages finished!", fg="green", bold=True)
-    click.echo()
-    click.echo(f"Final video: {final_output}")
+    log_progress_event(
+        "pipeline_complete",
+        output=final_output,
+        seconds=round(processing_time, 1),
+        stages=stages_completed,
+    )
+
+    # Assemble the whole block and emit it with one echo: click resolves the
+    # stream, checks for a TTY and strips ANSI codes once instead of per line
+    lines = [
+        "",
+        click.style("✓ Pipeline complete - All stages finished!", fg="green", bold=True),
+        "",
+        f"Final video: {final_output}",
+    ]
 
     if final_output.exists():
         file_size = format_file_size(final_output.stat().st_size)
-        click.echo(f"File size: {file_size}")
+        lines.append(f"File size: {file_size}")
+
+    lines.extend([
+        f"Total processing time: {processing_time:.1f}s ({processing_time/60:.1f}min)",
+        f"Stages completed: {stages_completed}/7",
+        "",
+        click.style(f"🎉 Success! Video ready: {final_output}", fg="green", bold=True),
+    ])
 
-    click.echo(f"Total processing time: {processing_time:.1f}s ({processing_time/60:.1f}min)")
-    click.echo(f"Stages completed: {stages_completed}/7")
-    click.echo()
-    click.secho(f"🎉 Success! Video ready: {final_output}", fg="green", bold=True)
+    click.echo("\n".join(lines))
@@ -6,11 +6,40 @@ Provides RGB ↔ BGR conversion helpers for ASS subtitle format.
 ASS uses BGR (Blue-Green-Red) color format instead of RGB:
 - Format: &H[AA][BB][GG][RR] (alpha, blue, green, red)
 - Example: White = &H00FFFFFF, Black = &H00000000
+
+The conversions are pure and called with a small set of brand/preset
+colors, so results are memoized per input string (``lru_cache``); use
+each function's ``cache_clear()`` to reset.
 """
 
+from functools import lru_cache
 from typing import Tuple, Union
 
+# ASCII byte -> hex digit value; 0xFF marks non-hex characters
+_HEX_NIBBLES = bytearray(b'\xff' * 256)
+for _i, _c in enumerate(b'0123456789abcdef'):
+    _HEX_NIBBLES[_c] = _i
+for _i, _c in enumerate(b'ABCDEF', start=10):
+    _HEX_NIBBLES[_c] = _i
+_HEX_NIBBLES = bytes(_HEX_NIBBLES)
+del _i, _c
+
+# sRGB channel value (0-255) -> linear light, per the WCAG formula
+_SRGB_LINEAR = tuple(
+    c / 255.0 / 12.92 if c / 255.0 <= 0.03928 else ((c / 255.0 + 0.055) / 1.055) ** 2.4
+    for c in range(256)
+)
+
+
+def _hex_nibbles(digits: str) -> bytes:
+    """Map hex digits to their values (0-15); other characters map to 0xFF."""
+    try:
+        return digits.encode('ascii').translate(_HEX_NIBBLES)
+    except UnicodeEncodeError:
+        return b'\xff'
 
+
+@lru_cache(maxsize=512)
 def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
     """
     Convert hex color (#RRGGBB) to RGB tuple.
@@ -29,20 +58,19 @@ def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
     """
     hex_color = hex_color.lstrip('#')
 
-    # Expand short form (#RGB → #RRGGBB)
-    if len(hex_color) == 3:
-        hex_color = ''.join([c * 2 for c in hex_color])
-
-    if len(hex_color) != 6:
+    # Map each character to its digit value in one pass (no int() parsing)
+    n = _hex_nibbles(hex_color)
+    if len(n) not in (3, 6) or max(n) > 15:
         raise ValueError(f"Invalid hex color: #{hex_color}")
 
-    r = int(hex_color[0:2], 16)
-    g = int(hex_color[2:4], 16)
-    b = int(hex_color[4:6], 16)
+    # Expand short form (#RGB → #RRGGBB): 0xF * 17 == 0xFF
+    if len(n) == 3:
+        return (n[0] * 17, n[1] * 17, n[2] * 17)
 
-    return (r, g, b)
+    return ((n[0] << 4) | n[1], (n[2] << 4) | n[3], (n[4] << 4) | n[5])
 
 
+@lru_cache(maxsize=512)
 def rgb_to_hex(r: int, g: int, b: int) -> str:
     """
     Convert RGB values to hex color (#RRGGBB).
@@ -67,6 +95,7 @@ def rgb_to_hex(r: int, g: int, b: int) -> str:
     return f"#{r:02X}{g:02X}{b:02X}"
 
 
+@lru_cache(maxsize=512)
 def hex_to_ass_bgr(hex_color: str, alpha: int = 0) -> str:
     """
     Convert hex color (#RRGGBB) to ASS BGR format (&H00BBGGRR).
@@ -96,9 +125,11 @@ def hex_to_ass_bgr(hex_color: str, alpha: int = 0) -> str:
     if not 0 <= alpha <= 255:
         raise ValueError("Alpha must be in range 0-255")
 
-    return f"&H{alpha:02X}{b:02X}{g:02X}{r:02X}"
+    # Pack as one AABBGGRR integer and format it once
+    return f"&H{(alpha << 24) | (b << 16) | (g << 8) | r:08X}"
 
 
+@lru_cache(maxsize=512)
 def ass_bgr_to_hex(ass_color: str) -> str:
     """
     Convert ASS BGR format (&H00BBGGRR) to hex color (#RRGGBB).
@@ -115,21 +146,26 @@ def ass_bgr_to_hex(ass_color: str) -> str:
         >>> ass_bgr_to_hex("&H000000FF")  # Red
         '#FF0000'
     """
-    # Remove &H prefix
-    ass_color = ass_color.replace('&H', '')
+    # Strip the &H prefix, then require exactly 8 hex digits (AABBGGRR)
+    digits = ass_color[2:] if ass_color.startswith('&H') else ass_color
+    n = _hex_nibbles(digits)
+    if len(n) != 8 or max(n) > 15:
+        raise ValueError(f"Invalid ASS color: &H{digits}")
 
-    if len(ass_color) != 8:
-        raise ValueError(f"Invalid ASS color: &H{ass_color}")
+    value = int(digits, 16)
 
-    # Extract BGR values (skip alpha)
-    alpha = int(ass_color[0:2], 16)
-    b = int(ass_color[2:4], 16)
-    g = int(ass_color[4:6], 16)
-    r = int(ass_color[6:8], 16)
+    # Swap the BB and RR bytes of the low 24 bits (alpha is dropped)
+    rgb = ((value & 0xFF) << 16) | (value & 0xFF00) | ((value >> 16) & 0xFF)
+    return f"#{rgb:06X}"
 
-    return rgb_to_hex(r, g, b)
+
+def _relative_luminance(hex_color: str) -> float:
+    """Calculate relative luminance (WCAG formula) from the sRGB table."""
+    r, g, b = hex_to_rgb(hex_color)
+    return 0.2126 * _SRGB_LINEAR[r] + 0.7152 * _SRGB_LINEAR[g] + 0.0722 * _SRGB_LINEAR[b]
 
 
+@lru_cache(maxsize=512)
 def calculate_contrast_ratio(color1: str, color2: str) -> float:
     """
     Calculate WCAG contrast ratio between two colors.
@@ -151,22 +187,8 @@ def calculate_contrast_ratio(color1: str, color2: str) -> float:
         >>> calculate_contrast_ratio("#FFFFFF", "#FFFFFF")
         1.0
     """
-    def relative_luminance(r: int, g: int, b: int) -> float:
-        """Calculate relative luminance (WCAG formula)."""
-        def adjust(val: int) -> float:
-            val = val / 255.0
-            if val <= 0.03928:
-                return val / 12.92
-            else:
-                return ((val + 0.055) / 1.055) ** 2.4
-
-        return 0.2126 * adjust(r) + 0.7152 * adjust(g) + 0.0722 * adjust(b)
-
-    r1, g1, b1 = hex_to_rgb(color1)
-    r2, g2, b2 = hex_to_rgb(color2)
-
-    l1 = relative_luminance(r1, g1, b1)
-    l2 = relative_luminance(r2, g2, b2)
+    l1 = _relative_luminance(color1)
+    l2 = _relative_luminance(color2)
 
     # Ensure l1 is the lighter color
     if l2 > l1:
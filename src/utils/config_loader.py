@@ -10,14 +10,68 @@ Example:
     >>> print(config.get('pexels_api_key'))
 """
 
+import copy
 import json
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 import logging
 
+from src.utils.json_utils import json_loads
+
 logger = logging.getLogger(__name__)
 
+# Resolved lazily by get_yaml_loader()
+_YAML_LOADER = None
+
+# Environment variables read by _inject_env_vars
+_ENV_KEYS = ('PEXELS_API_KEY', 'WEBHOOK_SECRET', 'LOG_LEVEL')
+
+# One KEY=VALUE assignment per line; comment and blank lines never match.
+# Values wrapped in matching double or single quotes are unquoted.
+_DOTENV_LINE = re.compile(
+    r"""^[ \t]*([^\s=#][^=\n]*?)[ \t]*=[ \t]*"""
+    r"""(?:"([^\n]*)"|'([^\n]*)'|([^\n]*?))[ \t]*$""",
+    re.MULTILINE,
+)
+
+# Structural schema for loaded configs (mirrors create_default_config).
+# Sections stay open to extra keys; only types of known fields are checked.
+CONFIG_SCHEMA: Dict[str, Any] = {
+    'type': 'object',
+    'properties': {
+        'brand': {
+            'type': 'object',
+            'properties': {
+                'name': {'type': 'string', 'minLength': 1},
+                'colors': {'type': 'object', 'additionalProperties': {'type': 'string'}},
+                'fonts': {'type': 'object'},
+            },
+        },
+        'captions': {'type': 'object'},
+        'video': {'type': 'object'},
+        'broll': {
+            'type': 'object',
+            'properties': {'enabled': {'type': 'boolean'}},
+        },
+        'pexels': {
+            'type': 'object',
+            'properties': {'api_key': {'type': 'string'}},
+        },
+        'webhook': {
+            'type': 'object',
+            'properties': {'secret': {'type': 'string'}},
+        },
+        'encoding': {'type': 'object'},
+        'log_level': {'type': 'string'},
+    },
+}
+
+# Compiled lazily by _get_schema_validator()
+_SCHEMA_VALIDATOR: Optional[Callable[[Dict[str, Any]], List[str]]] = None
+
 
 def load_config_with_env(
     config_path: Path,
@@ -43,54 +97,113 @@ def load_config_with_env(
         >>> config = load_config_with_env(Path("config/brand.yaml"))
         >>> api_key = config.get('pexels_api_key')
     """
-    # Load environment variables from .env file
-    if env_file and env_file.exists():
-        load_dotenv(env_file)
-    else:
-        # Try to load from default location
-        default_env = Path('.env')
-        if default_env.exists():
-            load_dotenv(default_env)
+    # Load environment variables from .env file, falling back to the
+    # default location (load_dotenv is a no-op for missing files)
+    if not (env_file and load_dotenv(env_file)):
+        load_dotenv(Path('.env'))
+
+    config = load_config_file(config_path)
+
+    # Inject environment variables
+    config = _inject_env_vars(config)
+
+    # Validate if requested
+    if validate:
+        _validate_config(config)
+
+    logger.debug(f"Loaded configuration from {config_path}")
+    return config
+
+
+def load_config_file(config_path: Path) -> Dict[str, Any]:
+    """
+    Parse a YAML/JSON config file, reusing the parse while it is unchanged.
 
-    # Check if file exists
-    if not config_path.exists():
+    Parses are memoized on (path, mtime, size), so loading the same config
+    repeatedly (validate then process, or many tests) only parses it once.
+
+    Args:
+        config_path: Path to configuration file (JSON/YAML)
+
+    Returns:
+        Fresh copy of the parsed configuration (safe to modify)
+
+    Raises:
+        FileNotFoundError: If config file doesn't exist
+        ValueError: If the file format is unsupported
+
+    Example:
+        >>> raw = load_config_file(Path("config/brand.yaml"))
+    """
+    config_path = Path(config_path)
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-    # Load configuration based on file extension
-    suffix = config_path.suffix.lower()
+    # Copy so env injection and caller mutations never leak into the cache
+    return copy.deepcopy(
+        _parse_config_file(str(config_path.resolve()), stat.st_mtime_ns, stat.st_size)
+    )
+
+
+@lru_cache(maxsize=32)
+def _parse_config_file(resolved_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a config file, memoized by path, mtime and size.
+
+    ``mtime_ns`` and ``size`` are only part of the cache key: editing the
+    file changes them and forces a re-parse.
+    """
+    path = Path(resolved_path)
+    suffix = path.suffix.lower()
 
     if suffix in ['.yaml', '.yml']:
-        config = _load_yaml(config_path)
+        return _load_yaml(path)
     elif suffix == '.json':
-        config = _load_json(config_path)
+        return _load_json(path)
     else:
         raise ValueError(
             f"Unsupported config format: {suffix}. "
             "Supported formats: .yaml, .yml, .json"
         )
 
-    # Inject environment variables
-    config = _inject_env_vars(config)
 
-    # Validate if requested
-    if validate:
-        _validate_config(config)
+def get_yaml_loader() -> Any:
+    """
+    Get the fastest available safe YAML loader class.
 
-    logger.debug(f"Loaded configuration from {config_path}")
-    return config
+    Prefers ``yaml.CSafeLoader`` (libyaml bindings, tokenizes in C) and
+    falls back to the pure-Python ``yaml.SafeLoader``. The choice is made
+    once and cached for the process.
+
+    Returns:
+        YAML loader class for use with ``yaml.load(stream, Loader=...)``
+
+    Raises:
+        ImportError: If PyYAML is not installed
+    """
+    global _YAML_LOADER
+    if _YAML_LOADER is None:
+        import yaml
+        _YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    return _YAML_LOADER
 
 
 def _load_yaml(path: Path) -> Dict[str, Any]:
     """Load YAML configuration file."""
     try:
         import yaml
-        with open(path, 'r') as f:
-            return yaml.safe_load(f) or {}
     except ImportError:
         raise ImportError(
             "PyYAML is required to load YAML configs. "
             "Install it with: pip install pyyaml"
         )
+
+    try:
+        # Binary mode lets libyaml consume the bytes without a Python-side decode
+        with open(path, 'rb') as f:
+            return yaml.load(f, Loader=get_yaml_loader()) or {}
     except yaml.YAMLError as e:
         raise ValueError(f"Invalid YAML in {path}: {e}")
 
@@ -98,13 +211,22 @@ def _load_yaml(path: Path) -> Dict[str, Any]:
 def _load_json(path: Path) -> Dict[str, Any]:
     """Load JSON configuration file."""
     try:
-        with open(path, 'r') as f:
-            return json.load(f)
-    except json.JSONDecodeError as e:
+        # Read bytes so the parser can skip the text decoder
+        return json_loads(path.read_bytes())
+    except ValueError as e:
         raise ValueError(f"Invalid JSON in {path}: {e}")
 
 
-def _inject_env_vars(config: Dict[str, Any]) -> Dict[str, Any]:
+def _env_snapshot() -> Dict[str, str]:
+    """Read the environment variables in ``_ENV_KEYS`` that are set."""
+    environ = os.environ
+    return {key: environ[key] for key in _ENV_KEYS if key in environ}
+
+
+def _inject_env_vars(
+    config: Dict[str, Any],
+    env: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
     """
     Inject environment variables into configuration.
 
@@ -112,34 +234,75 @@ def _inject_env_vars(config: Dict[str, Any]) -> Dict[str, Any]:
     - PEXELS_API_KEY: API key for Pexels B-roll fetching
     - WEBHOOK_SECRET: Secret for webhook authentication
     - LOG_LEVEL: Logging level
+
+    Args:
+        config: Configuration dictionary (modified in place)
+        env: Snapshot from ``_env_snapshot`` (default: read os.environ now)
     """
-    # Inject API keys
-    if 'pexels' not in config:
-        config['pexels'] = {}
+    if env is None:
+        env = _env_snapshot()
 
-    config['pexels']['api_key'] = os.getenv(
-        'PEXELS_API_KEY',
-        config.get('pexels', {}).get('api_key', '')
-    )
+    # Inject API keys
+    pexels = config.setdefault('pexels', {})
+    pexels['api_key'] = env.get('PEXELS_API_KEY', pexels.get('api_key', ''))
 
     # Inject webhook secret
-    if 'webhook' not in config:
-        config['webhook'] = {}
-
-    config['webhook']['secret'] = os.getenv(
-        'WEBHOOK_SECRET',
-        config.get('webhook', {}).get('secret', '')
-    )
+    webhook = config.setdefault('webhook', {})
+    webhook['secret'] = env.get('WEBHOOK_SECRET', webhook.get('secret', ''))
 
     # Inject log level
-    config['log_level'] = os.getenv(
-        'LOG_LEVEL',
-        config.get('log_level', 'INFO')
-    )
+    config['log_level'] = env.get('LOG_LEVEL', config.get('log_level', 'INFO'))
 
     return config
 
 
+def _get_schema_validator() -> Callable[[Dict[str, Any]], List[str]]:
+    """
+    Compile CONFIG_SCHEMA once and return a function listing its errors.
+
+    Uses fastjsonschema (generates a straight-line Python validator) when
+    installed, falling back to jsonschema. If neither is available, schema
+    checks are skipped.
+    """
+    global _SCHEMA_VALIDATOR
+    if _SCHEMA_VALIDATOR is not None:
+        return _SCHEMA_VALIDATOR
+
+    try:
+        import fastjsonschema
+
+        compiled = fastjsonschema.compile(CONFIG_SCHEMA)
+
+        def _validate(config: Dict[str, Any]) -> List[str]:
+            try:
+                compiled(config)
+            except fastjsonschema.JsonSchemaValueException as e:
+                return [e.message]
+            return []
+
+    except ImportError:
+        try:
+            import jsonschema
+
+            validator = jsonschema.Draft7Validator(CONFIG_SCHEMA)
+
+            def _validate(config: Dict[str, Any]) -> List[str]:
+                return [
+                    f"data.{'.'.join(str(p) for p in error.path)} {error.message}"
+                    if error.path else error.message
+                    for error in validator.iter_errors(config)
+                ]
+
+        except ImportError:
+            logger.debug("No JSON Schema library installed, skipping schema validation")
+
+            def _validate(config: Dict[str, Any]) -> List[str]:
+                return []
+
+    _SCHEMA_VALIDATOR = _validate
+    return _SCHEMA_VALIDATOR
+
+
 def _validate_config(config: Dict[str, Any]) -> None:
     """
     Validate configuration has required fields.
@@ -147,7 +310,7 @@ def _validate_config(config: Dict[str, Any]) -> None:
     Raises:
         ValueError: If required fields are missing
     """
-    errors = []
+    errors = _get_schema_validator()(config)
 
     # Check for brand configuration (optional but recommended)
     if 'brand' not in config:
@@ -182,55 +345,57 @@ def _validate_config(config: Dict[str, Any]) -> None:
         )
 
 
-def load_dotenv(env_path: Path) -> None:
+def load_dotenv(env_path: Path) -> bool:
     """
     Load environment variables from .env file.
 
+    The file is opened once; a missing file is a no-op rather than an
+    error, so callers don't need a separate existence check.
+
     Args:
         env_path: Path to .env file
 
+    Returns:
+        True if the file was found and loaded, False if it doesn't exist
+
     Example:
         >>> load_dotenv(Path('.env'))
+        True
     """
     try:
-        from dotenv import load_dotenv as _load_dotenv
-        _load_dotenv(env_path)
-        logger.debug(f"Loaded environment variables from {env_path}")
-    except ImportError:
-        logger.warning(
-            "python-dotenv not installed. Install with: pip install python-dotenv"
-        )
-        # Fallback: manual parsing
-        _manual_load_dotenv(env_path)
-
-
-def _manual_load_dotenv(env_path: Path) -> None:
-    """Manually parse and load .env file without python-dotenv."""
-    if not env_path.exists():
-        return
-
-    with open(env_path, 'r') as f:
-        for line in f:
-            line = line.strip()
-            # Skip comments and empty lines
-            if not line or line.startswith('#'):
-                continue
-
-            # Parse KEY=VALUE
-            if '=' in line:
-                key, value = line.split('=', 1)
-                key = key.strip()
-                value = value.strip()
-
-                # Remove quotes
-                if value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1]
-                elif value.startswith("'") and value.endswith("'"):
-                    value = value[1:-1]
-
-                # Set environment variable (don't override existing)
-                if key not in os.environ:
-                    os.environ[key] = value
+        env_file = open(env_path, 'r')
+    except FileNotFoundError:
+        return False
+
+    with env_file:
+        try:
+            from dotenv import load_dotenv as _load_dotenv
+        except ImportError:
+            logger.warning(
+                "python-dotenv not installed. Install with: pip install python-dotenv"
+            )
+            # Fallback: manual parsing
+            _apply_dotenv_text(env_file.read())
+            return True
+
+        _load_dotenv(stream=env_file)
+
+    logger.debug(f"Loaded environment variables from {env_path}")
+    return True
+
+
+def _apply_dotenv_text(text: str) -> None:
+    """Set variables from .env file contents, keeping existing ones."""
+    for match in _DOTENV_LINE.finditer(text):
+        key = match.group(1)
+        value = match.group(2)
+        if value is None:
+            value = match.group(3)
+        if value is None:
+            value = match.group(4)
+
+        # Set environment variable (don't override existing)
+        os.environ.setdefault(key, value)
 
 
 def create_default_config(output_path: Path, format: str = 'yaml') -> None:
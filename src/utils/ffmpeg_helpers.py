@@ -16,11 +16,32 @@ Example:
     >>> fade_in = build_fade(stream, "in", start=0, duration=0.5)
 """
 
+from __future__ import annotations
+
 import platform
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+# ffmpeg-python is only needed for annotations at import time; functions that
+# call into it import it lazily so path/escaping helpers stay cheap to import
+if TYPE_CHECKING:
+    import ffmpeg
+
+from src.utils.ffmpeg_utils import run_ffmpeg
+from src.utils.json_utils import json_loads
 
-import ffmpeg
+# Resolved once; the host OS doesn't change during a run
+_IS_WINDOWS = platform.system() == "Windows"
+
+# Fields requested from ffprobe by probe_video_info
+_PROBE_ENTRIES = (
+    'format=duration,bit_rate:'
+    'stream=codec_type,codec_name,width,height,r_frame_rate'
+)
+
+# Filter path escaping as single-pass translation tables
+_WINDOWS_PATH_ESCAPES = str.maketrans({'\\': '\\\\', ':': '\\:'})
+_UNIX_PATH_ESCAPES = str.maketrans({':': '\\:'})
 
 
 def escape_filter_path(path: Path) -> str:
@@ -43,16 +64,12 @@ def escape_filter_path(path: Path) -> str:
         >>> escape_filter_path(Path("/home/user/captions.ass"))
         '/home/user/captions.ass'
     """
-    path_str = str(path)
-
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         # Windows paths need both backslash and colon escaping
-        path_str = path_str.replace('\\', '\\\\').replace(':', '\\:')
-    else:
-        # Unix paths just need colon escaping
-        path_str = path_str.replace(':', '\\:')
+        return str(path).translate(_WINDOWS_PATH_ESCAPES)
 
-    return path_str
+    # Unix paths just need colon escaping
+    return str(path).translate(_UNIX_PATH_ESCAPES)
 
 
 def build_scale_filter(
@@ -275,12 +292,13 @@ def build_crossfade_transition(
     )
 
 
-def probe_video_info(video_path: Path) -> Dict[str, Any]:
+def probe_video_info(video_path: Path, timeout: Optional[float] = None) -> Dict[str, Any]:
     """
     Extract video information using ffprobe.
 
     Args:
         video_path: Path to video file
+        timeout: Optional timeout in seconds for the ffprobe call
 
     Returns:
         Dict with video metadata:
@@ -291,11 +309,35 @@ def probe_video_info(video_path: Path) -> Dict[str, Any]:
             - codec: Video codec name
             - bitrate: Video bitrate in bps
 
+    Raises:
+        ffmpeg.Error: If ffprobe fails to read the file
+        subprocess.TimeoutExpired: If timeout is exceeded
+
     Example:
         >>> info = probe_video_info(Path("video.mp4"))
         >>> print(f"Duration: {info['duration']}s, Resolution: {info['width']}x{info['height']}")
     """
-    probe = ffmpeg.probe(str(video_path))
+    # Ask ffprobe for just the fields read below (first video stream only),
+    # so tags and side data for long videos are never emitted or parsed
+    result = run_ffmpeg(
+        [
+            '-v', 'error',
+            '-select_streams', 'v:0',
+            '-show_entries', _PROBE_ENTRIES,
+            '-of', 'json',
+            str(video_path),
+        ],
+        text=False,
+        timeout=timeout,
+        binary='ffprobe',
+    )
+    if result.returncode != 0:
+        import ffmpeg
+
+        # Same error type ffmpeg.probe() raises, so callers can keep catching it
+        raise ffmpeg.Error('ffprobe', result.stdout, result.stderr)
+
+    probe = json_loads(result.stdout)
 
     # Find video stream
     video_stream = next(
@@ -311,12 +353,33 @@ def probe_video_info(video_path: Path) -> Dict[str, Any]:
         'duration': float(probe['format']['duration']),
         'width': int(video_stream['width']),
         'height': int(video_stream['height']),
-        'fps': eval(video_stream['r_frame_rate']),  # Evaluate fraction like "30/1"
+        'fps': parse_frame_rate(video_stream['r_frame_rate']),
         'codec': video_stream['codec_name'],
         'bitrate': int(probe['format'].get('bit_rate', 0)),
     }
 
 
+def parse_frame_rate(rate: str) -> float:
+    """
+    Parse an ffprobe frame rate fraction (e.g. "30000/1001") to a float.
+
+    Args:
+        rate: Frame rate as "num/den" or a plain number
+
+    Returns:
+        Frames per second (0.0 if the denominator is zero)
+
+    Example:
+        >>> parse_frame_rate("30/1")
+        30.0
+    """
+    num, _, den = rate.partition('/')
+    if not den:
+        return float(num)
+    den_value = float(den)
+    return float(num) / den_value if den_value else 0.0
+
+
 def validate_ffmpeg_installed() -> bool:
     """
     Check if FFmpeg is installed and accessible.
@@ -328,6 +391,8 @@ def validate_ffmpeg_installed() -> bool:
         >>> if not validate_ffmpeg_installed():
         ...     print("Please install FFmpeg")
     """
+    import ffmpeg
+
     try:
         ffmpeg.probe('test')
         return True
@@ -2,16 +2,82 @@
 FFmpeg Utility Functions
 
 Wrappers for common FFmpeg operations using ffmpeg-python library.
+
+Process spawning:
+    ``run_ffmpeg`` resolves the ffmpeg binary to an absolute path once per
+    process and launches it with ``close_fds=False``. Together these let
+    CPython use ``posix_spawn`` instead of fork+exec on Linux, which avoids
+    copying the parent's page tables for every ffmpeg invocation.
+
+Example:
+    >>> from src.utils.ffmpeg_utils import run_ffmpeg
+    >>> result = run_ffmpeg(["-i", "input.mp4", "-vn", "audio.wav"])
+    >>> result.returncode
+    0
 """
 
+import shutil
+import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 
-def run_ffmpeg(command: List[str], **kwargs: Any) -> None:
-    """Execute FFmpeg command."""
-    # TODO: Run FFmpeg with error handling
-    raise NotImplementedError()
+@lru_cache(maxsize=None)
+def resolve_binary(name: str) -> str:
+    """
+    Resolve an executable name to an absolute path (cached per process).
+
+    ``posix_spawn`` is only used by ``subprocess`` when the executable has a
+    directory component, so bare names like ``"ffmpeg"`` are resolved here.
+
+    Args:
+        name: Executable name (e.g., "ffmpeg", "ffprobe")
+
+    Returns:
+        Absolute path to the executable, or ``name`` unchanged if it is not
+        on PATH (so the eventual FileNotFoundError names the right binary)
+    """
+    return shutil.which(name) or name
+
+
+def run_ffmpeg(
+    command: List[str],
+    capture_output: bool = True,
+    text: bool = True,
+    timeout: Optional[float] = None,
+    binary: str = "ffmpeg",
+    **kwargs: Any,
+) -> subprocess.CompletedProcess:
+    """
+    Execute FFmpeg command.
+
+    Args:
+        command: Arguments passed to ffmpeg (without the binary itself)
+        capture_output: Capture stdout/stderr (default: True)
+        text: Decode output as text (default: True)
+        timeout: Optional timeout in seconds
+        binary: Executable to run (default: "ffmpeg", e.g. "ffprobe")
+        **kwargs: Extra keyword arguments for ``subprocess.run``
+
+    Returns:
+        CompletedProcess with returncode, stdout and stderr
+
+    Raises:
+        FileNotFoundError: If the binary is not installed
+        subprocess.TimeoutExpired: If timeout is exceeded
+    """
+    # stdin is never needed; DEVNULL keeps ffmpeg from waiting on a TTY
+    kwargs.setdefault("stdin", subprocess.DEVNULL)
+    kwargs.setdefault("close_fds", False)
+
+    return subprocess.run(
+        [resolve_binary(binary), *command],
+        capture_output=capture_output,
+        text=text,
+        timeout=timeout,
+        **kwargs,
+    )
 
 
 def probe_video(video_path: Path) -> Dict[str, Any]:
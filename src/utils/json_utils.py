@@ -0,0 +1,69 @@
+"""
+Fast JSON Helpers
+
+Byte-oriented JSON parse/serialize helpers that use the fastest available
+backend: orjson, then pysimdjson (parsing only), then the stdlib.
+
+The backend is picked once at import time, so a missing optional package
+costs nothing per call. Install orjson with ``pip install -e ".[fast]"``.
+
+Example:
+    >>> from src.utils.json_utils import json_loads
+    >>> data = json_loads(Path("config.json").read_bytes())
+"""
+
+import json
+from typing import Any, Callable
+
+_loads: Callable[[Any], Any]
+_dumps: Callable[[Any], bytes]
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    try:
+        import simdjson
+
+        _loads = simdjson.loads
+    except ImportError:
+        _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def json_loads(data: bytes) -> Any:
+    """
+    Parse JSON bytes with the fastest available parser.
+
+    Uses orjson, then pysimdjson (both SIMD-accelerated), then stdlib json.
+
+    Args:
+        data: JSON document as bytes (or str)
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        ValueError: If the data is not valid JSON
+    """
+    return _loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """
+    Serialize to compact JSON bytes with orjson when installed, else stdlib json.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        UTF-8 encoded JSON
+
+    Raises:
+        TypeError: If obj is not JSON-serializable
+    """
+    return _dumps(obj)
@@ -10,10 +10,19 @@ Example:
     >>> logger.info("Processing started")
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional, TextIO
+
+# Logger for one-line JSON progress events (see cli_helpers.log_progress_event)
+PROGRESS_LOGGER_NAME = "src.progress"
+
+# Background thread writing the log file (see setup_logging)
+_file_listener: Optional[QueueListener] = None
 
 
 class ColoredFormatter(logging.Formatter):
@@ -32,12 +41,20 @@ class ColoredFormatter(logging.Formatter):
 
     def format(self, record):
         """Format log record with colors."""
-        if record.levelname in self.COLORS:
-            record.levelname = (
-                f"{self.COLORS[record.levelname]}{self.BOLD}"
-                f"{record.levelname:8s}{self.RESET}"
-            )
-        return super().format(record)
+        levelname = record.levelname
+        record.levelname = self.COLORED_LEVELNAMES.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            # Restore so other handlers (e.g. the log file) see the plain name
+            record.levelname = levelname
+
+
+# Colored level names, built once instead of per record
+ColoredFormatter.COLORED_LEVELNAMES = {
+    level: f"{color}{ColoredFormatter.BOLD}{level:8s}{ColoredFormatter.RESET}"
+    for level, color in ColoredFormatter.COLORS.items()
+}
 
 
 def _suppress_noisy_loggers(verbose: bool = False) -> None:
@@ -70,6 +87,18 @@ def _suppress_noisy_loggers(verbose: bool = False) -> None:
             logging.getLogger(logger_name).setLevel(logging.WARNING)
 
 
+def _stop_file_listener() -> None:
+    """Flush queued file log records and stop the writer thread."""
+    global _file_listener
+    if _file_listener is not None:
+        _file_listener.stop()
+        _file_listener.handlers[0].close()
+        _file_listener = None
+
+
+atexit.register(_stop_file_listener)
+
+
 def setup_logging(
     level: str = "INFO",
     log_file: Optional[Path] = None,
@@ -104,6 +133,7 @@ def setup_logging(
 
     # Clear existing handlers
     logger.handlers.clear()
+    _stop_file_listener()
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -143,6 +173,70 @@ def setup_logging(
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+
+        # Write the file from a background thread so DEBUG records emitted
+        # in hot loops don't block the pipeline on disk I/O
+        global _file_listener
+        log_queue = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setLevel(logging.DEBUG)
+        logger.addHandler(queue_handler)
+
+        _file_listener = QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        _file_listener.start()
 
     return logger
+
+
+def get_progress_logger() -> logging.Logger:
+    """
+    Get the structured progress event logger.
+
+    The logger doesn't propagate to the root logger, so JSON events never
+    mix with human-readable console logs. Events are discarded until a
+    consumer attaches a handler (e.g. via ``attach_progress_queue``).
+
+    Returns:
+        Progress logger instance
+    """
+    progress_logger = logging.getLogger(PROGRESS_LOGGER_NAME)
+    if not progress_logger.handlers:
+        progress_logger.addHandler(logging.NullHandler())
+    progress_logger.setLevel(logging.INFO)
+    progress_logger.propagate = False
+    return progress_logger
+
+
+def attach_progress_queue(queue: Any) -> None:
+    """
+    Route this process's progress events into a shared queue.
+
+    Call in each batch worker so events reach the parent through one
+    queue instead of several processes writing to stdout concurrently.
+
+    Args:
+        queue: Queue shared with the parent (e.g. multiprocessing.Queue)
+    """
+    progress_logger = get_progress_logger()
+    progress_logger.handlers = [QueueHandler(queue)]
+
+
+def start_progress_listener(queue: Any, stream: Optional[TextIO] = None) -> QueueListener:
+    """
+    Start a listener that writes queued progress events as JSON lines.
+
+    Args:
+        queue: Queue that workers attached with ``attach_progress_queue``
+        stream: Output stream (default: stdout)
+
+    Returns:
+        Started QueueListener; call ``stop()`` once workers finish
+    """
+    handler = logging.StreamHandler(stream or sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+
+    listener = QueueListener(queue, handler)
+    listener.start()
+    return listener
@@ -0,0 +1,182 @@
+"""
+Stage Output Cache
+
+Content-addressed disk cache for deterministic pipeline stages
+(alignment, captions, styling).
+
+A cache key is a digest of the stage's input files plus the config
+fragment that affects its output. On a hit, cached outputs are copied
+back into place instead of re-running the stage, which makes iterating on
+brand configs much cheaper.
+
+Entries are always copies, never hard links: a stage that later rewrites
+its output in place must not be able to change an older cached entry.
+
+Hashing uses BLAKE3 when the optional ``blake3`` package is installed and
+falls back to SHA-256 otherwise.
+
+Example:
+    >>> from src.utils.stage_cache import StageCache, cache_key
+    >>> cache = StageCache(Path("data/temp/cache"))
+    >>> key = cache_key([audio_path, script_path], {"gap_threshold_ms": 50})
+    >>> if cache.is_hit("alignment", key):
+    ...     cache.restore("alignment", key, alignment_dir)
+    ... else:
+    ...     result = aligner.process(audio_path, alignment_output, script_path)
+    ...     cache.store("alignment", key, [alignment_output])
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Read input files in 1 MB chunks to keep memory flat for large videos
+CHUNK_SIZE = 1 << 20
+
+
+def _new_hasher() -> Any:
+    """Return a BLAKE3 hasher if available, otherwise SHA-256."""
+    try:
+        from blake3 import blake3
+        return blake3()
+    except ImportError:
+        return hashlib.sha256()
+
+
+def cache_key(inputs: List[Path], config_fragment: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Compute a content digest for a stage's inputs and config.
+
+    Args:
+        inputs: Input files that the stage reads
+        config_fragment: Config values that affect the stage's output
+
+    Returns:
+        Hex digest identifying this exact combination of inputs
+
+    Raises:
+        FileNotFoundError: If an input file doesn't exist
+    """
+    hasher = _new_hasher()
+
+    for path in inputs:
+        with open(path, 'rb') as f:
+            while chunk := f.read(CHUNK_SIZE):
+                hasher.update(chunk)
+        # Separator so (a+b, c) and (a, b+c) hash differently
+        hasher.update(b'\0')
+
+    config_bytes = json.dumps(
+        config_fragment or {}, sort_keys=True, default=str
+    ).encode('utf-8')
+    hasher.update(config_bytes)
+
+    return hasher.hexdigest()
+
+
+def _copy_replace(src: Path, dst: Path) -> None:
+    """
+    Copy src to dst through a temp file and ``os.replace``.
+
+    dst always ends up as a new, independent file, so it never shares an
+    inode with src and readers never see a half-written dst.
+    """
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dst.with_name(f".{dst.name}.{os.getpid()}.tmp")
+    try:
+        shutil.copy2(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+class StageCache:
+    """
+    Disk cache of stage outputs keyed by ``cache_key`` digests.
+
+    Layout:
+        {cache_dir}/{stage}_{key}.ok   - Marker listing cached file names
+        {cache_dir}/{stage}_{key}/     - Copies of the cached outputs
+
+    Args:
+        cache_dir: Directory to store cached outputs
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+
+    def _marker_path(self, stage: str, key: str) -> Path:
+        return self.cache_dir / f"{stage}_{key}.ok"
+
+    def _entry_dir(self, stage: str, key: str) -> Path:
+        return self.cache_dir / f"{stage}_{key}"
+
+    def is_hit(self, stage: str, key: str) -> bool:
+        """
+        Check whether outputs for this stage and key are cached.
+
+        Args:
+            stage: Stage name (e.g., "alignment")
+            key: Digest from ``cache_key``
+
+        Returns:
+            True if a complete cache entry exists
+        """
+        return self._marker_path(stage, key).exists()
+
+    def store(self, stage: str, key: str, outputs: List[Path]) -> None:
+        """
+        Cache a stage's outputs.
+
+        The marker is written last so an interrupted store never
+        produces a false hit.
+
+        Args:
+            stage: Stage name
+            key: Digest from ``cache_key``
+            outputs: Output files produced by the stage
+        """
+        entry_dir = self._entry_dir(stage, key)
+        for output in outputs:
+            _copy_replace(Path(output), entry_dir / Path(output).name)
+
+        names = [Path(output).name for output in outputs]
+        self._marker_path(stage, key).write_text("\n".join(names), encoding="utf-8")
+        logger.debug(f"Cached {len(names)} output(s) for {stage} ({key[:12]})")
+
+    def restore(self, stage: str, key: str, output_dir: Path) -> List[Path]:
+        """
+        Copy cached outputs into an output directory.
+
+        Existing files at the destination are replaced rather than written
+        through, so the cache entry stays intact.
+
+        Args:
+            stage: Stage name
+            key: Digest from ``cache_key``
+            output_dir: Directory to place restored outputs in
+
+        Returns:
+            Paths of restored output files
+
+        Raises:
+            FileNotFoundError: If the entry is not cached
+        """
+        names = self._marker_path(stage, key).read_text(encoding="utf-8").splitlines()
+        entry_dir = self._entry_dir(stage, key)
+
+        restored = []
+        for name in names:
+            target = Path(output_dir) / name
+            _copy_replace(entry_dir / name, target)
+            restored.append(target)
+
+        logger.info(f"Cache hit for {stage} ({key[:12]}), skipping stage")
+        return restored
@@ -13,45 +13,82 @@ Example:
 """
 
 import re
+from array import array
 from typing import List, Tuple
 
+# Patterns compiled once at import instead of per call
+_RE_BRACKETS = re.compile(r'\[.*?\]')
+_RE_PARENS = re.compile(r'\(.*?\)')
+_RE_NEWLINES = re.compile(r'\n+')
+# Runs of alphanumerics ([^\W_] is \w minus underscore) or whitespace;
+# what's left after removing them are the "special" characters
+_RE_ALNUM_OR_SPACE = re.compile(r'[^\W_]+|\s+')
 
-def normalize_for_alignment(text: str, preserve_case: bool = False) -> str:
+# Transcripts at least this long use the NumPy gap merge; below it, the
+# per-call array setup costs more than the Python loop
+_NUMPY_MIN_WORDS = 1000
+
+# Single-character cleanup done in one str.translate pass:
+# quotes are dropped, sentence punctuation becomes a space
+_PUNCT_TABLE = str.maketrans({
+    **dict.fromkeys('"«»', None),
+    **dict.fromkeys('.,!?:;…', ' '),
+})
+
+
+def tokenize(text: str, lower: bool = True) -> List[str]:
     """
-    Normalize text for forced alignment.
+    Normalize text for forced alignment and split it into words in one pass.
 
-    Removes brackets, parentheses, and most punctuation while preserving
-    apostrophes and hyphens which are important for word boundaries.
+    Equivalent to ``split_into_words(normalize_for_alignment(text))`` but
+    skips building the intermediate whitespace-joined string.
 
     Args:
         text: Raw script text
-        preserve_case: If True, keep original case (default: lowercase)
+        lower: If True (default), lowercase the words
 
     Returns:
-        Normalized text suitable for alignment
+        List of normalized words
 
     Example:
-        >>> normalize_for_alignment("Don't use [brackets] or (parens)!")
-        "don't use  or"
+        >>> tokenize("Don't use [brackets] or (parens)!")
+        ["don't", 'use', 'or']
     """
     # Remove content in brackets and parentheses
-    text = re.sub(r'\[.*?\]', '', text)
-    text = re.sub(r'\(.*?\)', '', text)
+    text = _RE_BRACKETS.sub('', text)
+    text = _RE_PARENS.sub('', text)
 
     # Remove special punctuation but keep apostrophes and hyphens
     # Keep: apostrophes ('), hyphens (-)
     # Remove: . , ! ? : ; " « » etc.
-    text = re.sub(r'["""«»]', '', text)  # Smart quotes
-    text = re.sub(r'[.,!?:;…]', ' ', text)  # Sentence punctuation
+    text = text.translate(_PUNCT_TABLE)
 
-    # Convert to lowercase unless preserving case
-    if not preserve_case:
+    if lower:
         text = text.lower()
 
-    # Normalize whitespace
-    text = ' '.join(text.split())
+    return text.split()
 
-    return text
+
+def normalize_for_alignment(text: str, preserve_case: bool = False) -> str:
+    """
+    Normalize text for forced alignment.
+
+    Removes brackets, parentheses, and most punctuation while preserving
+    apostrophes and hyphens which are important for word boundaries.
+
+    Args:
+        text: Raw script text
+        preserve_case: If True, keep original case (default: lowercase)
+
+    Returns:
+        Normalized text suitable for alignment
+
+    Example:
+        >>> normalize_for_alignment("Don't use [brackets] or (parens)!")
+        "don't use or"
+    """
+    # Joining the words also normalizes whitespace
+    return ' '.join(tokenize(text, lower=not preserve_case))
 
 
 def split_into_words(text: str) -> List[str]:
@@ -89,22 +126,15 @@ def restore_original_words(aligned_words: List[str], original_text: str) -> List
         ['Hello', 'World']
     """
     # Normalize original for matching
-    normalized_original = normalize_for_alignment(original_text, preserve_case=True)
-    original_words = split_into_words(normalized_original)
+    original_words = tokenize(original_text, lower=False)
 
-    # Create mapping from lowercase to original
+    # Create mapping from lowercase to original (first occurrence wins)
     word_map = {}
     for word in original_words:
-        key = word.lower()
-        if key not in word_map:
-            word_map[key] = word
+        word_map.setdefault(word.lower(), word)
 
-    # Restore capitalization
-    restored = []
-    for word in aligned_words:
-        restored.append(word_map.get(word.lower(), word))
-
-    return restored
+    # Restore capitalization (aligners may return upper- or lowercase words)
+    return [word_map.get(word.lower(), word) for word in aligned_words]
 
 
 def validate_script_format(text: str) -> Tuple[bool, List[str]]:
@@ -136,8 +166,7 @@ def validate_script_format(text: str) -> Tuple[bool, List[str]]:
         return False, errors
 
     # Normalize and count words
-    normalized = normalize_for_alignment(text)
-    words = split_into_words(normalized)
+    words = tokenize(text)
 
     if len(words) == 0:
         errors.append("Script contains no words")
@@ -146,7 +175,8 @@ def validate_script_format(text: str) -> Tuple[bool, List[str]]:
         errors.append(f"Script too short: {len(words)} words (minimum 5)")
 
     # Check for excessive special characters
-    special_char_ratio = sum(1 for c in text if not c.isalnum() and not c.isspace()) / len(text)
+    special_chars = len(_RE_ALNUM_OR_SPACE.sub('', text))
+    special_char_ratio = special_chars / len(text)
     if special_char_ratio > 0.3:
         errors.append(f"Too many special characters: {special_char_ratio:.1%}")
 
@@ -177,7 +207,7 @@ def clean_script_file(file_path: str) -> str:
         text = f.read()
 
     # Replace multiple newlines with single space
-    text = re.sub(r'\n+', ' ', text)
+    text = _RE_NEWLINES.sub(' ', text)
 
     # Remove leading/trailing whitespace
     text = text.strip()
@@ -200,7 +230,8 @@ def merge_short_gaps(
         gap_threshold_ms: Merge if gap < this (milliseconds)
 
     Returns:
-        Smoothed word timings
+        Smoothed word timings. Words whose end time is unchanged are the
+        same dict objects as in the input; merged words are new dicts.
 
     Example:
         >>> timings = [
@@ -215,18 +246,43 @@ def merge_short_gaps(
         return []
 
     threshold_sec = gap_threshold_ms / 1000.0
-    smoothed = [word_timings[0].copy()]
 
-    for i in range(1, len(word_timings)):
-        prev = smoothed[-1]
-        curr = word_timings[i].copy()
+    if len(word_timings) >= _NUMPY_MIN_WORDS:
+        ends = _merge_gaps_numpy(word_timings, threshold_sec)
+    else:
+        # Scan timings as two contiguous float arrays instead of copying every dict
+        starts = array('d', [w['start'] for w in word_timings])
+        ends = array('d', [w['end'] for w in word_timings])
+
+        for i in range(1, len(word_timings)):
+            if starts[i] - ends[i - 1] < threshold_sec:
+                # Merge gap - extend previous word to touch current
+                ends[i - 1] = starts[i]
+
+    # Only words whose end moved get a new dict; the input is never mutated
+    return [
+        word if word['end'] == end else {**word, 'end': end}
+        for word, end in zip(word_timings, ends)
+    ]
 
-        gap = curr['start'] - prev['end']
 
-        if gap < threshold_sec:
-            # Merge gap - extend previous word to touch current
-            prev['end'] = curr['start']
+def _merge_gaps_numpy(word_timings: List[dict], threshold_sec: float) -> List[float]:
+    """
+    Vectorized gap merge for long transcripts.
+
+    Each gap only depends on the original end of the previous word, so all
+    gaps can be computed and clamped in one array operation.
+
+    Returns:
+        Merged end times, one per word
+    """
+    import numpy as np
+
+    n = len(word_timings)
+    starts = np.fromiter((w['start'] for w in word_timings), dtype=np.float64, count=n)
+    ends = np.fromiter((w['end'] for w in word_timings), dtype=np.float64, count=n)
 
-        smoothed.append(curr)
+    gaps = starts[1:] - ends[:-1]
+    ends[:-1] = np.where(gaps < threshold_sec, starts[1:], ends[:-1])
 
-    return smoothed
+    return ends.tolist()
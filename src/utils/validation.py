@@ -2,31 +2,274 @@
 Input Validation Utilities
 
 Helper functions for validating video, audio, script, and config files.
+
+Each validator rejects unsupported extensions before touching the
+filesystem, then checks existence, file type and size with a single
+``os.stat`` call rather than separate exists/is_file/stat lookups.
+
+``stat_once`` can reuse successful stat results through a caller-owned
+dict, so one validation pass costs one syscall per path without keeping
+stale results (or "not found" answers) around between passes.
+
+Example:
+    >>> from src.utils.validation import validate_video
+    >>> errors = validate_video(Path("video.mp4"))
+    >>> if errors:
+    ...     print("\\n".join(errors))
 """
 
+import os
+import stat
+import wave
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from src.utils.ffmpeg_helpers import probe_video_info
+
+# Supported input formats (ordered for error messages)
+VIDEO_EXTENSIONS = ('.mp4', '.mov', '.avi')
+SCRIPT_EXTENSIONS = ('.txt', '.json', '.csv')
+AUDIO_EXTENSIONS = ('.wav',)
+CONFIG_EXTENSIONS = ('.yaml', '.yml', '.json')
+
+# Set forms for the suffix checks done before any filesystem access
+_VIDEO_EXTS = frozenset(VIDEO_EXTENSIONS)
+_SCRIPT_EXTS = frozenset(SCRIPT_EXTENSIONS)
+_AUDIO_EXTS = frozenset(AUDIO_EXTENSIONS)
+
+# Shared message fragments (also used by cli_helpers and the tests)
+ERR_NOT_FOUND = "not found"
+ERR_UNSUPPORTED_VIDEO = "Unsupported video format"
+ERR_UNSUPPORTED_SCRIPT = "Unsupported script format"
+ERR_UNSUPPORTED_AUDIO = "Unsupported audio format"
+ERR_UNSUPPORTED_CONFIG = "Unsupported config format"
+
+# Leading atom types of MP4/QuickTime files (ISO BMFF box type at bytes 4-8).
+# Modern files start with ftyp; older QuickTime files may start elsewhere.
+_ISO_BMFF_ATOMS = frozenset({b'ftyp', b'moov', b'mdat', b'wide', b'free', b'skip', b'pnot'})
+
+# Upper bound for one validation probe; header parsing normally takes ms
+_PROBE_TIMEOUT = 10.0
+
+# Audio format expected by the alignment stage
+ALIGNMENT_SAMPLE_RATE = 16000
+
+
+def stat_once(
+    path: Path,
+    cache: Optional[Dict[str, os.stat_result]] = None,
+) -> Union[os.stat_result, OSError]:
+    """
+    Stat a path, reusing an earlier successful result from ``cache``.
+
+    Failed lookups are never cached, so a file created after a "not found"
+    result is seen by the next call.
+
+    Args:
+        path: Path to stat
+        cache: Dict scoped to one validation pass (e.g. a single
+            ``validate_inputs`` call); None stats every time
+
+    Returns:
+        The stat result, or the OSError raised by ``os.stat`` (returned
+        rather than raised so callers can branch on it)
+
+    Example:
+        >>> result = stat_once(Path("video.mp4"))
+        >>> exists = not isinstance(result, OSError)
+    """
+    key = os.fspath(path)
+    if cache is not None and key in cache:
+        return cache[key]
+    try:
+        result = os.stat(key)
+    except OSError as e:
+        return e
+    if cache is not None:
+        cache[key] = result
+    return result
+
+
+def _stat_regular_file(path: Path, kind: str) -> Tuple[Optional[os.stat_result], Optional[str]]:
+    """
+    Stat a path once and check it is a non-empty regular file.
+
+    Args:
+        path: File to check
+        kind: Label used in error messages (e.g., "Video")
+
+    Returns:
+        Tuple of (stat result, None) if usable, otherwise (None, error message)
+    """
+    st = stat_once(path)
+    if isinstance(st, FileNotFoundError):
+        return None, f"{kind} file {ERR_NOT_FOUND}: {path}"
+    if isinstance(st, OSError):
+        return None, f"Cannot access {kind.lower()} file {path}: {st.strerror}"
+
+    if not stat.S_ISREG(st.st_mode):
+        return None, f"{kind} path is not a file: {path}"
+    if st.st_size == 0:
+        return None, f"{kind} file is empty: {path}"
+    return st, None
+
+
+@lru_cache(maxsize=256)
+def _probe_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Probe a video once per (path, mtime, size).
+
+    ``mtime_ns`` and ``size`` are only part of the cache key: modifying the
+    file changes them and forces a new probe.
+    """
+    return probe_video_info(Path(path), timeout=_PROBE_TIMEOUT)
+
+
+def _has_video_container_header(video_path: Path) -> bool:
+    """
+    Check the first bytes of a file for the container its suffix implies.
+
+    Lets ``validate_video`` reject obviously bad files without spawning
+    ffprobe.
+
+    Args:
+        video_path: Video with a supported suffix
+
+    Returns:
+        True if the header matches (MP4/MOV box or AVI RIFF header)
+    """
+    try:
+        with open(video_path, 'rb') as f:
+            header = f.read(12)
+    except OSError:
+        return False
+
+    if video_path.suffix.lower() == '.avi':
+        return header[:4] == b'RIFF' and header[8:12] == b'AVI '
+    return header[4:8] in _ISO_BMFF_ATOMS
 
 
 def validate_video(video_path: Path) -> List[str]:
-    """Validate video file format, codec, resolution."""
-    # TODO: Check file exists
-    # TODO: Probe video with FFmpeg
-    # TODO: Validate codec, resolution, fps
-    raise NotImplementedError()
+    """
+    Validate video file format, codec, resolution.
+
+    Args:
+        video_path: Path to input video
+
+    Returns:
+        List of validation error messages (empty if valid)
+
+    Example:
+        >>> validate_video(Path("missing.mp4"))
+        ['Video file not found: missing.mp4']
+    """
+    video_path = Path(video_path)
+    if video_path.suffix.lower() not in _VIDEO_EXTS:
+        return [
+            f"{ERR_UNSUPPORTED_VIDEO}: {video_path.suffix}. "
+            f"Supported formats: {', '.join(VIDEO_EXTENSIONS)}"
+        ]
+
+    st, error = _stat_regular_file(video_path, "Video")
+    if error:
+        return [error]
+
+    # Cheap header sniff first; ffprobe is a subprocess spawn
+    if not _has_video_container_header(video_path):
+        return [f"Not a valid {video_path.suffix.lower()[1:].upper()} video file: {video_path}"]
+
+    try:
+        info = _probe_cached(os.fspath(video_path), st.st_mtime_ns, st.st_size)
+    except FileNotFoundError:
+        return ["ffprobe not found. Install FFmpeg to validate videos"]
+    except Exception as e:
+        return [f"Could not read video {video_path}: {e}"]
+
+    errors = []
+    if info['width'] <= 0 or info['height'] <= 0:
+        errors.append(f"Invalid video resolution: {info['width']}x{info['height']}")
+    if info['fps'] <= 0:
+        errors.append(f"Invalid video frame rate: {info['fps']}")
+    if info['duration'] <= 0:
+        errors.append(f"Video has no duration: {video_path}")
+    return errors
 
 
 def validate_script(script_path: Path) -> List[str]:
-    """Validate script file format and content."""
-    # TODO: Check file exists
-    # TODO: Validate format (TXT/JSON/CSV)
-    # TODO: Check content is not empty
-    raise NotImplementedError()
+    """
+    Validate script file format and content.
+
+    Args:
+        script_path: Path to script file (TXT/JSON/CSV)
+
+    Returns:
+        List of validation error messages (empty if valid)
+
+    Example:
+        >>> validate_script(Path("script.txt"))
+        []
+    """
+    script_path = Path(script_path)
+    if script_path.suffix.lower() not in _SCRIPT_EXTS:
+        return [
+            f"{ERR_UNSUPPORTED_SCRIPT}: {script_path.suffix}. "
+            f"Supported formats: {', '.join(SCRIPT_EXTENSIONS)}"
+        ]
+
+    _, error = _stat_regular_file(script_path, "Script")
+    if error:
+        return [error]
+
+    try:
+        text = script_path.read_text(encoding='utf-8-sig')
+    except UnicodeDecodeError:
+        return [f"Script file is not valid UTF-8: {script_path}"]
+
+    if not text.strip():
+        return [f"Script file is empty: {script_path}"]
+    return []
 
 
 def validate_audio(audio_path: Path) -> List[str]:
-    """Validate audio file format."""
-    # TODO: Check file exists
-    # TODO: Validate WAV format
-    # TODO: Check sample rate (16kHz mono)
-    raise NotImplementedError()
+    """
+    Validate audio file format.
+
+    Alignment expects 16 kHz mono WAV, as produced by the audio stage.
+
+    Args:
+        audio_path: Path to WAV file
+
+    Returns:
+        List of validation error messages (empty if valid)
+
+    Example:
+        >>> validate_audio(Path("audio.wav"))
+        []
+    """
+    audio_path = Path(audio_path)
+    if audio_path.suffix.lower() not in _AUDIO_EXTS:
+        return [
+            f"{ERR_UNSUPPORTED_AUDIO}: {audio_path.suffix}. "
+            f"Supported formats: {', '.join(AUDIO_EXTENSIONS)}"
+        ]
+
+    _, error = _stat_regular_file(audio_path, "Audio")
+    if error:
+        return [error]
+
+    try:
+        with wave.open(str(audio_path), 'rb') as wav:
+            channels = wav.getnchannels()
+            sample_rate = wav.getframerate()
+    except (wave.Error, EOFError) as e:
+        return [f"Invalid WAV file {audio_path}: {e}"]
+
+    errors = []
+    if channels != 1:
+        errors.append(f"Audio must be mono, got {channels} channels")
+    if sample_rate != ALIGNMENT_SAMPLE_RATE:
+        errors.append(
+            f"Audio sample rate must be {ALIGNMENT_SAMPLE_RATE} Hz, got {sample_rate} Hz"
+        )
+    return errors
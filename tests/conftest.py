@@ -4,22 +4,65 @@ Pytest Configuration and Shared Fixtures
 Provides common fixtures and configuration for all tests.
 """
 
+import copy
+import os
 import sys
+import types
 from pathlib import Path
-from typing import Any, Dict
-from unittest.mock import MagicMock
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
 import pytest
 
 from src.config import Config
 
 
-# Mock forcealign module if not installed
-if 'forcealign' not in sys.modules:
-    mock_forcealign = MagicMock()
-    # Set up the module structure
-    mock_forcealign.ForceAlign = MagicMock
-    sys.modules['forcealign'] = mock_forcealign
+class _StubForceAlign:
+    """Stand-in for forcealign.ForceAlign (tests patch it as needed)."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def inference(self):
+        return []
+
+
+def pytest_configure(config):
+    """
+    Stub the forcealign module if not installed.
+
+    Runs once per session (per xdist worker) before collection. A plain
+    module is cheaper than a MagicMock, which creates and records child
+    mocks on every attribute access.
+    """
+    if 'forcealign' not in sys.modules:
+        stub_forcealign = types.ModuleType('forcealign')
+        stub_forcealign.ForceAlign = _StubForceAlign
+        sys.modules['forcealign'] = stub_forcealign
+
+
+@pytest.fixture(scope="session")
+def cli_runner():
+    """
+    Provide a Click test runner shared across the session.
+
+    Returns:
+        CliRunner instance
+    """
+    from click.testing import CliRunner
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def cli_app():
+    """
+    Provide the CLI entry group, imported once per session.
+
+    Returns:
+        The ``src.cli.cli`` Click group
+    """
+    from src.cli import cli
+    return cli
 
 
 @pytest.fixture
@@ -49,15 +92,18 @@ def temp_output_dir(tmp_path: Path) -> Path:
     return output_dir
 
 
-@pytest.fixture
-def sample_config() -> Dict[str, Any]:
+@pytest.fixture(scope="session")
+def sample_config() -> Mapping[str, Any]:
     """
-    Provide sample configuration dictionary for testing.
+    Provide sample configuration for testing.
+
+    Built once per session and returned as a read-only view; use
+    ``mutable_config`` in tests that need to modify it.
 
     Returns:
-        Dict with minimal valid configuration
+        Read-only mapping with minimal valid configuration
     """
-    return {
+    return MappingProxyType({
         "version": "1.0",
         "brand": {
             "name": "TestBrand",
@@ -114,16 +160,30 @@ def sample_config() -> Dict[str, Any]:
                 "generate": True,
             },
         },
-    }
+    })
 
 
 @pytest.fixture
-def config_instance(sample_config: Dict[str, Any]) -> Config:
+def mutable_config(sample_config: Mapping[str, Any]) -> Dict[str, Any]:
     """
-    Provide Config instance for testing.
+    Provide a private, modifiable copy of the sample configuration.
 
     Args:
-        sample_config: Sample configuration dictionary
+        sample_config: Sample configuration mapping
+
+    Returns:
+        Deep copy of the sample configuration
+    """
+    return copy.deepcopy(dict(sample_config))
+
+
+@pytest.fixture(scope="session")
+def config_instance(sample_config: Mapping[str, Any]) -> Config:
+    """
+    Provide Config instance for testing (validated once per session).
+
+    Args:
+        sample_config: Sample configuration mapping
 
     Returns:
         Validated Config object
@@ -131,6 +191,54 @@ def config_instance(sample_config: Dict[str, Any]) -> Config:
     return Config(**sample_config)
 
 
+@pytest.fixture(scope="session")
+def sample_files(tmp_path_factory) -> Path:
+    """
+    Create minimal CLI input files once per session.
+
+    Contains ``video.mp4`` (dummy bytes), ``script.txt`` and
+    ``config.yaml``. Don't modify these; use ``sample_files_copy``.
+
+    Returns:
+        Path to the directory holding the sample files
+    """
+    data_dir = tmp_path_factory.mktemp("sample_data")
+
+    (data_dir / "video.mp4").write_bytes(b'dummy video')
+    (data_dir / "script.txt").write_text("This is a test script.")
+    (data_dir / "config.yaml").write_text("""
+brand:
+  name: Test Brand
+  colors:
+    primary: "#FF6B6B"
+captions:
+  font_size: 28
+    """)
+
+    return data_dir
+
+
+@pytest.fixture
+def sample_files_copy(tmp_path: Path, sample_files: Path) -> Path:
+    """
+    Provide the sample files in a per-test directory.
+
+    Files are hard-linked rather than rewritten, so they share data with
+    the session copies: add new files freely, but replace rather than
+    edit the linked ones in place.
+
+    Args:
+        tmp_path: Pytest tmp_path fixture
+        sample_files: Session sample files directory
+
+    Returns:
+        Path to a per-test directory containing the sample files
+    """
+    for entry in os.scandir(sample_files):
+        os.link(entry.path, tmp_path / entry.name)
+    return tmp_path
+
+
 @pytest.fixture
 def sample_video_path(test_data_dir: Path) -> Path:
     """
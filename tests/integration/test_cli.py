@@ -8,25 +8,24 @@ Run with:
     pytest tests/integration/test_cli.py -v
 """
 
-import pytest
-from click.testing import CliRunner
+import os
 from pathlib import Path
-import tempfile
-import shutil
 
-from src.cli import cli
+import pytest
+
+from src.utils.validation import (
+    ERR_NOT_FOUND,
+    ERR_UNSUPPORTED_CONFIG,
+    ERR_UNSUPPORTED_VIDEO,
+)
 
 
 class TestCLIValidation:
     """Test CLI validation command."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.runner = CliRunner()
-
-    def test_validate_missing_files(self):
+    def test_validate_missing_files(self, cli_runner, cli_app):
         """Test validation with missing files."""
-        result = self.runner.invoke(cli, [
+        result = cli_runner.invoke(cli_app, [
             'validate',
             '--video', 'nonexistent.mp4',
             '--script', 'nonexistent.txt'
@@ -36,34 +35,29 @@ class TestCLIValidation:
         # or exit code 1 for validation failures
         assert result.exit_code in (1, 2)
         # Check that error is reported (either Click's or our validation)
-        assert 'not found' in result.output.lower() or 'does not exist' in result.output.lower()
+        assert ERR_NOT_FOUND in result.output.lower() or 'does not exist' in result.output.lower()
 
-    def test_validate_invalid_video_format(self, tmp_path):
+    def test_validate_invalid_video_format(self, cli_runner, cli_app, tmp_path):
         """Test validation with invalid video format."""
         # Create a dummy file with invalid extension
         invalid_video = tmp_path / "video.txt"
         invalid_video.write_text("dummy")
 
-        result = self.runner.invoke(cli, [
+        result = cli_runner.invoke(cli_app, [
             'validate',
             '--video', str(invalid_video)
         ])
 
         assert result.exit_code == 1
-        assert 'Unsupported video format' in result.output
+        assert ERR_UNSUPPORTED_VIDEO in result.output
 
-    def test_validate_valid_files(self, tmp_path):
+    def test_validate_valid_files(self, cli_runner, cli_app, sample_files_copy):
         """Test validation with valid files."""
-        # Create valid dummy files
-        video = tmp_path / "video.mp4"
-        script = tmp_path / "script.txt"
-        config = tmp_path / "config.yaml"
+        video = sample_files_copy / "video.mp4"
+        script = sample_files_copy / "script.txt"
+        config = sample_files_copy / "config.yaml"
 
-        video.write_bytes(b'dummy video data')
-        script.write_text("This is a test script")
-        config.write_text("brand:\n  name: Test Brand")
-
-        result = self.runner.invoke(cli, [
+        result = cli_runner.invoke(cli_app, [
             'validate',
             '--video', str(video),
             '--script', str(script),
@@ -77,29 +71,25 @@ class TestCLIValidation:
 class TestCLIHelp:
     """Test CLI help and version commands."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.runner = CliRunner()
-
-    def test_help_command(self):
+    def test_help_command(self, cli_runner, cli_app):
         """Test --help flag."""
-        result = self.runner.invoke(cli, ['--help'])
+        result = cli_runner.invoke(cli_app, ['--help'])
 
         assert result.exit_code == 0
         assert 'HeyGen Social Clipper' in result.output
         assert 'process' in result.output
         assert 'validate' in result.output
 
-    def test_version_command(self):
+    def test_version_command(self, cli_runner, cli_app):
         """Test --version flag."""
-        result = self.runner.invoke(cli, ['--version'])
+        result = cli_runner.invoke(cli_app, ['--version'])
 
         assert result.exit_code == 0
         assert 'heygen-clipper' in result.output
 
-    def test_process_help(self):
+    def test_process_help(self, cli_runner, cli_app):
         """Test process command help."""
-        result = self.runner.invoke(cli, ['process', '--help'])
+        result = cli_runner.invoke(cli_app, ['process', '--help'])
 
         assert result.exit_code == 0
         assert '--video' in result.output
@@ -115,27 +105,28 @@ class TestCLIEndToEnd:
 
     These tests require sample video files and may take several minutes.
     Skip with: pytest -m "not slow"
+    Run in parallel (needs pytest-xdist): pytest -n auto -m slow
     """
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.runner = CliRunner()
-        self.sample_dir = Path("data/test_samples/sample_01")
+    @pytest.fixture
+    def sample_dir(self) -> Path:
+        """Per-test sample directory (no instance state shared by workers)."""
+        return Path("data/test_samples/sample_01")
 
     @pytest.mark.skipif(
         not Path("data/test_samples/sample_01/video.mp4").exists(),
         reason="Sample video not found"
     )
-    def test_full_pipeline(self, tmp_path):
+    def test_full_pipeline(self, cli_runner, cli_app, sample_dir, tmp_path):
         """Test complete 7-stage pipeline."""
         # Prepare paths
-        video = self.sample_dir / "video.mp4"
-        script = self.sample_dir / "script.txt"
+        video = sample_dir / "video.mp4"
+        script = sample_dir / "script.txt"
         config = Path("config/brand_example.yaml")
         output = tmp_path / "output"
 
         # Run full pipeline
-        result = self.runner.invoke(cli, [
+        result = cli_runner.invoke(cli_app, [
             'process',
             '--video', str(video),
             '--script', str(script),
@@ -160,21 +151,22 @@ class TestCLIEndToEnd:
 
         # Verify outputs exist
         assert (output / "final").exists()
-        final_video = list((output / "final").glob("*.mp4"))
-        assert len(final_video) > 0
-        assert final_video[0].stat().st_size > 0
+        with os.scandir(output / "final") as entries:
+            final_video = next((e for e in entries if e.name.endswith(".mp4")), None)
+        assert final_video is not None
+        assert final_video.stat().st_size > 0
 
-    def test_pipeline_with_verbose(self, tmp_path):
+    def test_pipeline_with_verbose(self, cli_runner, cli_app, sample_dir, tmp_path):
         """Test pipeline with verbose logging."""
-        if not (self.sample_dir / "video.mp4").exists():
+        if not (sample_dir / "video.mp4").exists():
             pytest.skip("Sample video not found")
 
-        video = self.sample_dir / "video.mp4"
-        script = self.sample_dir / "script.txt"
+        video = sample_dir / "video.mp4"
+        script = sample_dir / "script.txt"
         config = Path("config/brand_example.yaml")
         output = tmp_path / "output"
 
-        result = self.runner.invoke(cli, [
+        result = cli_runner.invoke(cli_app, [
             '--verbose',
             'process',
             '--video', str(video),
@@ -194,28 +186,22 @@ class TestCLIEndToEnd:
 class TestCLIErrorHandling:
     """Test CLI error handling and recovery."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.runner = CliRunner()
-
-    def test_missing_required_args(self):
+    def test_missing_required_args(self, cli_runner, cli_app):
         """Test error when required arguments are missing."""
-        result = self.runner.invoke(cli, ['process'])
+        result = cli_runner.invoke(cli_app, ['process'])
 
         assert result.exit_code != 0
         assert 'Error' in result.output or 'required' in result.output.lower()
 
-    def test_invalid_config_file(self, tmp_path):
+    def test_invalid_config_file(self, cli_runner, cli_app, sample_files_copy):
         """Test error with unsupported config format."""
-        video = tmp_path / "video.mp4"
-        script = tmp_path / "script.txt"
-        config = tmp_path / "config.txt"  # Wrong extension
+        video = sample_files_copy / "video.mp4"
+        script = sample_files_copy / "script.txt"
+        config = sample_files_copy / "config.txt"  # Wrong extension
 
-        video.write_bytes(b'dummy')
-        script.write_text("test")
         config.write_text("some content")
 
-        result = self.runner.invoke(cli, [
+        result = cli_runner.invoke(cli_app, [
             'validate',
             '--video', str(video),
             '--script', str(script),
@@ -224,32 +210,7 @@ class TestCLIErrorHandling:
 
         # Should fail validation due to unsupported format
         assert result.exit_code == 1
-        assert 'Unsupported config format' in result.output
-
-
-@pytest.fixture(scope="session")
-def sample_data_dir(tmp_path_factory):
-    """
-    Create sample data directory for tests.
-
-    This fixture creates minimal test files that can be used
-    across multiple tests.
-    """
-    data_dir = tmp_path_factory.mktemp("sample_data")
-
-    # Create minimal sample files
-    (data_dir / "video.mp4").write_bytes(b'dummy video')
-    (data_dir / "script.txt").write_text("This is a test script.")
-    (data_dir / "config.yaml").write_text("""
-brand:
-  name: Test Brand
-  colors:
-    primary: "#FF6B6B"
-captions:
-  font_size: 28
-    """)
-
-    return data_dir
+        assert ERR_UNSUPPORTED_CONFIG in result.output
 
 
 def test_cli_import():
@@ -282,7 +243,54 @@ def test_validation_helpers():
     )
 
     assert len(errors) > 0
-    assert any('not found' in err.lower() for err in errors)
+    assert any(ERR_NOT_FOUND in err.lower() for err in errors)
+
+
+def test_validation_checks_suffix_before_filesystem():
+    """Test unsupported extensions are reported even for missing files."""
+    from src.utils.cli_helpers import validate_inputs
+
+    errors = validate_inputs(
+        video_path=Path("nonexistent.webm"),
+        config_path=Path("nonexistent.toml"),
+    )
+
+    assert errors[0].startswith(f"{ERR_UNSUPPORTED_VIDEO}: .webm")
+    assert errors[1].startswith(f"{ERR_UNSUPPORTED_CONFIG}: .toml")
+
+
+def test_validation_requires_pexels_key(monkeypatch):
+    """Test the Pexels key is only required when requested."""
+    from src.utils.cli_helpers import validate_inputs
+
+    monkeypatch.delenv('PEXELS_API_KEY', raising=False)
+
+    assert validate_inputs() == []
+    errors = validate_inputs(require_pexels_key=True)
+    assert len(errors) == 1
+    assert errors[0].startswith("PEXELS_API_KEY not found")
+
+
+def test_validation_shared_directory(tmp_path):
+    """Test sibling inputs are each checked with a single stat."""
+    from unittest.mock import patch
+    from src.utils.cli_helpers import validate_inputs
+
+    (tmp_path / "video.mp4").write_bytes(b"dummy video")
+    (tmp_path / "script.txt").write_text("")
+
+    with patch("src.utils.validation.os.stat", wraps=os.stat) as mock_stat:
+        errors = validate_inputs(
+            video_path=tmp_path / "video.mp4",
+            script_path=tmp_path / "script.txt",
+            config_path=tmp_path / "config.yaml",
+        )
+
+    assert errors == [
+        "Script file is empty",
+        f"Config file not found: {tmp_path / 'config.yaml'}",
+    ]
+    assert mock_stat.call_count == 3
 
 
 def test_config_loader():
@@ -13,28 +13,41 @@ Test Coverage:
     - Timing validation (overlaps, large gaps)
 """
 
-import json
+import logging
+import sys
 from pathlib import Path
-from unittest.mock import MagicMock, patch, mock_open
+from typing import NamedTuple
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from src.config import Config
 from src.modules.alignment import AlignmentError, ForceAligner
+from src.utils.json_utils import json_loads
 
 
-class MockWordObj:
+class MockWordObj(NamedTuple):
     """Mock object for forcealign word results."""
 
-    def __init__(self, word: str, start: float, end: float):
-        self.word = word
-        self.time_start = start
-        self.time_end = end
+    word: str
+    time_start: float
+    time_end: float
 
 
-@pytest.fixture
+def _run_and_load(aligner, **kwargs):
+    """Run ForceAligner.process() and parse the alignment JSON it wrote."""
+    result = aligner.process(**kwargs)
+    return result, json_loads(Path(kwargs["output_path"]).read_bytes())
+
+
+def _mk_words(words, duration=0.4):
+    """Build mock aligned words spaced 0.5s apart."""
+    return [MockWordObj(word, i * 0.5, i * 0.5 + duration) for i, word in enumerate(words)]
+
+
+@pytest.fixture(scope="session")
 def sample_config():
-    """Create sample configuration."""
+    """Create sample configuration (shared; tests must not mutate it)."""
     from src.config import BrandConfig, CaptionConfig, BRollConfig, AudioConfig, ExportConfig
 
     return Config(
@@ -46,6 +59,41 @@ def sample_config():
     )
 
 
+@pytest.fixture(autouse=True)
+def _warn_caplog(caplog):
+    """Capture WARNING and above; the tests only assert on warnings."""
+    caplog.set_level(logging.WARNING)
+
+
+@pytest.fixture
+def aligner(sample_config):
+    """ForceAligner built from the shared sample configuration."""
+    return ForceAligner(sample_config)
+
+
+@pytest.fixture
+def mock_forcealign():
+    """Patch the forcealign.ForceAlign class for the duration of a test."""
+    with patch("forcealign.ForceAlign") as mock_class:
+        yield mock_class
+
+
+@pytest.fixture
+def mock_aligner(mock_forcealign):
+    """ForceAlign instance returned by the patched class."""
+    aligner = MagicMock(spec=["inference"])
+    mock_forcealign.return_value = aligner
+    return aligner
+
+
+@pytest.fixture
+def no_forcealign():
+    """Make ``import forcealign`` fail for the duration of a test."""
+    # patch.dict restores the previous sys.modules entry on exit
+    with patch.dict(sys.modules, {"forcealign": None}):
+        yield
+
+
 @pytest.fixture
 def temp_output(tmp_path):
     """Create temporary output directory."""
@@ -54,7 +102,7 @@ def temp_output(tmp_path):
     return output_dir
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_script_30_words():
     """30-word sample script with punctuation."""
     return (
@@ -64,18 +112,24 @@ def sample_script_30_words():
     )
 
 
-@pytest.fixture
-def sample_audio_path(tmp_path):
+@pytest.fixture(scope="session")
+def align_inputs_dir(tmp_path_factory):
+    """Directory holding the read-only inputs shared by these tests."""
+    return tmp_path_factory.mktemp("align")
+
+
+@pytest.fixture(scope="session")
+def sample_audio_path(align_inputs_dir):
     """Create mock audio file path."""
-    audio_path = tmp_path / "audio.wav"
+    audio_path = align_inputs_dir / "audio.wav"
     audio_path.write_bytes(b"FAKE_WAV_DATA")
     return audio_path
 
 
-@pytest.fixture
-def sample_script_path(tmp_path, sample_script_30_words):
+@pytest.fixture(scope="session")
+def sample_script_path(align_inputs_dir, sample_script_30_words):
     """Create sample script file."""
-    script_path = tmp_path / "script.txt"
+    script_path = align_inputs_dir / "script.txt"
     script_path.write_text(sample_script_30_words, encoding="utf-8")
     return script_path
 
@@ -119,75 +173,10 @@ class TestForceAlignerInitialization:
 class TestForceAlignerProcess:
     """Test ForceAligner.process() method."""
 
-    @patch("forcealign.ForceAlign")
-    def test_normal_alignment_30_words(
-        self,
-        mock_forcealign_class,
-        sample_config,
-        sample_audio_path,
-        sample_script_path,
-        temp_output,
-    ):
-        """Test normal alignment with 30-word script."""
-        # Setup mock ForceAlign
-        mock_aligner = MagicMock()
-        mock_forcealign_class.return_value = mock_aligner
-
-        # Create mock aligned words (all 30 words aligned)
-        words = [
-            "this", "is", "a", "sample", "script", "for", "testing", "forced",
-            "alignment", "it", "contains", "exactly", "thirty", "words",
-            "including", "punctuation", "marks", "apostrophes", "like", "don't",
-            "and", "hyphens", "in", "ai-powered", "technology",
-        ]
-
-        mock_words = []
-        for i, word in enumerate(words):
-            start = i * 0.5
-            end = start + 0.4
-            mock_words.append(MockWordObj(word, start, end))
-
-        mock_aligner.inference.return_value = mock_words
-
-        # Run alignment
-        aligner = ForceAligner(sample_config)
-        output_path = temp_output / "alignment.json"
-
-        result = aligner.process(
-            input_path=sample_audio_path,
-            output_path=output_path,
-            script_path=sample_script_path,
-        )
-
-        # Verify result
-        assert result.success is True
-        assert result.output_path == output_path
-        assert output_path.exists()
-
-        # Load and verify JSON output
-        with open(output_path, "r", encoding="utf-8") as f:
-            output_data = json.load(f)
-
-        assert "words" in output_data
-        assert "coverage" in output_data
-        assert "word_count" in output_data
-        assert len(output_data["words"]) == len(mock_words)
-        assert output_data["coverage"] >= 0.8  # Should have good coverage
-
-        # Verify word format
-        for word_data in output_data["words"]:
-            assert "word" in word_data
-            assert "start" in word_data
-            assert "end" in word_data
-            assert isinstance(word_data["start"], (int, float))
-            assert isinstance(word_data["end"], (int, float))
-            assert word_data["end"] > word_data["start"]
-
-    @patch("forcealign.ForceAlign")
     def test_punctuation_removal_and_restoration(
         self,
-        mock_forcealign_class,
-        sample_config,
+        mock_aligner,
+        aligner,
         sample_audio_path,
         tmp_path,
         temp_output,
@@ -199,35 +188,22 @@ class TestForceAlignerProcess:
         script_path.write_text(script_text, encoding="utf-8")
 
         # Setup mock - aligned words should be lowercase without punctuation
-        mock_aligner = MagicMock()
-        mock_forcealign_class.return_value = mock_aligner
-
-        mock_words = [
-            MockWordObj("hello", 0.0, 0.5),
-            MockWordObj("world", 0.5, 1.0),
-            MockWordObj("don't", 1.0, 1.5),
-            MockWordObj("forget", 1.5, 2.0),
-            MockWordObj("ai-powered", 2.0, 2.5),
-            MockWordObj("tech", 2.5, 3.0),
-            MockWordObj("amazing", 3.0, 3.5),
-            MockWordObj("works", 3.5, 4.0),
-        ]
+        mock_words = _mk_words(
+            ["hello", "world", "don't", "forget", "ai-powered", "tech", "amazing", "works"],
+            duration=0.5,
+        )
         mock_aligner.inference.return_value = mock_words
 
         # Run alignment
-        aligner = ForceAligner(sample_config)
         output_path = temp_output / "alignment.json"
 
-        result = aligner.process(
+        result, output_data = _run_and_load(
+            aligner,
             input_path=sample_audio_path,
             output_path=output_path,
             script_path=script_path,
         )
 
-        # Load output
-        with open(output_path, "r", encoding="utf-8") as f:
-            output_data = json.load(f)
-
         # Verify capitalization is restored
         words_output = [w["word"] for w in output_data["words"]]
         assert "Hello" in words_output  # Capitalized
@@ -235,138 +211,81 @@ class TestForceAlignerProcess:
         assert "don't" in words_output or "Don't" in words_output  # Apostrophe preserved
         assert any("AI-powered" in w or "ai-powered" in w for w in words_output)  # Hyphen preserved
 
-    @patch("forcealign.ForceAlign")
-    def test_alignment_failure_low_coverage(
-        self,
-        mock_forcealign_class,
-        sample_config,
-        sample_audio_path,
-        sample_script_path,
-        temp_output,
-    ):
-        """Test alignment failure when coverage is too low."""
-        # Setup mock with poor alignment (only 30% of words aligned)
-        mock_aligner = MagicMock()
-        mock_forcealign_class.return_value = mock_aligner
-
-        # Only align 3 words out of ~30 expected
-        mock_words = [
-            MockWordObj("this", 0.0, 0.5),
-            MockWordObj("is", 0.5, 1.0),
-            MockWordObj("sample", 1.0, 1.5),
-        ]
-        mock_aligner.inference.return_value = mock_words
-
-        # Run alignment with default min_coverage=0.5 (50%)
-        aligner = ForceAligner(sample_config)
-        output_path = temp_output / "alignment.json"
-
-        # Should raise AlignmentError due to low coverage
-        with pytest.raises(AlignmentError) as exc_info:
-            aligner.process(
-                input_path=sample_audio_path,
-                output_path=output_path,
-                script_path=sample_script_path,
-            )
-
-        assert "coverage too low" in str(exc_info.value).lower()
-
-    @patch("forcealign.ForceAlign")
-    def test_coverage_warning_threshold(
+    @pytest.mark.parametrize(
+        "words_count, min_coverage, expect_raises, expect_warn",
+        [
+            (25, 0.5, False, False),  # Every script word aligned
+            (3, 0.5, True, False),    # 12% coverage: below default threshold
+            (17, 0.5, False, True),   # 68% coverage: passes with a warning
+            (15, 0.3, False, True),   # 60% coverage: custom threshold passes
+            (15, 0.9, True, False),   # 60% coverage: custom threshold fails
+        ],
+    )
+    def test_coverage(
         self,
-        mock_forcealign_class,
-        sample_config,
+        mock_aligner,
+        aligner,
         sample_audio_path,
         sample_script_path,
         temp_output,
         caplog,
+        words_count,
+        min_coverage,
+        expect_raises,
+        expect_warn,
     ):
-        """Test warning when coverage is between 50-80%."""
-        import logging
-        caplog.set_level(logging.WARNING)
-
-        # Setup mock with 70% coverage (above error threshold, below warning)
-        mock_aligner = MagicMock()
-        mock_forcealign_class.return_value = mock_aligner
+        """Test coverage thresholds against the 25-word sample script."""
 
-        # Align ~17 words out of 25 expected (68% coverage)
-        words = ["word"] * 17
-        mock_words = []
-        for i, word in enumerate(words):
-            mock_words.append(MockWordObj(word, i * 0.5, (i + 1) * 0.5 - 0.1))
+        mock_aligner.inference.return_value = _mk_words(f"w{i}" for i in range(words_count))
 
-        mock_aligner.inference.return_value = mock_words
-
-        # Run alignment
-        aligner = ForceAligner(sample_config)
         output_path = temp_output / "alignment.json"
 
-        result = aligner.process(
+        if expect_raises:
+            with pytest.raises(AlignmentError) as exc_info:
+                aligner.process(
+                    input_path=sample_audio_path,
+                    output_path=output_path,
+                    script_path=sample_script_path,
+                    min_coverage=min_coverage,
+                )
+            assert "coverage too low" in str(exc_info.value).lower()
+            return
+
+        result, output_data = _run_and_load(
+            aligner,
             input_path=sample_audio_path,
             output_path=output_path,
             script_path=sample_script_path,
+            min_coverage=min_coverage,
         )
 
-        # Should succeed but log warning
         assert result.success is True
-        assert any("low alignment coverage" in record.message.lower() for record in caplog.records)
-
-    @patch("forcealign.ForceAlign")
-    def test_custom_min_coverage_threshold(
-        self,
-        mock_forcealign_class,
-        sample_config,
-        sample_audio_path,
-        sample_script_path,
-        temp_output,
-    ):
-        """Test custom minimum coverage threshold."""
-        # Setup mock with 60% coverage
-        mock_aligner = MagicMock()
-        mock_forcealign_class.return_value = mock_aligner
-
-        mock_words = [MockWordObj(f"word{i}", i * 0.5, (i + 1) * 0.5 - 0.1) for i in range(15)]
-        mock_aligner.inference.return_value = mock_words
+        assert result.output_path == output_path
+        assert result.metadata["word_count"] == words_count
 
-        aligner = ForceAligner(sample_config)
-        output_path = temp_output / "alignment.json"
+        assert len(output_data["words"]) == words_count
+        for word_data in output_data["words"]:
+            assert word_data["end"] > word_data["start"]
 
-        # Should succeed with min_coverage=0.3 (30%)
-        result = aligner.process(
-            input_path=sample_audio_path,
-            output_path=output_path,
-            script_path=sample_script_path,
-            min_coverage=0.3,
+        warned = any(
+            "low alignment coverage" in record.message.lower() for record in caplog.records
         )
-        assert result.success is True
-
-        # Should fail with min_coverage=0.9 (90%)
-        with pytest.raises(AlignmentError):
-            aligner.process(
-                input_path=sample_audio_path,
-                output_path=temp_output / "alignment2.json",
-                script_path=sample_script_path,
-                min_coverage=0.9,
-            )
+        assert warned is expect_warn
 
 
 class TestGapSmoothing:
     """Test gap smoothing functionality."""
 
-    @patch("forcealign.ForceAlign")
     def test_gap_smoothing_enabled(
         self,
-        mock_forcealign_class,
-        sample_config,
+        mock_aligner,
+        aligner,
         sample_audio_path,
         sample_script_path,
         temp_output,
     ):
         """Test that small gaps (<50ms) are smoothed."""
         # Create words with small gaps
-        mock_aligner = MagicMock()
-        mock_forcealign_class.return_value = mock_aligner
-
         mock_words = [
             MockWordObj("hello", 0.0, 0.5),
             MockWordObj("world", 0.52, 1.0),  # 20ms gap
@@ -375,10 +294,10 @@ class TestGapSmoothing:
         mock_aligner.inference.return_value = mock_words
 
         # Run alignment with smoothing enabled (default)
-        aligner = ForceAligner(sample_config)
         output_path = temp_output / "alignment.json"
 
-        result = aligner.process(
+        result, output_data = _run_and_load(
+            aligner,
             input_path=sample_audio_path,
             output_path=output_path,
             script_path=sample_script_path,
@@ -386,30 +305,22 @@ class TestGapSmoothing:
             min_coverage=0.0,  # Allow low coverage for this test
         )
 
-        # Load output
-        with open(output_path, "r", encoding="utf-8") as f:
-            output_data = json.load(f)
-
         words = output_data["words"]
 
         # Verify gaps are smoothed (words touch)
         assert words[0]["end"] == words[1]["start"]  # No gap
         assert words[1]["end"] == words[2]["start"]  # No gap
 
-    @patch("forcealign.ForceAlign")
     def test_gap_smoothing_disabled(
         self,
-        mock_forcealign_class,
-        sample_config,
+        mock_aligner,
+        aligner,
         sample_audio_path,
         sample_script_path,
         temp_output,
     ):
         """Test that gaps are preserved when smoothing is disabled."""
         # Create words with small gaps
-        mock_aligner = MagicMock()
-        mock_forcealign_class.return_value = mock_aligner
-
         mock_words = [
             MockWordObj("hello", 0.0, 0.5),
             MockWordObj("world", 0.52, 1.0),  # 20ms gap
@@ -417,10 +328,10 @@ class TestGapSmoothing:
         mock_aligner.inference.return_value = mock_words
 
         # Run alignment with smoothing disabled
-        aligner = ForceAligner(sample_config)
         output_path = temp_output / "alignment.json"
 
-        result = aligner.process(
+        result, output_data = _run_and_load(
+            aligner,
             input_path=sample_audio_path,
             output_path=output_path,
             script_path=sample_script_path,
@@ -428,10 +339,6 @@ class TestGapSmoothing:
             min_coverage=0.0,  # Allow low coverage for this test
         )
 
-        # Load output
-        with open(output_path, "r", encoding="utf-8") as f:
-            output_data = json.load(f)
-
         words = output_data["words"]
 
         # Verify gap is preserved
@@ -441,24 +348,18 @@ class TestGapSmoothing:
 class TestTimingValidation:
     """Test timing validation functionality."""
 
-    @patch("forcealign.ForceAlign")
     def test_overlapping_timestamps_warning(
         self,
-        mock_forcealign_class,
-        sample_config,
+        mock_aligner,
+        aligner,
         sample_audio_path,
         sample_script_path,
         temp_output,
         caplog,
     ):
         """Test warning for overlapping word timestamps."""
-        import logging
-        caplog.set_level(logging.WARNING)
 
         # Create words with overlap
-        mock_aligner = MagicMock()
-        mock_forcealign_class.return_value = mock_aligner
-
         mock_words = [
             MockWordObj("hello", 0.0, 0.6),
             MockWordObj("world", 0.5, 1.0),  # Overlaps by 0.1s
@@ -466,7 +367,6 @@ class TestTimingValidation:
         mock_aligner.inference.return_value = mock_words
 
         # Run alignment
-        aligner = ForceAligner(sample_config)
         output_path = temp_output / "alignment.json"
 
         result = aligner.process(
@@ -481,24 +381,18 @@ class TestTimingValidation:
         assert result.success is True
         assert any("overlap" in record.message.lower() for record in caplog.records)
 
-    @patch("forcealign.ForceAlign")
     def test_large_gap_warning(
         self,
-        mock_forcealign_class,
-        sample_config,
+        mock_aligner,
+        aligner,
         sample_audio_path,
         sample_script_path,
         temp_output,
         caplog,
     ):
         """Test warning for large gaps (>2s) between words."""
-        import logging
-        caplog.set_level(logging.WARNING)
 
         # Create words with large gap
-        mock_aligner = MagicMock()
-        mock_forcealign_class.return_value = mock_aligner
-
         mock_words = [
             MockWordObj("hello", 0.0, 0.5),
             MockWordObj("world", 3.0, 3.5),  # 2.5s gap
@@ -506,7 +400,6 @@ class TestTimingValidation:
         mock_aligner.inference.return_value = mock_words
 
         # Run alignment
-        aligner = ForceAligner(sample_config)
         output_path = temp_output / "alignment.json"
 
         result = aligner.process(
@@ -520,31 +413,24 @@ class TestTimingValidation:
         assert result.success is True
         assert any("large gap" in record.message.lower() for record in caplog.records)
 
-    @patch("forcealign.ForceAlign")
     def test_negative_duration_warning(
         self,
-        mock_forcealign_class,
-        sample_config,
+        mock_aligner,
+        aligner,
         sample_audio_path,
         sample_script_path,
         temp_output,
         caplog,
     ):
         """Test warning for negative word durations."""
-        import logging
-        caplog.set_level(logging.WARNING)
 
         # Create word with negative duration (end < start)
-        mock_aligner = MagicMock()
-        mock_forcealign_class.return_value = mock_aligner
-
         mock_words = [
             MockWordObj("hello", 1.0, 0.5),  # Negative duration
         ]
         mock_aligner.inference.return_value = mock_words
 
         # Run alignment
-        aligner = ForceAligner(sample_config)
         output_path = temp_output / "alignment.json"
 
         result = aligner.process(
@@ -562,92 +448,51 @@ class TestTimingValidation:
 class TestValidation:
     """Test input validation."""
 
-    def test_validate_missing_audio_file(self, sample_config, tmp_path):
-        """Test validation fails for missing audio file."""
-        aligner = ForceAligner(sample_config)
-
-        audio_path = tmp_path / "missing.wav"
-        script_path = tmp_path / "script.txt"
-        script_path.write_text("Test script", encoding="utf-8")
-
-        errors = aligner.validate(audio_path, script_path)
-
-        assert len(errors) > 0
-        assert any("not found" in err.lower() for err in errors)
-
-    def test_validate_wrong_audio_format(self, sample_config, tmp_path):
-        """Test validation fails for non-WAV audio."""
-        aligner = ForceAligner(sample_config)
-
-        audio_path = tmp_path / "audio.mp3"
-        audio_path.write_bytes(b"FAKE_MP3")
-        script_path = tmp_path / "script.txt"
-        script_path.write_text("Test script", encoding="utf-8")
-
-        errors = aligner.validate(audio_path, script_path)
-
-        assert len(errors) > 0
-        assert any("wav" in err.lower() for err in errors)
-
-    def test_validate_empty_audio_file(self, sample_config, tmp_path):
-        """Test validation fails for empty audio file."""
-        aligner = ForceAligner(sample_config)
-
-        audio_path = tmp_path / "audio.wav"
-        audio_path.write_bytes(b"")  # Empty file
-        script_path = tmp_path / "script.txt"
-        script_path.write_text("Test script", encoding="utf-8")
-
-        errors = aligner.validate(audio_path, script_path)
-
-        assert len(errors) > 0
-        assert any("empty" in err.lower() for err in errors)
-
-    def test_validate_missing_script_file(self, sample_config, tmp_path):
-        """Test validation fails for missing script file."""
-        aligner = ForceAligner(sample_config)
-
-        audio_path = tmp_path / "audio.wav"
-        audio_path.write_bytes(b"FAKE_WAV")
-        script_path = tmp_path / "missing.txt"
-
-        errors = aligner.validate(audio_path, script_path)
-
-        assert len(errors) > 0
-        assert any("not found" in err.lower() for err in errors)
-
-    def test_validate_empty_script_file(self, sample_config, tmp_path):
-        """Test validation fails for empty script file."""
-        aligner = ForceAligner(sample_config)
-
-        audio_path = tmp_path / "audio.wav"
-        audio_path.write_bytes(b"FAKE_WAV")
-        script_path = tmp_path / "script.txt"
-        script_path.write_text("", encoding="utf-8")  # Empty script
-
-        errors = aligner.validate(audio_path, script_path)
-
-        assert len(errors) > 0
-        assert any("empty" in err.lower() for err in errors)
-
-    def test_validate_script_too_short(self, sample_config, tmp_path):
-        """Test validation fails for script with <5 words."""
-        aligner = ForceAligner(sample_config)
-
-        audio_path = tmp_path / "audio.wav"
-        audio_path.write_bytes(b"FAKE_WAV")
-        script_path = tmp_path / "script.txt"
-        script_path.write_text("Only three words", encoding="utf-8")
+    @pytest.mark.parametrize(
+        "invalid_input, name, content, expected",
+        [
+            ("audio", "missing.wav", None, "not found"),
+            ("audio", "audio.mp3", b"FAKE_MP3", "wav"),
+            ("audio", "audio.wav", b"", "empty"),
+            ("script", "missing.txt", None, "not found"),
+            ("script", "script.txt", b"", "empty"),
+            ("script", "script.txt", b"Only three words", "too short"),
+        ],
+        ids=[
+            "missing-audio",
+            "wrong-audio-format",
+            "empty-audio",
+            "missing-script",
+            "empty-script",
+            "script-too-short",
+        ],
+    )
+    def test_validate_invalid_input(
+        self,
+        aligner,
+        sample_audio_path,
+        sample_script_path,
+        tmp_path,
+        invalid_input,
+        name,
+        content,
+        expected,
+    ):
+        """Test validation reports a bad audio or script file (content None = missing)."""
+        path = tmp_path / name
+        if content is not None:
+            path.write_bytes(content)
 
-        errors = aligner.validate(audio_path, script_path)
+        if invalid_input == "audio":
+            errors = aligner.validate(path, sample_script_path)
+        else:
+            errors = aligner.validate(sample_audio_path, path)
 
         assert len(errors) > 0
-        assert any("too short" in err.lower() for err in errors)
+        assert any(expected in err.lower() for err in errors)
 
-    def test_validate_valid_inputs(self, sample_config, sample_audio_path, sample_script_path):
+    def test_validate_valid_inputs(self, aligner, sample_audio_path, sample_script_path):
         """Test validation passes for valid inputs."""
-        aligner = ForceAligner(sample_config)
-
         errors = aligner.validate(sample_audio_path, sample_script_path)
 
         assert len(errors) == 0
@@ -658,40 +503,27 @@ class TestErrorHandling:
 
     def test_forcealign_import_error(
         self,
-        sample_config,
+        no_forcealign,
+        aligner,
         sample_audio_path,
         sample_script_path,
         temp_output,
     ):
         """Test graceful error when forcealign is not installed."""
-        import sys
-
-        # Temporarily remove forcealign from sys.modules if it exists
-        forcealign_backup = sys.modules.get('forcealign')
-        if 'forcealign' in sys.modules:
-            del sys.modules['forcealign']
-
-        try:
-            with patch.dict('sys.modules', {'forcealign': None}):
-                aligner = ForceAligner(sample_config)
-                output_path = temp_output / "alignment.json"
-
-                with pytest.raises(RuntimeError) as exc_info:
-                    aligner.process(
-                        input_path=sample_audio_path,
-                        output_path=output_path,
-                        script_path=sample_script_path,
-                    )
-
-                assert "forcealign library not installed" in str(exc_info.value)
-        finally:
-            # Restore forcealign if it was there
-            if forcealign_backup is not None:
-                sys.modules['forcealign'] = forcealign_backup
+        output_path = temp_output / "alignment.json"
+
+        with pytest.raises(RuntimeError) as exc_info:
+            aligner.process(
+                input_path=sample_audio_path,
+                output_path=output_path,
+                script_path=sample_script_path,
+            )
+
+        assert "forcealign library not installed" in str(exc_info.value)
 
     def test_invalid_script_format(
         self,
-        sample_config,
+        aligner,
         sample_audio_path,
         tmp_path,
         temp_output,
@@ -701,7 +533,6 @@ class TestErrorHandling:
         script_path = tmp_path / "bad_script.txt"
         script_path.write_text("!!! ??? ...", encoding="utf-8")
 
-        aligner = ForceAligner(sample_config)
         output_path = temp_output / "alignment.json"
 
         with pytest.raises(RuntimeError) as exc_info:
@@ -714,22 +545,18 @@ class TestErrorHandling:
         # The ValueError is wrapped in RuntimeError
         assert "invalid script format" in str(exc_info.value).lower() or "script contains no words" in str(exc_info.value).lower()
 
-    @patch("forcealign.ForceAlign")
     def test_forcealign_inference_failure(
         self,
-        mock_forcealign_class,
-        sample_config,
+        mock_aligner,
+        aligner,
         sample_audio_path,
         sample_script_path,
         temp_output,
     ):
         """Test error handling when ForceAlign.inference() fails."""
         # Setup mock to raise exception
-        mock_aligner = MagicMock()
-        mock_forcealign_class.return_value = mock_aligner
         mock_aligner.inference.side_effect = Exception("Alignment model error")
 
-        aligner = ForceAligner(sample_config)
         output_path = temp_output / "alignment.json"
 
         with pytest.raises(RuntimeError) as exc_info:
@@ -745,29 +572,26 @@ class TestErrorHandling:
 class TestJSONOutput:
     """Test JSON output format."""
 
-    @patch("forcealign.ForceAlign")
     def test_json_output_format(
         self,
-        mock_forcealign_class,
-        sample_config,
+        mock_aligner,
+        aligner,
         sample_audio_path,
         sample_script_path,
         temp_output,
     ):
         """Test that JSON output has correct format."""
         # Setup mock
-        mock_aligner = MagicMock()
-        mock_forcealign_class.return_value = mock_aligner
         mock_aligner.inference.return_value = [
             MockWordObj("hello", 0.0, 0.5),
             MockWordObj("world", 0.5, 1.0),
         ]
 
         # Run alignment
-        aligner = ForceAligner(sample_config)
         output_path = temp_output / "alignment.json"
 
-        result = aligner.process(
+        result, data = _run_and_load(
+            aligner,
             input_path=sample_audio_path,
             output_path=output_path,
             script_path=sample_script_path,
@@ -777,9 +601,6 @@ class TestJSONOutput:
         # Verify file exists and is valid JSON
         assert output_path.exists()
 
-        with open(output_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
         # Verify required fields
         assert "words" in data
         assert "coverage" in data
@@ -803,11 +624,10 @@ class TestJSONOutput:
             assert isinstance(word["start"], (int, float))
             assert isinstance(word["end"], (int, float))
 
-    @patch("forcealign.ForceAlign")
     def test_json_output_utf8_encoding(
         self,
-        mock_forcealign_class,
-        sample_config,
+        mock_aligner,
+        aligner,
         sample_audio_path,
         tmp_path,
         temp_output,
@@ -818,22 +638,15 @@ class TestJSONOutput:
         script_path.write_text("Bonjour café résumé naïve merci beaucoup", encoding="utf-8")
 
         # Setup mock
-        mock_aligner = MagicMock()
-        mock_forcealign_class.return_value = mock_aligner
-        mock_aligner.inference.return_value = [
-            MockWordObj("bonjour", 0.0, 0.5),
-            MockWordObj("café", 0.5, 1.0),
-            MockWordObj("résumé", 1.0, 1.5),
-            MockWordObj("naïve", 1.5, 2.0),
-            MockWordObj("merci", 2.0, 2.5),
-            MockWordObj("beaucoup", 2.5, 3.0),
-        ]
+        mock_aligner.inference.return_value = _mk_words(
+            ["bonjour", "café", "résumé", "naïve", "merci", "beaucoup"], duration=0.5
+        )
 
         # Run alignment
-        aligner = ForceAligner(sample_config)
         output_path = temp_output / "alignment.json"
 
-        result = aligner.process(
+        result, data = _run_and_load(
+            aligner,
             input_path=sample_audio_path,
             output_path=output_path,
             script_path=script_path,
@@ -841,9 +654,6 @@ class TestJSONOutput:
         )
 
         # Verify UTF-8 characters are preserved
-        with open(output_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
         words = [w["word"] for w in data["words"]]
         # Note: capitalization should be restored from original
         assert any("café" in w.lower() for w in words)
@@ -853,26 +663,22 @@ class TestJSONOutput:
 class TestMetadata:
     """Test metadata in ProcessorResult."""
 
-    @patch("forcealign.ForceAlign")
     def test_metadata_fields(
         self,
-        mock_forcealign_class,
-        sample_config,
+        mock_aligner,
+        aligner,
         sample_audio_path,
         sample_script_path,
         temp_output,
     ):
         """Test that result metadata contains expected fields."""
         # Setup mock
-        mock_aligner = MagicMock()
-        mock_forcealign_class.return_value = mock_aligner
         mock_aligner.inference.return_value = [
             MockWordObj("hello", 0.0, 0.5),
             MockWordObj("world", 0.5, 1.0),
         ]
 
         # Run alignment
-        aligner = ForceAligner(sample_config)
         output_path = temp_output / "alignment.json"
 
         result = aligner.process(
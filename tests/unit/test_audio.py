@@ -11,36 +11,98 @@ Tests cover:
 
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
-import ffmpeg
-from ffmpeg._run import Error as FFmpegError
+from unittest.mock import Mock, patch
 
-from src.modules.audio import AudioExtractor
+from src.modules.audio import AudioExtractor, FFmpegError
 from src.config import Config, AudioConfig, NoiseReductionConfig
 from src.core.processor import ProcessorResult
 
 
-@pytest.fixture
-def mock_config():
-    """Create mock configuration for testing."""
+# ffprobe results for a 60s source video and its extracted 16 kHz WAV.
+# Shared by tests; Mock.probe hands them back without mutating them.
+_VIDEO_PROBE_60 = {
+    'format': {'duration': '60.0'},
+    'streams': [
+        {'codec_type': 'video', 'codec_name': 'h264', 'width': 1920, 'height': 1080, 'r_frame_rate': '30/1'},
+        {'codec_type': 'audio', 'codec_name': 'aac', 'sample_rate': '48000', 'channels': 2, 'bit_rate': '128000'}
+    ]
+}
+_AUDIO_PROBE_60 = {
+    'format': {'duration': '60.0', 'size': '1920000'},
+    'streams': [
+        {'codec_type': 'audio', 'codec_name': 'pcm_s16le', 'sample_rate': '16000', 'channels': 1, 'bits_per_sample': 16}
+    ]
+}
+_AUDIO_PROBE_60_STEREO = {
+    **_AUDIO_PROBE_60,
+    'streams': [{**_AUDIO_PROBE_60['streams'][0], 'channels': 2}],
+}
+
+
+def _with_duration(probe: dict, duration: str) -> dict:
+    """Copy a probe result with a different format duration."""
+    return {**probe, 'format': {**probe['format'], 'duration': duration}}
+
+
+_AUDIO_CFG_NORM = AudioConfig(
+    sample_rate=16000,
+    channels=1,
+    format="wav",
+    normalize=True,
+    target_loudness=-16,
+    noise_reduction=NoiseReductionConfig(enabled=False, strength=0.5)
+)
+_AUDIO_CFG_NO_NORM = _AUDIO_CFG_NORM.model_copy(update={'normalize': False})
+
+
+def _make_mock_config(audio: AudioConfig) -> Mock:
+    """Build a Config mock around the given audio settings."""
     config = Mock(spec=Config)
-    config.audio = AudioConfig(
-        sample_rate=16000,
-        channels=1,
-        format="wav",
-        normalize=True,
-        target_loudness=-16,
-        noise_reduction=NoiseReductionConfig(enabled=False, strength=0.5)
-    )
+    config.audio = audio
     return config
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def mock_config():
+    """Create mock configuration for testing (shared; don't mutate)."""
+    return _make_mock_config(_AUDIO_CFG_NORM)
+
+
+@pytest.fixture(scope="module")
+def mock_config_no_normalize():
+    """Create mock configuration with normalization disabled."""
+    return _make_mock_config(_AUDIO_CFG_NO_NORM)
+
+
+@pytest.fixture(scope="module")
 def audio_extractor(mock_config):
-    """Create AudioExtractor instance for testing."""
+    """Create AudioExtractor instance for testing (shared; don't mutate)."""
     return AudioExtractor(mock_config)
 
 
+class _Passthrough:
+    """Stand-in ffmpeg stream: every attribute and call returns the stream."""
+
+    def __init__(self):
+        self.accessed = []  # Attribute names used on the stream, in order
+
+    def __getattr__(self, name):
+        self.accessed.append(name)
+        return self
+
+    def __call__(self, *args, **kwargs):
+        return self
+
+
+@pytest.fixture
+def patched_ffmpeg():
+    """Patch the audio module's ffmpeg with a chainable stream stand-in."""
+    with patch('src.modules.audio.ffmpeg') as mock_ffmpeg:
+        mock_ffmpeg.input.return_value = mock_ffmpeg.output.return_value = _Passthrough()
+        mock_ffmpeg.run.return_value = None
+        yield mock_ffmpeg
+
+
 @pytest.fixture
 def mock_video_path(tmp_path):
     """Create a mock video file path."""
@@ -50,9 +112,21 @@ def mock_video_path(tmp_path):
 
 
 @pytest.fixture
-def mock_audio_path(tmp_path):
-    """Create a mock audio output path."""
-    return tmp_path / "output" / "test_audio.wav"
+def make_audio_path(tmp_path):
+    """
+    Factory for the mock audio output path.
+
+    Call with ``exists=False`` for a path whose file (and parent directory)
+    doesn't exist yet, otherwise the file is created with ``content``.
+    """
+    def _make(exists: bool = True, content: bytes = b'audio data') -> Path:
+        audio_path = tmp_path / "output" / "test_audio.wav"
+        if exists:
+            audio_path.parent.mkdir(parents=True, exist_ok=True)
+            audio_path.write_bytes(content)
+        return audio_path
+
+    return _make
 
 
 class TestAudioExtractorInit:
@@ -78,176 +152,44 @@ class TestAudioExtractorInit:
 class TestAudioExtraction:
     """Test audio extraction functionality."""
 
-    @patch('src.modules.audio.ffmpeg')
-    def test_extract_audio_success(
+    @pytest.mark.parametrize("normalize,channels,expected_channels", [
+        (True, None, 1),   # Config defaults: normalized mono
+        (False, None, 1),  # Normalization disabled in config
+        (True, 2, 2),      # Stereo override
+    ])
+    def test_extract_variants(
         self,
-        mock_ffmpeg,
+        patched_ffmpeg,
         audio_extractor,
+        mock_config_no_normalize,
         mock_video_path,
-        mock_audio_path,
-        tmp_path
+        make_audio_path,
+        normalize,
+        channels,
+        expected_channels,
     ):
-        """Test successful audio extraction."""
-        # Mock ffmpeg operations
-        mock_stream = MagicMock()
-        mock_ffmpeg.input.return_value = mock_stream
-        mock_stream.audio = mock_stream
-        mock_ffmpeg.filter.return_value = mock_stream
-        mock_ffmpeg.output.return_value = mock_stream
-        mock_ffmpeg.run.return_value = None
-
-        # Mock probe for metadata
-        mock_ffmpeg.probe.side_effect = [
-            # Video metadata
-            {
-                'format': {'duration': '60.0'},
-                'streams': [
-                    {
-                        'codec_type': 'video',
-                        'codec_name': 'h264',
-                        'width': 1920,
-                        'height': 1080,
-                        'r_frame_rate': '30/1',
-                    },
-                    {
-                        'codec_type': 'audio',
-                        'codec_name': 'aac',
-                        'sample_rate': '48000',
-                        'channels': 2,
-                        'bit_rate': '128000',
-                    }
-                ]
-            },
-            # Audio output metadata
-            {
-                'format': {'duration': '60.0', 'size': '1920000'},
-                'streams': [
-                    {
-                        'codec_type': 'audio',
-                        'codec_name': 'pcm_s16le',
-                        'sample_rate': '16000',
-                        'channels': 1,
-                        'bits_per_sample': 16,
-                    }
-                ]
-            },
-        ]
+        """Test extraction with and without normalization and channel override."""
+        extractor = audio_extractor if normalize else AudioExtractor(mock_config_no_normalize)
+        audio_probe = _AUDIO_PROBE_60 if expected_channels == 1 else _AUDIO_PROBE_60_STEREO
+        patched_ffmpeg.probe.side_effect = [_VIDEO_PROBE_60, audio_probe]
 
         # Create output file to simulate successful extraction
-        mock_audio_path.parent.mkdir(parents=True, exist_ok=True)
-        mock_audio_path.write_bytes(b'fake audio data')
+        mock_audio_path = make_audio_path(content=b'fake audio data')
 
-        # Execute extraction
-        result = audio_extractor.process(mock_video_path, mock_audio_path)
+        kwargs = {} if channels is None else {'channels': channels}
+        result = extractor.process(mock_video_path, mock_audio_path, **kwargs)
 
-        # Verify result
         assert result.success is True
         assert result.output_path == mock_audio_path
         assert result.metadata['sample_rate'] == 16000
-        assert result.metadata['channels'] == 1
-        assert result.metadata['normalized'] is True
+        assert result.metadata['channels'] == expected_channels
+        assert result.metadata['normalized'] is normalize
         assert 'processing_time' in result.metadata
         assert 'sync_valid' in result.metadata
 
-    @patch('src.modules.audio.ffmpeg')
-    def test_extract_without_normalization(
-        self,
-        mock_ffmpeg,
-        mock_video_path,
-        mock_audio_path
-    ):
-        """Test extraction without audio normalization."""
-        # Create config with normalization disabled
-        config = Mock(spec=Config)
-        config.audio = AudioConfig(
-            sample_rate=16000,
-            channels=1,
-            format="wav",
-            normalize=False,  # Disabled
-            target_loudness=-16,
-            noise_reduction=NoiseReductionConfig(enabled=False, strength=0.5)
-        )
-        extractor = AudioExtractor(config)
-
-        # Mock ffmpeg operations
-        mock_stream = MagicMock()
-        mock_ffmpeg.input.return_value = mock_stream
-        mock_stream.audio = mock_stream
-        mock_ffmpeg.output.return_value = mock_stream
-        mock_ffmpeg.run.return_value = None
-
-        # Mock metadata
-        mock_ffmpeg.probe.side_effect = [
-            {  # Video metadata
-                'format': {'duration': '30.0'},
-                'streams': [
-                    {'codec_type': 'video', 'codec_name': 'h264', 'width': 1920, 'height': 1080, 'r_frame_rate': '30/1'},
-                    {'codec_type': 'audio', 'codec_name': 'aac', 'sample_rate': '48000', 'channels': 2, 'bit_rate': '128000'}
-                ]
-            },
-            {  # Audio metadata
-                'format': {'duration': '30.0', 'size': '960000'},
-                'streams': [{'codec_type': 'audio', 'codec_name': 'pcm_s16le', 'sample_rate': '16000', 'channels': 1, 'bits_per_sample': 16}]
-            },
-        ]
-
-        # Create output
-        mock_audio_path.parent.mkdir(parents=True, exist_ok=True)
-        mock_audio_path.write_bytes(b'audio data')
-
-        # Execute
-        result = extractor.process(mock_video_path, mock_audio_path)
-
-        # Verify normalization was not applied
-        assert result.metadata['normalized'] is False
-        # Filter should not have been called
-        mock_ffmpeg.filter.assert_not_called()
-
-    @patch('src.modules.audio.ffmpeg')
-    def test_extract_stereo_override(
-        self,
-        mock_ffmpeg,
-        audio_extractor,
-        mock_video_path,
-        mock_audio_path
-    ):
-        """Test extraction with stereo override."""
-        # Mock operations
-        mock_stream = MagicMock()
-        mock_ffmpeg.input.return_value = mock_stream
-        mock_stream.audio = mock_stream
-        mock_ffmpeg.filter.return_value = mock_stream
-        mock_ffmpeg.output.return_value = mock_stream
-        mock_ffmpeg.run.return_value = None
-
-        # Mock metadata
-        mock_ffmpeg.probe.side_effect = [
-            {
-                'format': {'duration': '45.0'},
-                'streams': [
-                    {'codec_type': 'video', 'codec_name': 'h264', 'width': 1920, 'height': 1080, 'r_frame_rate': '30/1'},
-                    {'codec_type': 'audio', 'codec_name': 'aac', 'sample_rate': '48000', 'channels': 2, 'bit_rate': '128000'}
-                ]
-            },
-            {
-                'format': {'duration': '45.0', 'size': '1440000'},
-                'streams': [{'codec_type': 'audio', 'codec_name': 'pcm_s16le', 'sample_rate': '16000', 'channels': 2, 'bits_per_sample': 16}]
-            },
-        ]
-
-        # Create output
-        mock_audio_path.parent.mkdir(parents=True, exist_ok=True)
-        mock_audio_path.write_bytes(b'stereo audio')
-
-        # Execute with stereo override
-        result = audio_extractor.process(
-            mock_video_path,
-            mock_audio_path,
-            channels=2  # Override to stereo
-        )
-
-        # Verify stereo was used
-        assert result.metadata['channels'] == 2
+        # loudnorm filter is only added when normalizing
+        stream = patched_ffmpeg.input.return_value
+        assert ('filter' in stream.accessed) is normalize
 
 
 class TestValidation:
@@ -272,14 +214,13 @@ class TestValidation:
         assert len(errors) > 0
         assert "empty" in errors[0].lower()
 
-    @patch('src.modules.audio.ffmpeg')
-    def test_validate_no_audio_track(self, mock_ffmpeg, audio_extractor, mock_video_path):
+    def test_validate_no_audio_track(self, patched_ffmpeg, audio_extractor, mock_video_path):
         """Test validation fails when video has no audio track."""
         # Write some data to make file non-empty
         mock_video_path.write_bytes(b'fake video data')
 
         # Mock video with no audio stream
-        mock_ffmpeg.probe.return_value = {
+        patched_ffmpeg.probe.return_value = {
             'streams': [
                 {'codec_type': 'video', 'codec_name': 'h264'}
                 # No audio stream
@@ -291,14 +232,13 @@ class TestValidation:
         assert len(errors) > 0
         assert "no audio track" in errors[0].lower()
 
-    @patch('src.modules.audio.ffmpeg')
-    def test_validate_success(self, mock_ffmpeg, audio_extractor, mock_video_path):
+    def test_validate_success(self, patched_ffmpeg, audio_extractor, mock_video_path):
         """Test validation passes for valid video with audio."""
         # Write some data to make file non-empty
         mock_video_path.write_bytes(b'fake video data')
 
         # Mock valid video with audio
-        mock_ffmpeg.probe.return_value = {
+        patched_ffmpeg.probe.return_value = {
             'streams': [
                 {'codec_type': 'video', 'codec_name': 'h264'},
                 {'codec_type': 'audio', 'codec_name': 'aac'}
@@ -313,10 +253,9 @@ class TestValidation:
 class TestMetadataExtraction:
     """Test metadata extraction methods."""
 
-    @patch('src.modules.audio.ffmpeg')
-    def test_get_video_metadata(self, mock_ffmpeg, audio_extractor, mock_video_path):
+    def test_get_video_metadata(self, patched_ffmpeg, audio_extractor, mock_video_path):
         """Test video metadata extraction."""
-        mock_ffmpeg.probe.return_value = {
+        patched_ffmpeg.probe.return_value = {
             'format': {'duration': '120.5'},
             'streams': [
                 {
@@ -347,25 +286,12 @@ class TestMetadataExtraction:
         assert metadata['audio_sample_rate'] == 48000
         assert metadata['audio_channels'] == 2
 
-    @patch('src.modules.audio.ffmpeg')
-    def test_get_audio_metadata(self, mock_ffmpeg, audio_extractor, mock_audio_path):
+    def test_get_audio_metadata(self, patched_ffmpeg, audio_extractor, make_audio_path):
         """Test audio file metadata extraction."""
-        mock_ffmpeg.probe.return_value = {
-            'format': {'duration': '60.0', 'size': '1920000'},
-            'streams': [
-                {
-                    'codec_type': 'audio',
-                    'codec_name': 'pcm_s16le',
-                    'sample_rate': '16000',
-                    'channels': 1,
-                    'bits_per_sample': 16,
-                }
-            ]
-        }
+        patched_ffmpeg.probe.return_value = _AUDIO_PROBE_60
 
         # Create dummy file
-        mock_audio_path.parent.mkdir(parents=True, exist_ok=True)
-        mock_audio_path.touch()
+        mock_audio_path = make_audio_path()
 
         metadata = audio_extractor._get_audio_metadata(mock_audio_path)
 
@@ -379,19 +305,26 @@ class TestMetadataExtraction:
 class TestSyncValidation:
     """Test audio/video sync validation."""
 
-    @patch('src.modules.audio.ffmpeg')
-    def test_sync_valid(self, mock_ffmpeg, audio_extractor, mock_video_path, mock_audio_path):
-        """Test sync validation passes for matching durations."""
-        mock_ffmpeg.probe.return_value = {
-            'format': {'duration': '60.0', 'size': '1920000'},
-            'streams': [
-                {'codec_type': 'audio', 'codec_name': 'pcm_s16le', 'sample_rate': '16000', 'channels': 1, 'bits_per_sample': 16}
-            ]
-        }
+    @pytest.mark.parametrize("audio_duration,expect_valid,expected_drift", [
+        ('60.0', True, 0.0),        # Matching durations
+        ('60.003', True, 0.003),    # 3ms drift, within 5ms tolerance
+        ('60.050', False, 0.050),   # 50ms drift, exceeds tolerance
+    ])
+    def test_sync(
+        self,
+        patched_ffmpeg,
+        audio_extractor,
+        mock_video_path,
+        make_audio_path,
+        audio_duration,
+        expect_valid,
+        expected_drift,
+    ):
+        """Test sync validation against a 5ms drift tolerance."""
+        patched_ffmpeg.probe.return_value = _with_duration(_AUDIO_PROBE_60, audio_duration)
 
         # Create dummy file
-        mock_audio_path.parent.mkdir(parents=True, exist_ok=True)
-        mock_audio_path.touch()
+        mock_audio_path = make_audio_path()
 
         sync_valid, drift = audio_extractor._validate_sync(
             mock_video_path,
@@ -400,106 +333,33 @@ class TestSyncValidation:
             tolerance_ms=5.0
         )
 
-        assert sync_valid is True
-        assert drift == 0.0
-
-    @patch('src.modules.audio.ffmpeg')
-    def test_sync_drift_within_tolerance(self, mock_ffmpeg, audio_extractor, mock_video_path, mock_audio_path):
-        """Test sync validation passes for small drift within tolerance."""
-        # Audio is 60.003s (3ms drift)
-        mock_ffmpeg.probe.return_value = {
-            'format': {'duration': '60.003', 'size': '1920000'},
-            'streams': [
-                {'codec_type': 'audio', 'codec_name': 'pcm_s16le', 'sample_rate': '16000', 'channels': 1, 'bits_per_sample': 16}
-            ]
-        }
-
-        mock_audio_path.parent.mkdir(parents=True, exist_ok=True)
-        mock_audio_path.touch()
-
-        sync_valid, drift = audio_extractor._validate_sync(
-            mock_video_path,
-            mock_audio_path,
-            expected_duration=60.0,
-            tolerance_ms=5.0  # 5ms tolerance
-        )
-
-        assert sync_valid is True
-        assert drift < 0.005  # Less than 5ms
-
-    @patch('src.modules.audio.ffmpeg')
-    def test_sync_drift_exceeds_tolerance(self, mock_ffmpeg, audio_extractor, mock_video_path, mock_audio_path):
-        """Test sync validation fails for drift exceeding tolerance."""
-        # Audio is 60.050s (50ms drift)
-        mock_ffmpeg.probe.return_value = {
-            'format': {'duration': '60.050', 'size': '1920000'},
-            'streams': [
-                {'codec_type': 'audio', 'codec_name': 'pcm_s16le', 'sample_rate': '16000', 'channels': 1, 'bits_per_sample': 16}
-            ]
-        }
-
-        mock_audio_path.parent.mkdir(parents=True, exist_ok=True)
-        mock_audio_path.touch()
-
-        sync_valid, drift = audio_extractor._validate_sync(
-            mock_video_path,
-            mock_audio_path,
-            expected_duration=60.0,
-            tolerance_ms=5.0  # 5ms tolerance
-        )
-
-        assert sync_valid is False
-        assert drift == pytest.approx(0.050, abs=0.001)
+        assert sync_valid is expect_valid
+        assert drift == pytest.approx(expected_drift, abs=0.001)
 
 
 class TestErrorHandling:
     """Test error handling."""
 
-    @patch('src.modules.audio.ffmpeg')
-    def test_ffmpeg_error(self, mock_ffmpeg, audio_extractor, mock_video_path, mock_audio_path):
+    def test_ffmpeg_error(self, patched_ffmpeg, audio_extractor, mock_video_path, make_audio_path):
         """Test handling of FFmpeg errors."""
-        # Mock FFmpeg error
-        mock_stream = MagicMock()
-        mock_ffmpeg.input.return_value = mock_stream
-        mock_stream.audio = mock_stream
-        mock_ffmpeg.filter.return_value = mock_stream
-        mock_ffmpeg.output.return_value = mock_stream
+        mock_audio_path = make_audio_path(exists=False)
 
         error = FFmpegError('ffmpeg', b'', b'FFmpeg error: invalid codec')
-        mock_ffmpeg.run.side_effect = error
+        patched_ffmpeg.run.side_effect = error
 
         # Mock metadata probe
-        mock_ffmpeg.probe.return_value = {
-            'format': {'duration': '60.0'},
-            'streams': [
-                {'codec_type': 'video', 'codec_name': 'h264', 'width': 1920, 'height': 1080, 'r_frame_rate': '30/1'},
-                {'codec_type': 'audio', 'codec_name': 'aac', 'sample_rate': '48000', 'channels': 2, 'bit_rate': '128000'}
-            ]
-        }
+        patched_ffmpeg.probe.return_value = _VIDEO_PROBE_60
 
         # Execution should raise RuntimeError
         with pytest.raises(RuntimeError, match="Audio extraction failed"):
             audio_extractor.process(mock_video_path, mock_audio_path)
 
-    @patch('src.modules.audio.ffmpeg')
-    def test_output_not_created(self, mock_ffmpeg, audio_extractor, mock_video_path, mock_audio_path):
+    def test_output_not_created(self, patched_ffmpeg, audio_extractor, mock_video_path, make_audio_path):
         """Test error when output file is not created."""
-        # Mock successful ffmpeg run but no output file
-        mock_stream = MagicMock()
-        mock_ffmpeg.input.return_value = mock_stream
-        mock_stream.audio = mock_stream
-        mock_ffmpeg.filter.return_value = mock_stream
-        mock_ffmpeg.output.return_value = mock_stream
-        mock_ffmpeg.run.return_value = None
+        mock_audio_path = make_audio_path(exists=False)
 
         # Mock metadata
-        mock_ffmpeg.probe.return_value = {
-            'format': {'duration': '60.0'},
-            'streams': [
-                {'codec_type': 'video', 'codec_name': 'h264', 'width': 1920, 'height': 1080, 'r_frame_rate': '30/1'},
-                {'codec_type': 'audio', 'codec_name': 'aac', 'sample_rate': '48000', 'channels': 2, 'bit_rate': '128000'}
-            ]
-        }
+        patched_ffmpeg.probe.return_value = _VIDEO_PROBE_60
 
         # Don't create output file (simulating failure)
 
@@ -510,22 +370,13 @@ class TestErrorHandling:
 class TestDurationEstimation:
     """Test processing duration estimation."""
 
-    @patch('src.modules.audio.ffmpeg')
-    def test_estimate_duration_without_normalization(self, mock_ffmpeg, mock_video_path):
+    def test_estimate_duration_without_normalization(
+        self, patched_ffmpeg, mock_config_no_normalize, mock_video_path
+    ):
         """Test duration estimation for extraction without normalization."""
-        # Create config with normalization disabled
-        config = Mock(spec=Config)
-        config.audio = AudioConfig(
-            sample_rate=16000,
-            channels=1,
-            format="wav",
-            normalize=False,  # Disabled
-            target_loudness=-16,
-            noise_reduction=NoiseReductionConfig(enabled=False, strength=0.5)
-        )
-        extractor = AudioExtractor(config)
+        extractor = AudioExtractor(mock_config_no_normalize)
 
-        mock_ffmpeg.probe.return_value = {
+        patched_ffmpeg.probe.return_value = {
             'format': {'duration': '100.0'}
         }
 
@@ -534,10 +385,9 @@ class TestDurationEstimation:
         # Should be ~8% of video duration without normalization
         assert estimated == pytest.approx(8.0, abs=1.0)
 
-    @patch('src.modules.audio.ffmpeg')
-    def test_estimate_duration_with_normalization(self, mock_ffmpeg, audio_extractor, mock_video_path):
+    def test_estimate_duration_with_normalization(self, patched_ffmpeg, audio_extractor, mock_video_path):
         """Test duration estimation for extraction with normalization."""
-        mock_ffmpeg.probe.return_value = {
+        patched_ffmpeg.probe.return_value = {
             'format': {'duration': '100.0'}
         }
 
@@ -559,101 +409,48 @@ class TestDurationEstimation:
 class TestEdgeCasesAndErrorPaths:
     """Test edge cases and error paths for complete coverage."""
 
-    @patch('src.modules.audio.ffmpeg')
-    def test_empty_output_file(self, mock_ffmpeg, audio_extractor, mock_video_path, mock_audio_path):
+    def test_empty_output_file(self, patched_ffmpeg, audio_extractor, mock_video_path, make_audio_path):
         """Test error when output file is created but empty."""
-        # Mock successful ffmpeg operations
-        mock_stream = MagicMock()
-        mock_ffmpeg.input.return_value = mock_stream
-        mock_stream.audio = mock_stream
-        mock_ffmpeg.filter.return_value = mock_stream
-        mock_ffmpeg.output.return_value = mock_stream
-        mock_ffmpeg.run.return_value = None
-
         # Mock metadata
-        mock_ffmpeg.probe.return_value = {
-            'format': {'duration': '60.0'},
-            'streams': [
-                {'codec_type': 'video', 'codec_name': 'h264', 'width': 1920, 'height': 1080, 'r_frame_rate': '30/1'},
-                {'codec_type': 'audio', 'codec_name': 'aac', 'sample_rate': '48000', 'channels': 2, 'bit_rate': '128000'}
-            ]
-        }
+        patched_ffmpeg.probe.return_value = _VIDEO_PROBE_60
 
         # Create output file but with zero size
-        mock_audio_path.parent.mkdir(parents=True, exist_ok=True)
-        mock_audio_path.touch()  # Empty file
+        mock_audio_path = make_audio_path(content=b'')
 
         with pytest.raises(RuntimeError, match="is empty"):
             audio_extractor.process(mock_video_path, mock_audio_path)
 
-    @patch('src.modules.audio.ffmpeg')
-    def test_ffmpeg_error_with_stderr(self, mock_ffmpeg, audio_extractor, mock_video_path, mock_audio_path):
+    def test_ffmpeg_error_with_stderr(self, patched_ffmpeg, audio_extractor, mock_video_path, make_audio_path):
         """Test FFmpeg error handling with stderr output."""
-        mock_stream = MagicMock()
-        mock_ffmpeg.input.return_value = mock_stream
-        mock_stream.audio = mock_stream
-        mock_ffmpeg.filter.return_value = mock_stream
-        mock_ffmpeg.output.return_value = mock_stream
+        mock_audio_path = make_audio_path(exists=False)
 
         # Create FFmpegError with stderr
         error = FFmpegError('ffmpeg', b'', b'Detailed FFmpeg error message')
-        mock_ffmpeg.run.side_effect = error
+        patched_ffmpeg.run.side_effect = error
 
         # Mock metadata
-        mock_ffmpeg.probe.return_value = {
-            'format': {'duration': '60.0'},
-            'streams': [
-                {'codec_type': 'video', 'codec_name': 'h264', 'width': 1920, 'height': 1080, 'r_frame_rate': '30/1'},
-                {'codec_type': 'audio', 'codec_name': 'aac', 'sample_rate': '48000', 'channels': 2, 'bit_rate': '128000'}
-            ]
-        }
+        patched_ffmpeg.probe.return_value = _VIDEO_PROBE_60
 
         with pytest.raises(RuntimeError, match="Audio extraction failed"):
             audio_extractor.process(mock_video_path, mock_audio_path)
 
-    @patch('src.modules.audio.ffmpeg')
-    def test_sync_drift_warning(self, mock_ffmpeg, audio_extractor, mock_video_path, mock_audio_path):
+    def test_sync_drift_warning(self, patched_ffmpeg, audio_extractor, mock_video_path, make_audio_path):
         """Test sync drift warning is logged."""
-        # Mock ffmpeg operations
-        mock_stream = MagicMock()
-        mock_ffmpeg.input.return_value = mock_stream
-        mock_stream.audio = mock_stream
-        mock_ffmpeg.filter.return_value = mock_stream
-        mock_ffmpeg.output.return_value = mock_stream
-        mock_ffmpeg.run.return_value = None
-
         # Mock metadata with drift - need 3 probe calls:
         # 1. Video metadata (input)
         # 2. Audio metadata (output) - first check
         # 3. Audio metadata (output) - sync validation
-        mock_ffmpeg.probe.side_effect = [
+        patched_ffmpeg.probe.side_effect = [
             # 1. Video metadata
-            {
-                'format': {'duration': '60.0'},
-                'streams': [
-                    {'codec_type': 'video', 'codec_name': 'h264', 'width': 1920, 'height': 1080, 'r_frame_rate': '30/1'},
-                    {'codec_type': 'audio', 'codec_name': 'aac', 'sample_rate': '48000', 'channels': 2, 'bit_rate': '128000'}
-                ]
-            },
+            _VIDEO_PROBE_60,
             # 2. Audio output metadata - first check (after extraction)
-            {
-                'format': {'duration': '60.100', 'size': '1920000'},
-                'streams': [
-                    {'codec_type': 'audio', 'codec_name': 'pcm_s16le', 'sample_rate': '16000', 'channels': 1, 'bits_per_sample': 16}
-                ]
-            },
+            _with_duration(_AUDIO_PROBE_60, '60.100'),
             # 3. Audio output metadata - sync validation check (100ms drift)
-            {
-                'format': {'duration': '60.100', 'size': '1920000'},
-                'streams': [
-                    {'codec_type': 'audio', 'codec_name': 'pcm_s16le', 'sample_rate': '16000', 'channels': 1, 'bits_per_sample': 16}
-                ]
-            },
+            _with_duration(_AUDIO_PROBE_60, '60.100'),
         ]
 
         # Create output file
-        mock_audio_path.parent.mkdir(parents=True, exist_ok=True)
-        mock_audio_path.write_bytes(b'audio data')
+        mock_audio_path = make_audio_path()
 
         result = audio_extractor.process(mock_video_path, mock_audio_path)
 
@@ -662,25 +459,23 @@ class TestEdgeCasesAndErrorPaths:
         assert result.metadata['sync_valid'] is False
         assert result.metadata['sync_drift_ms'] > 5.0  # More than 5ms tolerance
 
-    @patch('src.modules.audio.ffmpeg')
-    def test_validate_ffmpeg_probe_error(self, mock_ffmpeg, audio_extractor, mock_video_path):
+    def test_validate_ffmpeg_probe_error(self, patched_ffmpeg, audio_extractor, mock_video_path):
         """Test validation with FFmpeg probe error."""
         # Write data to make file non-empty
         mock_video_path.write_bytes(b'fake video data')
 
         # Mock FFmpeg probe error
         error = FFmpegError('ffmpeg', b'', b'Probe failed')
-        mock_ffmpeg.probe.side_effect = error
+        patched_ffmpeg.probe.side_effect = error
 
         errors = audio_extractor.validate(mock_video_path)
 
         assert len(errors) > 0
         assert "probe" in errors[0].lower()
 
-    @patch('src.modules.audio.ffmpeg')
-    def test_metadata_extraction_no_video_stream(self, mock_ffmpeg, audio_extractor, mock_video_path):
+    def test_metadata_extraction_no_video_stream(self, patched_ffmpeg, audio_extractor, mock_video_path):
         """Test metadata extraction fails when no video stream."""
-        mock_ffmpeg.probe.return_value = {
+        patched_ffmpeg.probe.return_value = {
             'format': {'duration': '60.0'},
             'streams': [
                 {'codec_type': 'audio', 'codec_name': 'aac'}  # Only audio, no video
@@ -690,10 +485,9 @@ class TestEdgeCasesAndErrorPaths:
         with pytest.raises(RuntimeError, match="No video stream"):
             audio_extractor._get_video_metadata(mock_video_path)
 
-    @patch('src.modules.audio.ffmpeg')
-    def test_metadata_extraction_no_audio_stream(self, mock_ffmpeg, audio_extractor, mock_video_path):
+    def test_metadata_extraction_no_audio_stream(self, patched_ffmpeg, audio_extractor, mock_video_path):
         """Test metadata extraction fails when no audio stream."""
-        mock_ffmpeg.probe.return_value = {
+        patched_ffmpeg.probe.return_value = {
             'format': {'duration': '60.0'},
             'streams': [
                 {'codec_type': 'video', 'codec_name': 'h264'}  # Only video, no audio
@@ -703,22 +497,19 @@ class TestEdgeCasesAndErrorPaths:
         with pytest.raises(RuntimeError, match="No audio stream"):
             audio_extractor._get_video_metadata(mock_video_path)
 
-    @patch('src.modules.audio.ffmpeg')
-    def test_metadata_extraction_probe_failure(self, mock_ffmpeg, audio_extractor, mock_video_path):
+    def test_metadata_extraction_probe_failure(self, patched_ffmpeg, audio_extractor, mock_video_path):
         """Test metadata extraction handles probe failures."""
-        mock_ffmpeg.probe.side_effect = Exception("Probe failed")
+        patched_ffmpeg.probe.side_effect = Exception("Probe failed")
 
         with pytest.raises(RuntimeError, match="Metadata extraction failed"):
             audio_extractor._get_video_metadata(mock_video_path)
 
-    @patch('src.modules.audio.ffmpeg')
-    def test_audio_metadata_no_audio_stream(self, mock_ffmpeg, audio_extractor, mock_audio_path):
+    def test_audio_metadata_no_audio_stream(self, patched_ffmpeg, audio_extractor, make_audio_path):
         """Test audio metadata extraction fails when no audio stream."""
         # Create dummy file
-        mock_audio_path.parent.mkdir(parents=True, exist_ok=True)
-        mock_audio_path.touch()
+        mock_audio_path = make_audio_path()
 
-        mock_ffmpeg.probe.return_value = {
+        patched_ffmpeg.probe.return_value = {
             'format': {'duration': '60.0', 'size': '1920000'},
             'streams': []  # No streams
         }
@@ -726,13 +517,11 @@ class TestEdgeCasesAndErrorPaths:
         with pytest.raises(RuntimeError, match="No audio stream found in WAV file"):
             audio_extractor._get_audio_metadata(mock_audio_path)
 
-    @patch('src.modules.audio.ffmpeg')
-    def test_audio_metadata_extraction_failure(self, mock_ffmpeg, audio_extractor, mock_audio_path):
+    def test_audio_metadata_extraction_failure(self, patched_ffmpeg, audio_extractor, make_audio_path):
         """Test audio metadata extraction handles failures."""
-        mock_audio_path.parent.mkdir(parents=True, exist_ok=True)
-        mock_audio_path.touch()
+        mock_audio_path = make_audio_path()
 
-        mock_ffmpeg.probe.side_effect = Exception("Audio probe failed")
+        patched_ffmpeg.probe.side_effect = Exception("Audio probe failed")
 
         with pytest.raises(RuntimeError, match="Audio metadata extraction failed"):
             audio_extractor._get_audio_metadata(mock_audio_path)
@@ -13,18 +13,84 @@ Test Coverage:
     - Edge cases and error handling
 """
 
-import json
+import logging
+import re
 from pathlib import Path
+from typing import List, Set, Tuple
 
 import pytest
 
 from src.config import Config, BrandConfig, CaptionConfig, BRollConfig, AudioConfig, ExportConfig
 from src.modules.captions import CaptionGenerator, CaptionError
+from src.utils.json_utils import json_dumps
 
+# SRT timing line, capturing the start and end timestamps
+SRT_TS_RE = re.compile(r"(\d{2}:\d{2}:\d{2},\d{3}) --> (\d{2}:\d{2}:\d{2},\d{3})")
 
-@pytest.fixture
+
+def _write_json(tmp_path: Path, data: dict, name: str = "alignment.json") -> Path:
+    """Write alignment data as UTF-8 JSON in a single write call."""
+    json_path = tmp_path / name
+    json_path.write_bytes(json_dumps(data))
+    return json_path
+
+
+def _srt_to_ms(timestamp: str) -> int:
+    """Convert an SRT timestamp (HH:MM:SS,mmm) to integer milliseconds."""
+    hours, minutes, rest = timestamp.split(":")
+    seconds, millis = rest.split(",")
+    return ((int(hours) * 60 + int(minutes)) * 60 + int(seconds)) * 1000 + int(millis)
+
+
+def _split_srt(text: str) -> Tuple[str, List[str], Set[str]]:
+    """
+    Split SRT text once for assertions.
+
+    Returns:
+        Tuple of (text, lines, set of lines) so exact-line checks are
+        set lookups instead of substring scans
+    """
+    lines = text.splitlines()
+    return text, lines, set(lines)
+
+
+def _read_srt_head(path: Path, n_lines: int = 8) -> List[str]:
+    """Read only the first n_lines of an SRT file, without line endings."""
+    head = []
+    with path.open("r", encoding="utf-8") as f:
+        for _ in range(n_lines):
+            line = f.readline()
+            if not line:
+                break
+            head.append(line.rstrip("\n"))
+    return head
+
+
+def _load_srt(path: Path) -> Tuple[str, List[str], Set[str]]:
+    """Read an SRT file and split it (see _split_srt)."""
+    return _split_srt(path.read_text(encoding="utf-8"))
+
+
+# File contents for each invalid alignment input (None = file not created),
+# written as "<kind>.json" by the bad_json_files fixture
+_BAD_ALIGNMENT_FILES = {
+    "missing": None,
+    "empty": b"",
+    "bad_json": b"not valid json{",
+    "no_words_field": json_dumps({"coverage": 1.0}),
+    "empty_words": json_dumps({"words": []}),
+    "malformed_words": json_dumps({
+        "words": [
+            {"word": "hello"},  # Missing start and end
+            {"start": 0.0, "end": 0.5},  # Missing word
+        ]
+    }),
+}
+
+
+@pytest.fixture(scope="session")
 def sample_config():
-    """Create sample configuration."""
+    """Create sample configuration (shared; tests must not mutate it)."""
     return Config(
         brand=BrandConfig(name="Test Brand"),
         captions=CaptionConfig(),
@@ -34,9 +100,9 @@ def sample_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_alignment_data():
-    """Create sample alignment JSON data."""
+    """Create sample alignment JSON data (shared; tests must not mutate it)."""
     return {
         "words": [
             {"word": "Hello", "start": 0.0, "end": 0.5},
@@ -50,13 +116,64 @@ def sample_alignment_data():
     }
 
 
+@pytest.fixture(scope="module")
+def generator(sample_config):
+    """CaptionGenerator built from the shared sample configuration."""
+    return CaptionGenerator(sample_config)
+
+
 @pytest.fixture
-def alignment_json_file(tmp_path, sample_alignment_data):
-    """Create temporary alignment JSON file."""
-    json_path = tmp_path / "alignment.json"
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(sample_alignment_data, f)
-    return json_path
+def srt_capture(monkeypatch):
+    """
+    Record SRT text as CaptionGenerator writes it.
+
+    Wraps Path.write_text, so the file is still written but tests can
+    assert on captured["text"] instead of reading it back.
+    """
+    captured = {}
+    real_write_text = Path.write_text
+
+    def spy(self, data, *args, **kwargs):
+        if self.suffix == ".srt":
+            captured["text"] = data
+        return real_write_text(self, data, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "write_text", spy)
+    return captured
+
+
+@pytest.fixture(scope="session")
+def shared_alignment_file(tmp_path_factory, sample_alignment_data):
+    """Sample alignment JSON written once; tests must only read it."""
+    return _write_json(tmp_path_factory.mktemp("align"), sample_alignment_data)
+
+
+@pytest.fixture(scope="session")
+def bad_json_files(tmp_path_factory):
+    """Directory with every _BAD_ALIGNMENT_FILES entry, written once."""
+    base = tmp_path_factory.mktemp("bad")
+    for kind, content in _BAD_ALIGNMENT_FILES.items():
+        if content is not None:
+            (base / f"{kind}.json").write_bytes(content)
+    return base
+
+
+@pytest.fixture(scope="module")
+def single_word_srt(generator, shared_alignment_file, tmp_path_factory):
+    """
+    Run one-word-per-caption generation on the sample data once per module.
+
+    Returns:
+        Tuple of (ProcessorResult, SRT lines, set of SRT lines)
+    """
+    result = generator.process(
+        shared_alignment_file,
+        tmp_path_factory.mktemp("captions") / "captions.srt",
+        words_per_caption=1,
+        merge_short_words=False,
+    )
+    _, lines, line_set = _load_srt(result.output_path)
+    return result, lines, line_set
 
 
 class TestCaptionGeneratorInitialization:
@@ -82,76 +199,55 @@ class TestCaptionGeneratorInitialization:
 class TestSingleWordCaptions:
     """Test single-word caption generation (viral karaoke effect)."""
 
-    def test_one_word_per_caption(self, sample_config, alignment_json_file, tmp_path):
+    def test_one_word_per_caption(self, single_word_srt):
         """Test generating one word per caption."""
-        generator = CaptionGenerator(sample_config)
-        output_path = tmp_path / "captions.srt"
-
-        result = generator.process(
-            alignment_json_file,
-            output_path,
-            words_per_caption=1,
-            merge_short_words=False,
-        )
+        result, lines, line_set = single_word_srt
 
         # Verify result
         assert result.success is True
-        assert result.output_path == output_path
-        assert output_path.exists()
+        assert result.output_path.name == "captions.srt"
+        assert result.output_path.exists()
 
         # Verify metadata
         assert result.metadata["caption_count"] == 5  # 5 words = 5 captions
         assert result.metadata["words_per_caption"] == 1
 
         # Verify SRT content
-        srt_content = output_path.read_text(encoding="utf-8")
-        assert "Hello" in srt_content
-        assert "world" in srt_content
-        assert "amazing" in srt_content
+        assert "Hello" in line_set
+        assert "world" in line_set
+        assert "amazing" in line_set
 
         # Verify SRT format
-        lines = srt_content.strip().split("\n")
-        assert lines[0] == "1"  # First caption number
-        assert " --> " in lines[1]  # Timestamp line
-        assert lines[2] == "Hello"  # Caption text
+        number, timestamp, text = lines[:3]
+        assert number == "1"  # First caption number
+        assert SRT_TS_RE.fullmatch(timestamp)  # Timestamp line
+        assert text == "Hello"  # Caption text
 
-    def test_srt_format_correctness(self, sample_config, alignment_json_file, tmp_path):
+    def test_srt_format_correctness(self, single_word_srt):
         """Test that SRT file has correct format."""
-        generator = CaptionGenerator(sample_config)
-        output_path = tmp_path / "captions.srt"
-
-        result = generator.process(
-            alignment_json_file,
-            output_path,
-            words_per_caption=1,
-            merge_short_words=False,
-        )
-
-        srt_content = output_path.read_text(encoding="utf-8")
-        lines = srt_content.strip().split("\n")
+        result, _, _ = single_word_srt
 
-        # Verify structure for first caption
-        assert lines[0] == "1"  # Caption number
-        assert lines[1] == "00:00:00,000 --> 00:00:00,500"  # Timestamp
-        assert lines[2] == "Hello"  # Text
-        assert lines[3] == ""  # Blank line separator
-
-        # Verify structure for second caption
-        assert lines[4] == "2"  # Caption number
-        assert lines[5] == "00:00:00,500 --> 00:00:01,000"  # Timestamp
-        assert lines[6] == "world"  # Text
+        # Number, timestamp, text, blank separator; then the second caption
+        assert _read_srt_head(result.output_path, 7) == [
+            "1",
+            "00:00:00,000 --> 00:00:00,500",
+            "Hello",
+            "",
+            "2",
+            "00:00:00,500 --> 00:00:01,000",
+            "world",
+        ]
 
 
 class TestMultiWordCaptions:
     """Test multi-word caption generation."""
 
-    def test_three_words_per_caption(self, sample_config, alignment_json_file, tmp_path):
+    def test_three_words_per_caption(self, generator, sample_alignment_data, tmp_path, srt_capture):
         """Test generating captions with 3 words each."""
-        generator = CaptionGenerator(sample_config)
         output_path = tmp_path / "captions.srt"
 
-        result = generator.process(
-            alignment_json_file,
+        result = generator.process_words(
+            sample_alignment_data["words"],
             output_path,
             words_per_caption=3,
             merge_short_words=False,
@@ -162,17 +258,16 @@ class TestMultiWordCaptions:
         assert result.metadata["words_per_caption"] == 3
 
         # Verify SRT content
-        srt_content = output_path.read_text(encoding="utf-8")
-        assert "Hello world this" in srt_content
-        assert "is amazing" in srt_content
+        _, _, line_set = _split_srt(srt_capture["text"])
+        assert "Hello world this" in line_set
+        assert "is amazing" in line_set
 
-    def test_two_words_per_caption(self, sample_config, alignment_json_file, tmp_path):
+    def test_two_words_per_caption(self, generator, sample_alignment_data, tmp_path, srt_capture):
         """Test generating captions with 2 words each."""
-        generator = CaptionGenerator(sample_config)
         output_path = tmp_path / "captions.srt"
 
-        result = generator.process(
-            alignment_json_file,
+        result = generator.process_words(
+            sample_alignment_data["words"],
             output_path,
             words_per_caption=2,
             merge_short_words=False,
@@ -181,23 +276,24 @@ class TestMultiWordCaptions:
         # 5 words / 2 words per caption = 3 captions (2 + 2 + 1)
         assert result.metadata["caption_count"] == 3
 
-        srt_content = output_path.read_text(encoding="utf-8")
-        assert "Hello world" in srt_content
-        assert "this is" in srt_content
-        assert "amazing" in srt_content  # Last word alone
+        _, _, line_set = _split_srt(srt_capture["text"])
+        assert "Hello world" in line_set
+        assert "this is" in line_set
+        assert "amazing" in line_set  # Last word alone
 
 
 class TestShortWordMerging:
     """Test merging of very short words."""
 
-    def test_merge_short_words_enabled(self, sample_config, alignment_json_file, tmp_path):
+    def test_merge_short_words_enabled(
+        self, generator, sample_alignment_data, tmp_path, srt_capture
+    ):
         """Test that short words (<150ms) are merged with next word."""
-        generator = CaptionGenerator(sample_config)
         output_path = tmp_path / "captions.srt"
 
         # "is" has duration of 100ms (1.4 - 1.3), should be merged with "amazing"
-        result = generator.process(
-            alignment_json_file,
+        result = generator.process_words(
+            sample_alignment_data["words"],
             output_path,
             words_per_caption=1,
             merge_short_words=True,
@@ -208,86 +304,58 @@ class TestShortWordMerging:
         assert result.metadata["merged"] is True
 
         # Verify "is" was merged with "amazing"
-        srt_content = output_path.read_text(encoding="utf-8")
-        assert "is amazing" in srt_content
+        _, _, line_set = _split_srt(srt_capture["text"])
+        assert "is amazing" in line_set
 
-    def test_merge_short_words_disabled(self, sample_config, alignment_json_file, tmp_path):
+    def test_merge_short_words_disabled(self, single_word_srt):
         """Test that short words are not merged when disabled."""
-        generator = CaptionGenerator(sample_config)
-        output_path = tmp_path / "captions.srt"
-
-        result = generator.process(
-            alignment_json_file,
-            output_path,
-            words_per_caption=1,
-            merge_short_words=False,
-        )
+        result, _, line_set = single_word_srt
 
         # All 5 words remain separate
         assert result.metadata["caption_count"] == 5
         assert result.metadata["merged"] is False
 
         # Verify "is" appears as separate caption
-        srt_content = output_path.read_text(encoding="utf-8")
-        lines = srt_content.split("\n")
-        assert "is" in lines  # "is" on its own line
+        assert "is" in line_set  # "is" on its own line
 
-    def test_merge_preserves_capitalization(self, sample_config, tmp_path):
+    def test_merge_preserves_capitalization(self, generator, tmp_path, srt_capture):
         """Test that merging preserves original capitalization."""
         # Create alignment with short word that needs capitalization
-        alignment_data = {
-            "words": [
-                {"word": "The", "start": 0.0, "end": 0.1},  # Short word
-                {"word": "AI", "start": 0.1, "end": 0.5},  # Should stay capitalized
-                {"word": "works", "start": 0.5, "end": 1.0},
-            ],
-            "coverage": 1.0,
-            "word_count": 3,
-        }
-
-        json_path = tmp_path / "alignment.json"
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(alignment_data, f)
+        words = [
+            {"word": "The", "start": 0.0, "end": 0.1},  # Short word
+            {"word": "AI", "start": 0.1, "end": 0.5},  # Should stay capitalized
+            {"word": "works", "start": 0.5, "end": 1.0},
+        ]
 
-        generator = CaptionGenerator(sample_config)
         output_path = tmp_path / "captions.srt"
 
-        result = generator.process(
-            json_path,
+        result = generator.process_words(
+            words,
             output_path,
             words_per_caption=1,
             merge_short_words=True,
         )
 
-        srt_content = output_path.read_text(encoding="utf-8")
-        assert "The AI" in srt_content  # Capitalization preserved
+        _, _, line_set = _split_srt(srt_capture["text"])
+        assert "The AI" in line_set  # Capitalization preserved
 
 
 class TestMinimumDuration:
     """Test minimum duration enforcement."""
 
-    def test_enforce_min_duration_200ms(self, sample_config, tmp_path):
+    def test_enforce_min_duration_200ms(self, generator, tmp_path, srt_capture):
         """Test that captions shorter than 200ms are extended."""
         # Create alignment with very short words
-        alignment_data = {
-            "words": [
-                {"word": "I", "start": 0.0, "end": 0.05},  # 50ms - too short
-                {"word": "am", "start": 0.05, "end": 0.15},  # 100ms - too short
-                {"word": "good", "start": 0.15, "end": 0.5},  # 350ms - OK
-            ],
-            "coverage": 1.0,
-            "word_count": 3,
-        }
-
-        json_path = tmp_path / "alignment.json"
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(alignment_data, f)
+        words = [
+            {"word": "I", "start": 0.0, "end": 0.05},  # 50ms - too short
+            {"word": "am", "start": 0.05, "end": 0.15},  # 100ms - too short
+            {"word": "good", "start": 0.15, "end": 0.5},  # 350ms - OK
+        ]
 
-        generator = CaptionGenerator(sample_config)
         output_path = tmp_path / "captions.srt"
 
-        result = generator.process(
-            json_path,
+        result = generator.process_words(
+            words,
             output_path,
             words_per_caption=1,
             merge_short_words=False,
@@ -296,38 +364,28 @@ class TestMinimumDuration:
 
         assert result.success is True
 
-        # Parse SRT to verify durations
-        srt_content = output_path.read_text(encoding="utf-8")
-        lines = srt_content.split("\n")
+        # Parse SRT timings to milliseconds
+        timings = [
+            (_srt_to_ms(start), _srt_to_ms(end))
+            for start, end in SRT_TS_RE.findall(srt_capture["text"])
+        ]
 
-        # First caption should be extended to 200ms
-        # 00:00:00,000 --> 00:00:00,200
-        timestamp_line = lines[1]
-        start, end = timestamp_line.split(" --> ")
-        # End should be at least 200ms after start
-        assert "00:00:00,200" in end or "00:00:00,050" in end  # Either extended or kept as is
+        # First caption is extended to 200ms, but never past the next start
+        (start_ms, end_ms), (next_start_ms, _) = timings[:2]
+        assert end_ms == min(start_ms + 200, next_start_ms)
 
-    def test_min_duration_doesnt_overlap(self, sample_config, tmp_path):
+    def test_min_duration_doesnt_overlap(self, generator, tmp_path, srt_capture):
         """Test that enforcing min duration doesn't create overlaps."""
         # Create alignment where extending would cause overlap
-        alignment_data = {
-            "words": [
-                {"word": "a", "start": 0.0, "end": 0.05},  # 50ms - would extend to 0.2
-                {"word": "b", "start": 0.1, "end": 0.5},  # Starts at 0.1
-            ],
-            "coverage": 1.0,
-            "word_count": 2,
-        }
-
-        json_path = tmp_path / "alignment.json"
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(alignment_data, f)
+        words = [
+            {"word": "a", "start": 0.0, "end": 0.05},  # 50ms - would extend to 0.2
+            {"word": "b", "start": 0.1, "end": 0.5},  # Starts at 0.1
+        ]
 
-        generator = CaptionGenerator(sample_config)
         output_path = tmp_path / "captions.srt"
 
-        result = generator.process(
-            json_path,
+        result = generator.process_words(
+            words,
             output_path,
             words_per_caption=1,
             merge_short_words=False,
@@ -338,49 +396,35 @@ class TestMinimumDuration:
         # The validation should pass without overlap errors
         assert result.success is True
 
+        # "a" is extended only up to the start of "b" (100ms)
+        (_, first_end), (second_start, _) = SRT_TS_RE.findall(srt_capture["text"])
+        assert _srt_to_ms(first_end) == _srt_to_ms(second_start) == 100
+
 
 class TestTimestampValidation:
     """Test timestamp validation and error detection."""
 
-    def test_validate_normal_captions(self, sample_config, alignment_json_file, tmp_path):
+    def test_validate_normal_captions(self, single_word_srt):
         """Test that valid captions pass validation."""
-        generator = CaptionGenerator(sample_config)
-        output_path = tmp_path / "captions.srt"
-
-        result = generator.process(
-            alignment_json_file,
-            output_path,
-            words_per_caption=1,
-            merge_short_words=False,
-        )
+        result, _, _ = single_word_srt
 
         assert result.success is True
         # Normal captions should pass without validation warnings
 
-    def test_detect_overlapping_captions(self, sample_config, tmp_path, caplog):
+    def test_detect_overlapping_captions(self, generator, tmp_path, caplog):
         """Test detection of overlapping caption timestamps."""
-        import logging
         caplog.set_level(logging.WARNING)
 
         # Create alignment with overlap
-        alignment_data = {
-            "words": [
-                {"word": "word1", "start": 0.0, "end": 1.0},
-                {"word": "word2", "start": 0.8, "end": 1.5},  # Overlaps with word1
-            ],
-            "coverage": 1.0,
-            "word_count": 2,
-        }
-
-        json_path = tmp_path / "alignment.json"
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(alignment_data, f)
+        words = [
+            {"word": "word1", "start": 0.0, "end": 1.0},
+            {"word": "word2", "start": 0.8, "end": 1.5},  # Overlaps with word1
+        ]
 
-        generator = CaptionGenerator(sample_config)
         output_path = tmp_path / "captions.srt"
 
-        result = generator.process(
-            json_path,
+        result = generator.process_words(
+            words,
             output_path,
             words_per_caption=1,
             merge_short_words=False,
@@ -388,32 +432,22 @@ class TestTimestampValidation:
 
         # Should still succeed but log warning
         assert result.success is True
-        assert any("overlap" in record.message.lower() for record in caplog.records)
+        assert "overlap" in caplog.text.lower()
 
-    def test_detect_large_gaps(self, sample_config, tmp_path, caplog):
+    def test_detect_large_gaps(self, generator, tmp_path, caplog):
         """Test detection of large gaps between captions."""
-        import logging
         caplog.set_level(logging.WARNING)
 
         # Create alignment with large gap
-        alignment_data = {
-            "words": [
-                {"word": "word1", "start": 0.0, "end": 0.5},
-                {"word": "word2", "start": 3.0, "end": 3.5},  # 2.5s gap
-            ],
-            "coverage": 1.0,
-            "word_count": 2,
-        }
-
-        json_path = tmp_path / "alignment.json"
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(alignment_data, f)
+        words = [
+            {"word": "word1", "start": 0.0, "end": 0.5},
+            {"word": "word2", "start": 3.0, "end": 3.5},  # 2.5s gap
+        ]
 
-        generator = CaptionGenerator(sample_config)
         output_path = tmp_path / "captions.srt"
 
-        result = generator.process(
-            json_path,
+        result = generator.process_words(
+            words,
             output_path,
             words_per_caption=1,
             merge_short_words=False,
@@ -421,89 +455,30 @@ class TestTimestampValidation:
 
         # Should succeed but log warning
         assert result.success is True
-        assert any("large gap" in record.message.lower() for record in caplog.records)
+        assert "large gap" in caplog.text.lower()
 
 
 class TestInputValidation:
     """Test input validation before caption generation."""
 
-    def test_validate_missing_file(self, sample_config, tmp_path):
-        """Test validation fails for missing file."""
-        generator = CaptionGenerator(sample_config)
-        missing_path = tmp_path / "missing.json"
-
-        errors = generator.validate(missing_path)
-
-        assert len(errors) > 0
-        assert any("not found" in err.lower() for err in errors)
-
-    def test_validate_empty_file(self, sample_config, tmp_path):
-        """Test validation fails for empty file."""
-        generator = CaptionGenerator(sample_config)
-        empty_path = tmp_path / "empty.json"
-        empty_path.write_text("", encoding="utf-8")
-
-        errors = generator.validate(empty_path)
-
-        assert len(errors) > 0
-        assert any("empty" in err.lower() for err in errors)
-
-    def test_validate_invalid_json(self, sample_config, tmp_path):
-        """Test validation fails for invalid JSON."""
-        generator = CaptionGenerator(sample_config)
-        bad_json = tmp_path / "bad.json"
-        bad_json.write_text("not valid json{", encoding="utf-8")
-
-        errors = generator.validate(bad_json)
-
-        assert len(errors) > 0
-        assert any("json" in err.lower() for err in errors)
-
-    def test_validate_missing_words_field(self, sample_config, tmp_path):
-        """Test validation fails when 'words' field is missing."""
-        generator = CaptionGenerator(sample_config)
-        bad_data = tmp_path / "no_words.json"
-        with open(bad_data, "w", encoding="utf-8") as f:
-            json.dump({"coverage": 1.0}, f)
-
-        errors = generator.validate(bad_data)
-
-        assert len(errors) > 0
-        assert any("words" in err.lower() for err in errors)
-
-    def test_validate_empty_words_list(self, sample_config, tmp_path):
-        """Test validation fails for empty words list."""
-        generator = CaptionGenerator(sample_config)
-        empty_words = tmp_path / "empty_words.json"
-        with open(empty_words, "w", encoding="utf-8") as f:
-            json.dump({"words": []}, f)
-
-        errors = generator.validate(empty_words)
+    @pytest.mark.parametrize("kind,expected", [
+        ("missing", "not found"),
+        ("empty", "empty"),
+        ("bad_json", "json"),
+        ("no_words_field", "words"),
+        ("empty_words", "no words"),
+        ("malformed_words", "missing field"),
+    ])
+    def test_validate_errors(self, generator, bad_json_files, kind, expected):
+        """Test validation reports each kind of bad alignment file."""
+        errors = generator.validate(bad_json_files / f"{kind}.json")
 
         assert len(errors) > 0
-        assert any("no words" in err.lower() for err in errors)
+        assert any(expected in err.lower() for err in errors)
 
-    def test_validate_malformed_word_entry(self, sample_config, tmp_path):
-        """Test validation fails for malformed word entries."""
-        generator = CaptionGenerator(sample_config)
-        bad_words = tmp_path / "bad_words.json"
-        with open(bad_words, "w", encoding="utf-8") as f:
-            json.dump({
-                "words": [
-                    {"word": "hello"},  # Missing start and end
-                    {"start": 0.0, "end": 0.5},  # Missing word
-                ]
-            }, f)
-
-        errors = generator.validate(bad_words)
-
-        assert len(errors) > 0
-
-    def test_validate_valid_alignment(self, sample_config, alignment_json_file):
+    def test_validate_valid_alignment(self, generator, shared_alignment_file):
         """Test validation passes for valid alignment file."""
-        generator = CaptionGenerator(sample_config)
-
-        errors = generator.validate(alignment_json_file)
+        errors = generator.validate(shared_alignment_file)
 
         assert len(errors) == 0
 
@@ -511,13 +486,9 @@ class TestInputValidation:
 class TestErrorHandling:
     """Test error handling in caption generation."""
 
-    def test_missing_words_field_raises_error(self, sample_config, tmp_path):
+    def test_missing_words_field_raises_error(self, generator, bad_json_files, tmp_path):
         """Test error when alignment JSON missing 'words' field."""
-        bad_json = tmp_path / "no_words.json"
-        with open(bad_json, "w", encoding="utf-8") as f:
-            json.dump({"coverage": 1.0}, f)
-
-        generator = CaptionGenerator(sample_config)
+        bad_json = bad_json_files / "no_words_field.json"
         output_path = tmp_path / "captions.srt"
 
         with pytest.raises(CaptionError) as exc_info:
@@ -525,13 +496,9 @@ class TestErrorHandling:
 
         assert "missing 'words' field" in str(exc_info.value)
 
-    def test_empty_words_list_raises_error(self, sample_config, tmp_path):
+    def test_empty_words_list_raises_error(self, generator, bad_json_files, tmp_path):
         """Test error when words list is empty."""
-        empty_words = tmp_path / "empty.json"
-        with open(empty_words, "w", encoding="utf-8") as f:
-            json.dump({"words": []}, f)
-
-        generator = CaptionGenerator(sample_config)
+        empty_words = bad_json_files / "empty_words.json"
         output_path = tmp_path / "captions.srt"
 
         with pytest.raises(CaptionError) as exc_info:
@@ -539,49 +506,39 @@ class TestErrorHandling:
 
         assert "no words found" in str(exc_info.value).lower()
 
+    def test_process_words_leaves_input_unchanged(self, generator, tmp_path):
+        """Test process_words() doesn't modify the caller's word dicts."""
+        words = [
+            {"word": "a", "start": 0.0, "end": 0.05},  # Merged and extended
+            {"word": "b", "start": 0.05, "end": 0.1},
+        ]
+        original = [dict(w) for w in words]
 
-class TestSRTTimeFormatting:
-    """Test SRT timestamp formatting."""
+        generator.process_words(words, tmp_path / "captions.srt", merge_short_words=True)
 
-    def test_format_zero_seconds(self, sample_config):
-        """Test formatting 0 seconds."""
-        generator = CaptionGenerator(sample_config)
-        formatted = generator._format_srt_time(0.0)
-        assert formatted == "00:00:00,000"
+        assert words == original
 
-    def test_format_fractional_seconds(self, sample_config):
-        """Test formatting fractional seconds."""
-        generator = CaptionGenerator(sample_config)
-        formatted = generator._format_srt_time(1.234)
-        assert formatted == "00:00:01,234"
 
-    def test_format_minutes(self, sample_config):
-        """Test formatting time with minutes."""
-        generator = CaptionGenerator(sample_config)
-        formatted = generator._format_srt_time(65.5)  # 1 min 5.5 sec
-        assert formatted == "00:01:05,500"
+class TestSRTTimeFormatting:
+    """Test SRT timestamp formatting."""
 
-    def test_format_hours(self, sample_config):
-        """Test formatting time with hours."""
-        generator = CaptionGenerator(sample_config)
-        formatted = generator._format_srt_time(3661.123)  # 1 hour 1 min 1.123 sec
-        assert formatted == "01:01:01,123"
+    @pytest.mark.parametrize("seconds,expected", [
+        (0.0, "00:00:00,000"),
+        (1.234, "00:00:01,234"),     # Fractional seconds
+        (65.5, "00:01:05,500"),      # 1 min 5.5 sec
+        (3661.123, "01:01:01,123"),  # 1 hour 1 min 1.123 sec
+    ])
+    def test_format_srt_time(self, generator, seconds, expected):
+        """Test formatting seconds as an SRT timestamp."""
+        assert generator._format_srt_time(seconds) == expected
 
 
 class TestMetadata:
     """Test metadata in ProcessorResult."""
 
-    def test_metadata_fields(self, sample_config, alignment_json_file, tmp_path):
+    def test_metadata_fields(self, single_word_srt):
         """Test that result metadata contains expected fields."""
-        generator = CaptionGenerator(sample_config)
-        output_path = tmp_path / "captions.srt"
-
-        result = generator.process(
-            alignment_json_file,
-            output_path,
-            words_per_caption=1,
-            merge_short_words=False,
-        )
+        result, _, _ = single_word_srt
 
         # Verify metadata
         assert "caption_count" in result.metadata
@@ -600,34 +557,25 @@ class TestMetadata:
 class TestUTF8Support:
     """Test UTF-8 character support in captions."""
 
-    def test_utf8_characters_in_captions(self, sample_config, tmp_path):
+    def test_utf8_characters_in_captions(self, generator, tmp_path, srt_capture):
         """Test that UTF-8 characters are preserved in captions."""
         # Create alignment with UTF-8 characters
-        alignment_data = {
-            "words": [
-                {"word": "Bonjour", "start": 0.0, "end": 0.5},
-                {"word": "café", "start": 0.5, "end": 1.0},
-                {"word": "naïve", "start": 1.0, "end": 1.5},
-            ],
-            "coverage": 1.0,
-            "word_count": 3,
-        }
-
-        json_path = tmp_path / "alignment.json"
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(alignment_data, f, ensure_ascii=False)
+        words = [
+            {"word": "Bonjour", "start": 0.0, "end": 0.5},
+            {"word": "café", "start": 0.5, "end": 1.0},
+            {"word": "naïve", "start": 1.0, "end": 1.5},
+        ]
 
-        generator = CaptionGenerator(sample_config)
         output_path = tmp_path / "captions.srt"
 
-        result = generator.process(
-            json_path,
+        result = generator.process_words(
+            words,
             output_path,
             words_per_caption=1,
             merge_short_words=False,
         )
 
         # Verify UTF-8 characters preserved
-        srt_content = output_path.read_text(encoding="utf-8")
-        assert "café" in srt_content
-        assert "naïve" in srt_content
+        _, _, line_set = _split_srt(srt_capture["text"])
+        assert "café" in line_set
+        assert "naïve" in line_set
@@ -0,0 +1,113 @@
+"""
+Unit Tests for CLI Helper Utilities
+
+Tests input validation, single-pass batch validation of an input
+directory and stage progress events.
+"""
+
+import json
+import logging
+import os
+import queue
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.cli_helpers import bulk_validate, print_stage_header, validate_inputs
+from src.utils.logging import PROGRESS_LOGGER_NAME, attach_progress_queue
+from src.utils.validation import ERR_NOT_FOUND
+
+
+class _EntryList(list):
+    """List of directory entries usable like an os.scandir iterator."""
+
+    def __enter__(self):
+        return iter(self)
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class TestValidateInputs:
+    """Test validate_inputs()."""
+
+    def test_sees_file_created_after_failure(self, tmp_path):
+        """Test a "not found" result isn't kept between calls."""
+        script = tmp_path / "script.txt"
+        assert validate_inputs(script_path=script) == [
+            f"Script file {ERR_NOT_FOUND}: {script}"
+        ]
+
+        script.write_text("Hello world", encoding="utf-8")
+        assert validate_inputs(script_path=script) == []
+
+
+class TestBulkValidate:
+    """Test bulk_validate()."""
+
+    def test_pairs_videos_with_scripts(self, tmp_path):
+        """Test single-pass directory validation for batch mode."""
+        (tmp_path / "good.mp4").write_bytes(b'dummy video')
+        (tmp_path / "good.txt").write_text("This is a test script.")
+        (tmp_path / "empty_script.mp4").write_bytes(b'dummy video')
+        (tmp_path / "empty_script.txt").write_text("")
+        (tmp_path / "no_script.mov").write_bytes(b'dummy video')
+        (tmp_path / "notes.md").write_text("ignored")
+
+        results = bulk_validate(tmp_path)
+
+        assert set(results) == {
+            tmp_path / "good.mp4",
+            tmp_path / "empty_script.mp4",
+            tmp_path / "no_script.mov",
+        }
+        assert results[tmp_path / "good.mp4"] == []
+        assert any('empty' in err.lower() for err in results[tmp_path / "empty_script.mp4"])
+        assert any(ERR_NOT_FOUND in err.lower() for err in results[tmp_path / "no_script.mov"])
+
+
+    @pytest.mark.parametrize("reverse", [False, True], ids=["sorted", "reversed"])
+    def test_script_extension_priority(self, tmp_path, reverse):
+        """Test the pairing follows SCRIPT_EXTENSIONS, not directory order."""
+        (tmp_path / "clip.mp4").write_bytes(b'dummy video')
+        (tmp_path / "clip.txt").write_text("This is a test script.")
+        (tmp_path / "clip.json").write_text("")
+
+        real_scandir = os.scandir
+
+        def ordered_scandir(path):
+            with real_scandir(path) as it:
+                entries = sorted(it, key=lambda e: e.name, reverse=reverse)
+            return _EntryList(entries)
+
+        with patch("src.utils.cli_helpers.os.scandir", ordered_scandir):
+            results = bulk_validate(tmp_path)
+
+        # clip.txt outranks the empty clip.json wherever it is listed
+        assert results == {tmp_path / "clip.mp4": []}
+
+class TestProgressEvents:
+    """Test progress events emitted by print_stage_header()."""
+
+    def test_progress_events_via_queue(self):
+        """Test stage headers emit JSON progress events to an attached queue."""
+        events = queue.Queue()
+        attach_progress_queue(events)
+        try:
+            print_stage_header(2, 7, "Force Alignment")
+            record = events.get_nowait()
+        finally:
+            logging.getLogger(PROGRESS_LOGGER_NAME).handlers.clear()
+
+        assert json.loads(record.getMessage()) == {
+            "event": "stage_start", "n": 2, "of": 7, "name": "Force Alignment"
+        }
+
+    def test_no_serialization_without_consumer(self):
+        """Test events aren't serialized while only the NullHandler is attached."""
+        logging.getLogger(PROGRESS_LOGGER_NAME).handlers.clear()
+
+        with patch("src.utils.cli_helpers.json.dumps") as mock_dumps:
+            print_stage_header(1, 7, "Audio Extraction")
+
+        mock_dumps.assert_not_called()
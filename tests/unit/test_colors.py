@@ -4,9 +4,13 @@ Unit Tests for Color Utilities
 Tests RGB ↔ BGR conversion and WCAG contrast calculations.
 """
 
+import math
+
 import pytest
 
 from src.utils.colors import (
+    ASS_COLORS,
+    COLORS,
     ass_bgr_to_hex,
     calculate_contrast_ratio,
     hex_to_ass_bgr,
@@ -18,25 +22,16 @@ from src.utils.colors import (
 class TestHexToRGB:
     """Test hex_to_rgb() function."""
 
-    def test_full_hex_white(self):
-        """Test converting white (#FFFFFF) to RGB."""
-        assert hex_to_rgb("#FFFFFF") == (255, 255, 255)
-
-    def test_full_hex_black(self):
-        """Test converting black (#000000) to RGB."""
-        assert hex_to_rgb("#000000") == (0, 0, 0)
-
-    def test_full_hex_red(self):
-        """Test converting red (#FF0000) to RGB."""
-        assert hex_to_rgb("#FF0000") == (255, 0, 0)
-
-    def test_full_hex_green(self):
-        """Test converting green (#00FF00) to RGB."""
-        assert hex_to_rgb("#00FF00") == (0, 255, 0)
-
-    def test_full_hex_blue(self):
-        """Test converting blue (#0000FF) to RGB."""
-        assert hex_to_rgb("#0000FF") == (0, 0, 255)
+    @pytest.mark.parametrize("hex_color,rgb", [
+        ("#FFFFFF", (255, 255, 255)),
+        ("#000000", (0, 0, 0)),
+        ("#FF0000", (255, 0, 0)),
+        ("#00FF00", (0, 255, 0)),
+        ("#0000FF", (0, 0, 255)),
+    ])
+    def test_full_hex(self, hex_color, rgb):
+        """Test converting full hex (#RRGGBB) to RGB."""
+        assert hex_to_rgb(hex_color) == rgb
 
     def test_short_hex_format(self):
         """Test converting short hex (#RGB) to RGB."""
@@ -57,25 +52,29 @@ class TestHexToRGB:
         with pytest.raises(ValueError, match="Invalid hex color"):
             hex_to_rgb("#FFFFFFF")  # Too long
 
+    @pytest.mark.parametrize("hex_color", ["#GGGGGG", "#FF 000", "#FF_000", "#é00"])
+    def test_invalid_hex_characters(self, hex_color):
+        """Test error on non-hex characters."""
+        with pytest.raises(ValueError, match="Invalid hex color"):
+            hex_to_rgb(hex_color)
 
-class TestRGBToHex:
-    """Test rgb_to_hex() function."""
-
-    def test_white(self):
-        """Test converting white RGB to hex."""
-        assert rgb_to_hex(255, 255, 255) == "#FFFFFF"
+    def test_lowercase_hex(self):
+        """Test lowercase digits parse like uppercase."""
+        assert hex_to_rgb("#fe2c55") == (254, 44, 85)
 
-    def test_black(self):
-        """Test converting black RGB to hex."""
-        assert rgb_to_hex(0, 0, 0) == "#000000"
 
-    def test_red(self):
-        """Test converting red RGB to hex."""
-        assert rgb_to_hex(255, 0, 0) == "#FF0000"
+class TestRGBToHex:
+    """Test rgb_to_hex() function."""
 
-    def test_mixed_color(self):
-        """Test converting mixed RGB values."""
-        assert rgb_to_hex(128, 64, 32) == "#804020"
+    @pytest.mark.parametrize("rgb,hex_color", [
+        ((255, 255, 255), "#FFFFFF"),
+        ((0, 0, 0), "#000000"),
+        ((255, 0, 0), "#FF0000"),
+        ((128, 64, 32), "#804020"),  # Mixed values
+    ])
+    def test_conversion(self, rgb, hex_color):
+        """Test converting RGB values to hex."""
+        assert rgb_to_hex(*rgb) == hex_color
 
     def test_invalid_range_high(self):
         """Test error when RGB values exceed 255."""
@@ -91,28 +90,16 @@ class TestRGBToHex:
 class TestHexToASSBGR:
     """Test hex_to_ass_bgr() function."""
 
-    def test_white_opaque(self):
-        """Test white with no transparency."""
-        assert hex_to_ass_bgr("#FFFFFF") == "&H00FFFFFF"
-
-    def test_black_opaque(self):
-        """Test black with no transparency."""
-        assert hex_to_ass_bgr("#000000") == "&H00000000"
-
-    def test_red_bgr_conversion(self):
-        """Test red converts to BGR format correctly."""
-        # Red (#FF0000) should become &H000000FF (BGR = 0000FF)
-        assert hex_to_ass_bgr("#FF0000") == "&H000000FF"
-
-    def test_green_bgr_conversion(self):
-        """Test green converts to BGR format correctly."""
-        # Green (#00FF00) should become &H0000FF00 (BGR = 00FF00)
-        assert hex_to_ass_bgr("#00FF00") == "&H0000FF00"
-
-    def test_blue_bgr_conversion(self):
-        """Test blue converts to BGR format correctly."""
-        # Blue (#0000FF) should become &H00FF0000 (BGR = FF0000)
-        assert hex_to_ass_bgr("#0000FF") == "&H00FF0000"
+    @pytest.mark.parametrize("hex_color,ass_color", [
+        ("#FFFFFF", "&H00FFFFFF"),
+        ("#000000", "&H00000000"),
+        ("#FF0000", "&H000000FF"),  # Red: BGR = 0000FF
+        ("#00FF00", "&H0000FF00"),  # Green: BGR = 00FF00
+        ("#0000FF", "&H00FF0000"),  # Blue: BGR = FF0000
+    ])
+    def test_opaque_bgr_conversion(self, hex_color, ass_color):
+        """Test opaque colors convert to BGR order."""
+        assert hex_to_ass_bgr(hex_color) == ass_color
 
     def test_with_alpha_transparency(self):
         """Test adding alpha/transparency channel."""
@@ -132,36 +119,33 @@ class TestHexToASSBGR:
 class TestASSBGRToHex:
     """Test ass_bgr_to_hex() function."""
 
-    def test_white(self):
-        """Test converting ASS white to hex."""
-        assert ass_bgr_to_hex("&H00FFFFFF") == "#FFFFFF"
-
-    def test_black(self):
-        """Test converting ASS black to hex."""
-        assert ass_bgr_to_hex("&H00000000") == "#000000"
-
-    def test_red_bgr_to_rgb(self):
-        """Test converting ASS red (BGR) back to RGB hex."""
-        assert ass_bgr_to_hex("&H000000FF") == "#FF0000"
-
-    def test_green_bgr_to_rgb(self):
-        """Test converting ASS green (BGR) back to RGB hex."""
-        assert ass_bgr_to_hex("&H0000FF00") == "#00FF00"
-
-    def test_blue_bgr_to_rgb(self):
-        """Test converting ASS blue (BGR) back to RGB hex."""
-        assert ass_bgr_to_hex("&H00FF0000") == "#0000FF"
-
-    def test_with_transparency(self):
-        """Test ASS color with alpha channel."""
-        # Should ignore alpha and return RGB hex
-        assert ass_bgr_to_hex("&H80000000") == "#000000"
+    @pytest.mark.parametrize("ass_color,hex_color", [
+        ("&H00FFFFFF", "#FFFFFF"),
+        ("&H00000000", "#000000"),
+        ("&H000000FF", "#FF0000"),
+        ("&H0000FF00", "#00FF00"),
+        ("&H00FF0000", "#0000FF"),
+        ("&H80000000", "#000000"),  # Alpha is ignored
+    ])
+    def test_bgr_to_rgb(self, ass_color, hex_color):
+        """Test converting ASS BGR colors back to RGB hex."""
+        assert ass_bgr_to_hex(ass_color) == hex_color
 
     def test_invalid_format(self):
         """Test error on invalid ASS color format."""
         with pytest.raises(ValueError, match="Invalid ASS color"):
             ass_bgr_to_hex("&HFF")  # Too short
 
+    @pytest.mark.parametrize("ass_color", ["&H00GGGGGG", "&H +FFFFFF", "&H00FF_FFF", "00&HFFFFFF"])
+    def test_invalid_hex_digits(self, ass_color):
+        """Test error on non-hex digits or a misplaced &H prefix."""
+        with pytest.raises(ValueError, match="Invalid ASS color"):
+            ass_bgr_to_hex(ass_color)
+
+    def test_without_prefix(self):
+        """Test bare AABBGGRR digits are accepted."""
+        assert ass_bgr_to_hex("000000FF") == "#FF0000"
+
 
 class TestContrastRatio:
     """Test calculate_contrast_ratio() function."""
@@ -169,21 +153,21 @@ class TestContrastRatio:
     def test_black_white_max_contrast(self):
         """Test black/white has maximum contrast (21:1)."""
         ratio = calculate_contrast_ratio("#FFFFFF", "#000000")
-        assert ratio == pytest.approx(21.0, rel=0.01)
+        assert math.isclose(ratio, 21.0, rel_tol=0.01)
 
     def test_same_color_no_contrast(self):
         """Test same color has no contrast (1:1)."""
         ratio = calculate_contrast_ratio("#FFFFFF", "#FFFFFF")
-        assert ratio == pytest.approx(1.0, rel=0.01)
+        assert math.isclose(ratio, 1.0, rel_tol=0.01)
 
         ratio = calculate_contrast_ratio("#000000", "#000000")
-        assert ratio == pytest.approx(1.0, rel=0.01)
+        assert math.isclose(ratio, 1.0, rel_tol=0.01)
 
     def test_order_independent(self):
         """Test contrast ratio is same regardless of order."""
         ratio1 = calculate_contrast_ratio("#FFFFFF", "#808080")
         ratio2 = calculate_contrast_ratio("#808080", "#FFFFFF")
-        assert ratio1 == pytest.approx(ratio2, rel=0.01)
+        assert math.isclose(ratio1, ratio2, rel_tol=0.01)
 
     def test_wcag_aa_threshold(self):
         """Test colors meeting WCAG AA threshold (4.5:1)."""
@@ -208,53 +192,47 @@ class TestColorPresets:
 
     def test_colors_dict_exists(self):
         """Test COLORS dict is available."""
-        from src.utils.colors import COLORS
-
-        assert "white" in COLORS
-        assert "black" in COLORS
-        assert "red" in COLORS
+        assert {"white", "black", "red"} <= COLORS.keys()
 
     def test_ass_colors_dict_exists(self):
         """Test ASS_COLORS dict is available."""
-        from src.utils.colors import ASS_COLORS
-
-        assert "white" in ASS_COLORS
-        assert "black" in ASS_COLORS
+        assert {"white", "black"} <= ASS_COLORS.keys()
         assert ASS_COLORS["white"] == "&H00FFFFFF"
         assert ASS_COLORS["black"] == "&H00000000"
 
     def test_social_media_colors(self):
         """Test social media brand colors are defined."""
-        from src.utils.colors import COLORS
+        assert {"tiktok_pink", "tiktok_cyan", "instagram_purple", "youtube_red"} <= COLORS.keys()
 
-        assert "tiktok_pink" in COLORS
-        assert "tiktok_cyan" in COLORS
-        assert "instagram_purple" in COLORS
-        assert "youtube_red" in COLORS
+    @pytest.mark.parametrize("name", ["white", "black", "red", "green", "blue", "yellow"])
+    def test_ass_presets_match_hex_presets(self, name):
+        """Test opaque ASS presets are the BGR form of the hex presets."""
+        assert ASS_COLORS[name] == hex_to_ass_bgr(COLORS[name])
 
 
 class TestRoundTripConversion:
     """Test round-trip conversions maintain values."""
 
-    def test_hex_to_rgb_to_hex(self):
-        """Test hex → RGB → hex preserves value."""
-        original = "#FF8800"
-        r, g, b = hex_to_rgb(original)
-        result = rgb_to_hex(r, g, b)
-        assert result == original
-
-    def test_hex_to_ass_to_hex(self):
-        """Test hex → ASS BGR → hex preserves value."""
-        original = "#FF8800"
-        ass_color = hex_to_ass_bgr(original)
-        result = ass_bgr_to_hex(ass_color)
-        assert result == original
-
-    def test_multiple_colors(self):
-        """Test round-trip for various colors."""
-        colors = ["#FFFFFF", "#000000", "#FF0000", "#00FF00", "#0000FF", "#ABCDEF"]
-
-        for color in colors:
-            ass_color = hex_to_ass_bgr(color)
-            result = ass_bgr_to_hex(ass_color)
-            assert result == color
+    @pytest.mark.parametrize("color", [
+        "#FF8800", "#FFFFFF", "#000000", "#FF0000", "#00FF00", "#0000FF", "#ABCDEF",
+    ])
+    def test_round_trip(self, color):
+        """Test hex → RGB → hex and hex → ASS BGR → hex preserve the value."""
+        assert rgb_to_hex(*hex_to_rgb(color)) == color
+        assert ass_bgr_to_hex(hex_to_ass_bgr(color)) == color
+
+
+class TestMemoization:
+    """Test conversions are memoized per input."""
+
+    def test_repeat_calls_hit_cache(self):
+        """Test converting the same color twice parses it once."""
+        hex_to_rgb.cache_clear()
+        assert hex_to_rgb("#FE2C55") == hex_to_rgb("#FE2C55")
+        assert hex_to_rgb.cache_info().hits == 1
+
+    def test_errors_are_not_cached(self):
+        """Test invalid input raises on every call."""
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Invalid ASS color"):
+                ass_bgr_to_hex("&HFF")
@@ -4,17 +4,37 @@ Unit Tests for Video Composer Module
 Tests video composition with FFmpeg filter graphs (mocked for speed).
 """
 
+import ffmpeg
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, MagicMock
 
 from src.config import AudioConfig, BRollConfig, BrandConfig, CaptionConfig, Config, ExportConfig
 from src.modules.composer import VideoComposer, CompositionError
 
 
-@pytest.fixture
+# Minimal ASS captions file, encoded once at import
+_ASS_CONTENT_BYTES = """[Script Info]
+Title: Test Captions
+
+[V4+ Styles]
+Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding
+Style: Default,Arial,28,&H00FFFFFF,&H00FFFFFF,&H00000000,&H00000000,-1,0,0,0,100,100,0,0,1,3,0,2,10,10,20,1
+
+[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+Dialogue: 0,0:00:00.00,0:00:00.50,Default,,0,0,0,,{\\be1}Test
+""".encode("utf-8")
+
+
+def _errors_lc(errors):
+    """Join validation errors into one lowercase string for keyword checks."""
+    return " | ".join(errors).lower()
+
+
+@pytest.fixture(scope="module")
 def sample_config():
-    """Create sample configuration."""
+    """Create sample configuration (shared; tests must not mutate it)."""
     return Config(
         brand=BrandConfig(name="Test Brand"),
         captions=CaptionConfig(),
@@ -24,39 +44,40 @@ def sample_config():
     )
 
 
-@pytest.fixture
-def sample_video_file(tmp_path):
+@pytest.fixture(scope="module")
+def base_composer(sample_config):
+    """VideoComposer for tests that only read its settings or build filters."""
+    return VideoComposer(sample_config)
+
+
+@pytest.fixture(scope="session")
+def fixture_dir(tmp_path_factory):
+    """Directory for the shared, read-only input files below."""
+    return tmp_path_factory.mktemp("composer_fixtures")
+
+
+@pytest.fixture(scope="session")
+def sample_video_file(fixture_dir):
     """Create a sample video file (empty placeholder)."""
-    video_path = tmp_path / "main.mp4"
+    video_path = fixture_dir / "main.mp4"
     video_path.write_bytes(b"fake video content")
     return video_path
 
 
-@pytest.fixture
-def sample_captions_file(tmp_path):
+@pytest.fixture(scope="session")
+def sample_captions_file(fixture_dir):
     """Create a sample ASS captions file."""
-    ass_content = """[Script Info]
-Title: Test Captions
-
-[V4+ Styles]
-Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding
-Style: Default,Arial,28,&H00FFFFFF,&H00FFFFFF,&H00000000,&H00000000,-1,0,0,0,100,100,0,0,1,3,0,2,10,10,20,1
-
-[Events]
-Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
-Dialogue: 0,0:00:00.00,0:00:00.50,Default,,0,0,0,,{\\be1}Test
-"""
-    ass_path = tmp_path / "captions.ass"
-    ass_path.write_text(ass_content, encoding="utf-8")
-    return ass_path
+    captions_path = fixture_dir / "captions.ass"
+    captions_path.write_bytes(_ASS_CONTENT_BYTES)
+    return captions_path
 
 
-@pytest.fixture
-def sample_broll_clips(tmp_path):
-    """Create sample B-roll clip files."""
+@pytest.fixture(scope="session")
+def sample_broll_clips(fixture_dir):
+    """Create sample B-roll clip files (shared; tests must not mutate the list)."""
     clips = []
     for i in range(2):
-        clip_path = tmp_path / f"broll_{i}.mp4"
+        clip_path = fixture_dir / f"broll_{i}.mp4"
         clip_path.write_bytes(b"fake broll content")
         clips.append({
             "path": clip_path,
@@ -67,6 +88,24 @@ def sample_broll_clips(tmp_path):
     return clips
 
 
+@pytest.fixture
+def mock_ffmpeg(monkeypatch):
+    """
+    Replace ffmpeg.run and ffmpeg.probe for composition tests.
+
+    Returns:
+        Tuple of (run mock, probe mock); probe reports a 30s video
+    """
+    run = MagicMock()
+    probe = MagicMock(return_value={
+        'format': {'duration': '30.0'},
+        'streams': [{'codec_type': 'video'}]
+    })
+    monkeypatch.setattr(ffmpeg, 'run', run)
+    monkeypatch.setattr(ffmpeg, 'probe', probe)
+    return run, probe
+
+
 @pytest.fixture
 def temp_output(tmp_path):
     """Create temporary output directory."""
@@ -102,65 +141,58 @@ class TestVideoComposerInit:
 class TestValidation:
     """Test input validation."""
 
-    def test_validate_main_video_exists(self, sample_config, sample_video_file):
+    def test_validate_main_video_exists(self, base_composer, sample_video_file):
         """Test validation passes for existing video."""
-        composer = VideoComposer(sample_config)
-        errors = composer.validate(sample_video_file)
+        errors = base_composer.validate(sample_video_file)
 
         assert len(errors) == 0
 
-    def test_validate_missing_video(self, sample_config, tmp_path):
+    def test_validate_missing_video(self, base_composer, tmp_path):
         """Test validation fails for missing video."""
-        composer = VideoComposer(sample_config)
         missing_file = tmp_path / "nonexistent.mp4"
 
-        errors = composer.validate(missing_file)
+        errors = base_composer.validate(missing_file)
 
         assert len(errors) > 0
-        assert any("not found" in e.lower() for e in errors)
+        assert "not found" in _errors_lc(errors)
 
-    def test_validate_empty_video(self, sample_config, tmp_path):
+    def test_validate_empty_video(self, base_composer, tmp_path):
         """Test validation fails for empty video."""
-        composer = VideoComposer(sample_config)
         empty_file = tmp_path / "empty.mp4"
         empty_file.write_bytes(b"")
 
-        errors = composer.validate(empty_file)
+        errors = base_composer.validate(empty_file)
 
         assert len(errors) > 0
-        assert any("empty" in e.lower() for e in errors)
+        assert "empty" in _errors_lc(errors)
 
-    def test_validate_captions_optional(self, sample_config, sample_video_file):
+    def test_validate_captions_optional(self, base_composer, sample_video_file):
         """Test captions are optional."""
-        composer = VideoComposer(sample_config)
-        errors = composer.validate(sample_video_file, captions_path=None)
+        errors = base_composer.validate(sample_video_file, captions_path=None)
 
         assert len(errors) == 0
 
-    def test_validate_missing_captions(self, sample_config, sample_video_file, tmp_path):
+    def test_validate_missing_captions(self, base_composer, sample_video_file, tmp_path):
         """Test validation fails for missing captions file."""
-        composer = VideoComposer(sample_config)
         missing_captions = tmp_path / "nonexistent.ass"
 
-        errors = composer.validate(sample_video_file, captions_path=missing_captions)
+        errors = base_composer.validate(sample_video_file, captions_path=missing_captions)
 
         assert len(errors) > 0
-        assert any("captions" in e.lower() and "not found" in e.lower() for e in errors)
+        assert "captions file not found" in _errors_lc(errors)
 
-    def test_validate_wrong_caption_format(self, sample_config, sample_video_file, tmp_path):
+    def test_validate_wrong_caption_format(self, base_composer, sample_video_file, tmp_path):
         """Test validation fails for non-ASS caption format."""
-        composer = VideoComposer(sample_config)
         wrong_format = tmp_path / "captions.srt"
         wrong_format.write_text("fake srt", encoding="utf-8")
 
-        errors = composer.validate(sample_video_file, captions_path=wrong_format)
+        errors = base_composer.validate(sample_video_file, captions_path=wrong_format)
 
         assert len(errors) > 0
-        assert any("ass format" in e.lower() for e in errors)
+        assert "ass format" in _errors_lc(errors)
 
-    def test_validate_broll_clips(self, sample_config, sample_video_file, tmp_path):
+    def test_validate_broll_clips(self, base_composer, sample_video_file, tmp_path):
         """Test validation of B-roll clips."""
-        composer = VideoComposer(sample_config)
 
         # Missing B-roll file
         broll_clips = [{
@@ -170,14 +202,13 @@ class TestValidation:
             "type": "pip"
         }]
 
-        errors = composer.validate(sample_video_file, broll_clips=broll_clips)
+        errors = base_composer.validate(sample_video_file, broll_clips=broll_clips)
 
         assert len(errors) > 0
-        assert any("broll" in e.lower() and "not found" in e.lower() for e in errors)
+        assert "b-roll clip not found" in _errors_lc(errors)
 
-    def test_validate_broll_missing_fields(self, sample_config, sample_video_file):
+    def test_validate_broll_missing_fields(self, base_composer, sample_video_file):
         """Test validation fails for B-roll with missing fields."""
-        composer = VideoComposer(sample_config)
 
         # Missing timing fields
         broll_clips = [{
@@ -186,32 +217,23 @@ class TestValidation:
             "type": "pip"
         }]
 
-        errors = composer.validate(sample_video_file, broll_clips=broll_clips)
+        errors = base_composer.validate(sample_video_file, broll_clips=broll_clips)
 
         assert len(errors) > 0
-        assert any("missing timing" in e.lower() for e in errors)
+        assert "missing timing" in _errors_lc(errors)
 
 
-@patch('ffmpeg.run')
-@patch('ffmpeg.probe')
 class TestComposition:
     """Test video composition (with mocked FFmpeg)."""
 
     def test_basic_composition(
         self,
-        mock_probe,
-        mock_run,
+        mock_ffmpeg,
         sample_config,
         sample_video_file,
         temp_output
     ):
         """Test basic composition without captions or B-roll."""
-        # Mock ffmpeg.probe to return video info
-        mock_probe.return_value = {
-            'format': {'duration': '30.0'},
-            'streams': [{'codec_type': 'video'}]
-        }
-
         composer = VideoComposer(sample_config)
         output_path = temp_output / "composed.mp4"
 
@@ -221,23 +243,18 @@ class TestComposition:
         assert result.metadata["video_resolution"] == "1280×720"
         assert result.metadata["captions_enabled"] is False
         assert result.metadata["broll_count"] == 0
+        mock_run, _ = mock_ffmpeg
         assert mock_run.called
 
     def test_composition_with_captions(
         self,
-        mock_probe,
-        mock_run,
+        mock_ffmpeg,
         sample_config,
         sample_video_file,
         sample_captions_file,
         temp_output
     ):
         """Test composition with captions."""
-        mock_probe.return_value = {
-            'format': {'duration': '30.0'},
-            'streams': [{'codec_type': 'video'}]
-        }
-
         composer = VideoComposer(sample_config)
         output_path = temp_output / "composed.mp4"
 
@@ -252,19 +269,13 @@ class TestComposition:
 
     def test_composition_with_broll(
         self,
-        mock_probe,
-        mock_run,
+        mock_ffmpeg,
         sample_config,
         sample_video_file,
         sample_broll_clips,
         temp_output
     ):
         """Test composition with B-roll clips."""
-        mock_probe.return_value = {
-            'format': {'duration': '30.0'},
-            'streams': [{'codec_type': 'video'}]
-        }
-
         composer = VideoComposer(sample_config)
         output_path = temp_output / "composed.mp4"
 
@@ -279,8 +290,7 @@ class TestComposition:
 
     def test_composition_full_pipeline(
         self,
-        mock_probe,
-        mock_run,
+        mock_ffmpeg,
         sample_config,
         sample_video_file,
         sample_captions_file,
@@ -288,11 +298,6 @@ class TestComposition:
         temp_output
     ):
         """Test full composition with all features."""
-        mock_probe.return_value = {
-            'format': {'duration': '30.0'},
-            'streams': [{'codec_type': 'video'}]
-        }
-
         composer = VideoComposer(sample_config)
         output_path = temp_output / "composed.mp4"
 
@@ -311,18 +316,12 @@ class TestComposition:
 
     def test_custom_resolution(
         self,
-        mock_probe,
-        mock_run,
+        mock_ffmpeg,
         sample_config,
         sample_video_file,
         temp_output
     ):
         """Test composition with custom resolution."""
-        mock_probe.return_value = {
-            'format': {'duration': '30.0'},
-            'streams': [{'codec_type': 'video'}]
-        }
-
         composer = VideoComposer(sample_config)
         output_path = temp_output / "composed.mp4"
 
@@ -340,15 +339,14 @@ class TestComposition:
 class TestFilterMethods:
     """Test individual filter building methods."""
 
-    def test_add_header_overlay(self, sample_config):
+    def test_add_header_overlay(self, base_composer):
         """Test header overlay creation."""
-        composer = VideoComposer(sample_config)
 
         # Create mock stream
         mock_stream = Mock()
         mock_stream.drawtext = Mock(return_value=mock_stream)
 
-        result = composer._add_header_overlay(
+        result = base_composer._add_header_overlay(
             mock_stream,
             "Test Header",
             1280
@@ -363,30 +361,28 @@ class TestFilterMethods:
         assert call_kwargs['fontcolor'] == 'white'
         assert call_kwargs['box'] == 1
 
-    def test_burn_captions(self, sample_config, sample_captions_file):
+    def test_burn_captions(self, base_composer, sample_captions_file):
         """Test caption burning."""
-        composer = VideoComposer(sample_config)
 
         # Create mock stream
         mock_stream = Mock()
         mock_stream.filter = Mock(return_value=mock_stream)
 
-        result = composer._burn_captions(mock_stream, sample_captions_file)
+        result = base_composer._burn_captions(mock_stream, sample_captions_file)
 
         # Verify subtitles filter was called
         mock_stream.filter.assert_called_once()
         assert mock_stream.filter.call_args[0][0] == 'subtitles'
 
-    def test_apply_audio_ducking(self, sample_config):
+    def test_apply_audio_ducking(self, base_composer):
         """Test audio ducking application."""
-        composer = VideoComposer(sample_config)
 
         # Create mock stream
         mock_stream = Mock()
         mock_stream.filter = Mock(return_value=mock_stream)
 
         intervals = [(5.0, 10.0), (20.0, 25.0)]
-        result = composer._apply_audio_ducking(mock_stream, intervals)
+        result = base_composer._apply_audio_ducking(mock_stream, intervals)
 
         # Verify volume filter was called
         mock_stream.filter.assert_called_once()
@@ -396,14 +392,13 @@ class TestFilterMethods:
         filter_expr = mock_stream.filter.call_args[0][1]
         assert 'between(t,5.0,10.0)' in filter_expr
         assert 'between(t,20.0,25.0)' in filter_expr
-        assert str(composer.ducking_volume) in filter_expr
+        assert str(base_composer.ducking_volume) in filter_expr
 
-    def test_no_ducking_without_intervals(self, sample_config):
+    def test_no_ducking_without_intervals(self, base_composer):
         """Test audio ducking is skipped when no intervals."""
-        composer = VideoComposer(sample_config)
 
         mock_stream = Mock()
-        result = composer._apply_audio_ducking(mock_stream, [])
+        result = base_composer._apply_audio_ducking(mock_stream, [])
 
         # Should return stream unchanged
         assert result == mock_stream
@@ -412,69 +407,62 @@ class TestFilterMethods:
 class TestErrorHandling:
     """Test error handling."""
 
-    @patch('ffmpeg.run')
-    def test_ffmpeg_error(self, mock_run, sample_config, sample_video_file, temp_output):
+    def test_ffmpeg_error(self, mock_ffmpeg, base_composer, sample_video_file, temp_output):
         """Test handling of FFmpeg errors."""
-        import ffmpeg
-
         # Mock FFmpeg error
+        mock_run, _ = mock_ffmpeg
         mock_run.side_effect = ffmpeg.Error('ffmpeg', '', b'FFmpeg error message')
 
-        composer = VideoComposer(sample_config)
         output_path = temp_output / "composed.mp4"
 
         with pytest.raises(CompositionError, match="FFmpeg composition failed"):
-            composer.process(sample_video_file, output_path)
+            base_composer.process(sample_video_file, output_path)
 
-    def test_validation_error(self, sample_config, tmp_path, temp_output):
+    def test_validation_error(self, base_composer, tmp_path, temp_output):
         """Test composition fails on validation error."""
-        composer = VideoComposer(sample_config)
         missing_video = tmp_path / "nonexistent.mp4"
         output_path = temp_output / "composed.mp4"
 
         with pytest.raises(CompositionError, match="Validation failed"):
-            composer.process(missing_video, output_path)
+            base_composer.process(missing_video, output_path)
 
 
 class TestEstimateDuration:
     """Test duration estimation."""
 
-    @patch('ffmpeg.probe')
-    def test_estimate_basic(self, mock_probe, sample_config, sample_video_file):
+    def test_estimate_basic(self, mock_ffmpeg, base_composer, sample_video_file):
         """Test basic duration estimation."""
+        _, mock_probe = mock_ffmpeg
         mock_probe.return_value = {
             'format': {'duration': '60.0'},
             'streams': [{'codec_type': 'video'}]
         }
 
-        composer = VideoComposer(sample_config)
-        estimate = composer.estimate_duration(sample_video_file)
+        estimate = base_composer.estimate_duration(sample_video_file)
 
         # Should be ~0.5x video duration for basic composition
         assert 25.0 <= estimate <= 35.0
 
-    @patch('ffmpeg.probe')
-    def test_estimate_with_broll(self, mock_probe, sample_config, sample_video_file):
+    def test_estimate_with_broll(self, mock_ffmpeg, base_composer, sample_video_file):
         """Test duration estimation with B-roll clips."""
+        _, mock_probe = mock_ffmpeg
         mock_probe.return_value = {
             'format': {'duration': '60.0'},
             'streams': [{'codec_type': 'video'}]
         }
 
-        composer = VideoComposer(sample_config)
         broll_clips = [{"path": "clip1.mp4"}, {"path": "clip2.mp4"}]
 
-        estimate = composer.estimate_duration(sample_video_file, broll_clips=broll_clips)
+        estimate = base_composer.estimate_duration(sample_video_file, broll_clips=broll_clips)
 
         # Should be longer with B-roll clips
         assert estimate > 30.0
 
-    def test_estimate_fallback(self, sample_config, tmp_path):
+    def test_estimate_fallback(self, base_composer, tmp_path):
         """Test fallback estimation when probe fails."""
-        composer = VideoComposer(sample_config)
         nonexistent = tmp_path / "nonexistent.mp4"
 
-        estimate = composer.estimate_duration(nonexistent)
+        estimate = base_composer.estimate_duration(nonexistent)
 
         # Should return fallback value
         assert estimate == 60.0
@@ -483,22 +471,14 @@ class TestEstimateDuration:
 class TestMetadata:
     """Test metadata in ProcessorResult."""
 
-    @patch('ffmpeg.run')
-    @patch('ffmpeg.probe')
     def test_metadata_fields(
         self,
-        mock_probe,
-        mock_run,
+        mock_ffmpeg,
         sample_config,
         sample_video_file,
         temp_output
     ):
         """Test all expected metadata fields are present."""
-        mock_probe.return_value = {
-            'format': {'duration': '30.0'},
-            'streams': [{'codec_type': 'video'}]
-        }
-
         composer = VideoComposer(sample_config)
         output_path = temp_output / "composed.mp4"
 
@@ -510,22 +490,14 @@ class TestMetadata:
         assert "broll_count" in result.metadata
         assert "processing_time" in result.metadata
 
-    @patch('ffmpeg.run')
-    @patch('ffmpeg.probe')
     def test_metadata_values(
         self,
-        mock_probe,
-        mock_run,
+        mock_ffmpeg,
         sample_config,
         sample_video_file,
         temp_output
     ):
         """Test metadata values are correct."""
-        mock_probe.return_value = {
-            'format': {'duration': '30.0'},
-            'streams': [{'codec_type': 'video'}]
-        }
-
         composer = VideoComposer(sample_config)
         output_path = temp_output / "composed.mp4"
 
@@ -9,6 +9,11 @@ from pathlib import Path
 import pytest
 
 from src.config import Config, ConfigLoader
+from src.utils.config_loader import (
+    _parse_config_file,
+    load_config_file,
+    load_config_with_env,
+)
 
 
 class TestConfig:
@@ -16,8 +21,12 @@ class TestConfig:
 
     def test_config_initialization(self, sample_config):
         """Test Config can be initialized with valid data."""
-        # TODO: Implement test
-        pass
+        # Full pydantic validation (config_instance is only built once)
+        config = Config(**sample_config)
+
+        assert config.brand.name == "TestBrand"
+        assert config.captions.font.size == 48
+        assert config.export.platforms["instagram"].resolution == [1080, 1920]
 
     def test_config_validation_invalid_data(self):
         """Test Config validation rejects invalid data."""
@@ -52,3 +61,36 @@ class TestConfigLoader:
         """Test schema validation."""
         # TODO: Implement test
         pass
+
+
+class TestConfigParseCache:
+    """Test caching of parsed config files in src.utils.config_loader."""
+
+    def test_yaml_config_parse_cache(self, tmp_path):
+        """Test YAML parses are reused in-process and invalidated on change."""
+        config_path = tmp_path / "brand.yaml"
+        config_path.write_text("brand:\n  name: Test Brand\n")
+        _parse_config_file.cache_clear()
+
+        assert load_config_file(config_path) == {'brand': {'name': 'Test Brand'}}
+        assert load_config_file(config_path) == {'brand': {'name': 'Test Brand'}}
+        assert _parse_config_file.cache_info().hits == 1
+        # Nothing is written next to the user's config
+        assert list(tmp_path.iterdir()) == [config_path]
+
+        # Different size invalidates the cached parse
+        config_path.write_text("brand:\n  name: Other Brand Name\n")
+        assert load_config_file(config_path) == {'brand': {'name': 'Other Brand Name'}}
+
+    def test_load_config_with_env_memoizes_parse(self, tmp_path):
+        """Test repeated loads reuse the parse but return independent copies."""
+        config_path = tmp_path / "brand.json"
+        config_path.write_text('{"brand": {"name": "Test Brand"}}')
+        _parse_config_file.cache_clear()
+
+        first = load_config_with_env(config_path, validate=False)
+        first['brand']['name'] = 'Mutated'
+        second = load_config_with_env(config_path, validate=False)
+
+        assert second['brand']['name'] == 'Test Brand'
+        assert _parse_config_file.cache_info().hits == 1
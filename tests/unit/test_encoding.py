@@ -0,0 +1,151 @@
+"""
+Unit Tests for Video Encoding Module
+
+Tests platform rung ordering and the source each rung is encoded from.
+"""
+
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from src.config import (
+    AudioConfig,
+    BRollConfig,
+    BrandConfig,
+    CaptionConfig,
+    Config,
+    ExportConfig,
+    PlatformExportConfig,
+)
+from src.modules.encoding import VideoEncoder
+
+# Rungs from config/brand_example.yaml: three 9:16 and one 16:9
+EXAMPLE_PLATFORMS = {
+    "tiktok": PlatformExportConfig(resolution=[1080, 1920]),
+    "instagram": PlatformExportConfig(resolution=[1080, 1920]),
+    "youtube": PlatformExportConfig(resolution=[1080, 1920]),
+    "youtube_landscape": PlatformExportConfig(resolution=[1920, 1080]),
+}
+
+
+def _make_encoder(monkeypatch, platforms, cascade):
+    """Build a VideoEncoder (no VideoToolbox probe) with _encode_rung mocked."""
+    monkeypatch.setattr(VideoEncoder, "_check_videotoolbox_available", lambda self: False)
+    config = Config(
+        brand=BrandConfig(name="Test Brand"),
+        captions=CaptionConfig(),
+        broll=BRollConfig(),
+        audio=AudioConfig(),
+        export=ExportConfig(platforms=platforms, cascade_encode=cascade),
+    )
+    encoder = VideoEncoder(config)
+    encoder._encode_rung = Mock()
+    return encoder
+
+
+def _sources(encoder):
+    """Map each encoded output name to the file it was encoded from."""
+    return {
+        call.args[1].name: call.args[0].name
+        for call in encoder._encode_rung.call_args_list
+    }
+
+
+class TestOrderRungs:
+    """Test order_rungs()."""
+
+    def test_largest_first(self):
+        """Test rungs are ordered by frame area, largest first."""
+        platforms = {
+            "small": PlatformExportConfig(resolution=[540, 960]),
+            "large": PlatformExportConfig(resolution=[1080, 1920]),
+            "medium": PlatformExportConfig(resolution=[720, 1280]),
+        }
+
+        names = [name for name, _ in VideoEncoder.order_rungs(platforms)]
+
+        assert names == ["large", "medium", "small"]
+
+    def test_disabled_rungs_skipped(self):
+        """Test disabled platforms are not returned."""
+        platforms = {
+            "on": PlatformExportConfig(resolution=[1080, 1920]),
+            "off": PlatformExportConfig(resolution=[1080, 1920], enabled=False),
+        }
+
+        assert [name for name, _ in VideoEncoder.order_rungs(platforms)] == ["on"]
+
+    def test_equal_area_keeps_config_order(self):
+        """Test rungs with equal area keep their configured order."""
+        names = [name for name, _ in VideoEncoder.order_rungs(EXAMPLE_PLATFORMS)]
+
+        assert names == ["tiktok", "instagram", "youtube", "youtube_landscape"]
+
+
+class TestEncodePlatformsSources:
+    """Test which source each rung is encoded from."""
+
+    def test_cascade_off_by_default(self):
+        """Test cascading is opt-in."""
+        assert ExportConfig().cascade_encode is False
+
+    @pytest.mark.parametrize("cascade", [False, True])
+    def test_example_rungs_all_from_source(self, monkeypatch, tmp_path, cascade):
+        """Test equal-size and other-aspect rungs always encode from the source."""
+        encoder = _make_encoder(monkeypatch, EXAMPLE_PLATFORMS, cascade)
+
+        encoder.encode_platforms(Path("composed.mp4"), tmp_path)
+
+        assert set(_sources(encoder).values()) == {"composed.mp4"}
+        assert encoder._encode_rung.call_count == 4
+
+    def test_cascade_strict_downscale_same_aspect(self, monkeypatch, tmp_path):
+        """Test only strictly smaller rungs with the same aspect ratio cascade."""
+        platforms = {
+            "full": PlatformExportConfig(resolution=[1080, 1920]),
+            "landscape": PlatformExportConfig(resolution=[1280, 720]),
+            "half": PlatformExportConfig(resolution=[540, 960]),
+        }
+        encoder = _make_encoder(monkeypatch, platforms, cascade=True)
+
+        encoder.encode_platforms(Path("composed.mp4"), tmp_path)
+
+        # Order by area: full (2.07M), landscape (0.92M), half (0.52M).
+        # landscape differs in aspect from full, so it uses the source; half
+        # differs in aspect from landscape (its previous rung), so it does too.
+        assert _sources(encoder) == {
+            "composed_full.mp4": "composed.mp4",
+            "composed_landscape.mp4": "composed.mp4",
+            "composed_half.mp4": "composed.mp4",
+        }
+
+    def test_cascade_uses_previous_output(self, monkeypatch, tmp_path):
+        """Test a smaller same-aspect rung is scaled from the previous output."""
+        platforms = {
+            "full": PlatformExportConfig(resolution=[1080, 1920]),
+            "medium": PlatformExportConfig(resolution=[720, 1280]),
+            "half": PlatformExportConfig(resolution=[540, 960]),
+        }
+        encoder = _make_encoder(monkeypatch, platforms, cascade=True)
+
+        outputs = encoder.encode_platforms(Path("composed.mp4"), tmp_path)
+
+        assert _sources(encoder) == {
+            "composed_full.mp4": "composed.mp4",
+            "composed_medium.mp4": "composed_full.mp4",
+            "composed_half.mp4": "composed_medium.mp4",
+        }
+        assert outputs["half"] == tmp_path / "composed_half.mp4"
+
+    def test_no_cascade_when_disabled(self, monkeypatch, tmp_path):
+        """Test every rung encodes from the source when cascading is off."""
+        platforms = {
+            "full": PlatformExportConfig(resolution=[1080, 1920]),
+            "half": PlatformExportConfig(resolution=[540, 960]),
+        }
+        encoder = _make_encoder(monkeypatch, platforms, cascade=False)
+
+        encoder.encode_platforms(Path("composed.mp4"), tmp_path)
+
+        assert set(_sources(encoder).values()) == {"composed.mp4"}
@@ -0,0 +1,78 @@
+"""
+Unit Tests for FFmpeg Helper Utilities
+
+Tests ffprobe frame rate parsing and probe_video_info() output handling.
+"""
+
+import math
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.ffmpeg_helpers import parse_frame_rate, probe_video_info
+
+_PROBE_JSON = (
+    b'{"streams": [{"codec_type": "video", "codec_name": "h264", "width": 1080,'
+    b' "height": 1920, "r_frame_rate": "30000/1001"}],'
+    b' "format": {"duration": "12.5", "bit_rate": "4000000"}}'
+)
+
+
+class TestParseFrameRate:
+    """Test parse_frame_rate()."""
+
+    @pytest.mark.parametrize("rate,expected", [
+        ("30/1", 30.0),
+        ("30000/1001", 30000 / 1001),
+        ("24000/1001", 24000 / 1001),
+        ("0/0", 0.0),
+        ("25", 25.0),
+        ("29.97", 29.97),
+    ], ids=["integer_fraction", "ntsc_30", "ntsc_24", "zero_over_zero", "bare_int", "decimal"])
+    def test_parse(self, rate, expected):
+        """Test fractions, zero denominators and bare numbers."""
+        assert math.isclose(parse_frame_rate(rate), expected)
+
+    def test_invalid_raises(self):
+        """Test non-numeric input raises ValueError rather than being evaluated."""
+        with pytest.raises(ValueError):
+            parse_frame_rate("__import__('os')")
+
+
+class TestProbeVideoInfo:
+    """Test probe_video_info() with ffprobe mocked."""
+
+    def _completed(self, returncode=0, stdout=_PROBE_JSON):
+        return subprocess.CompletedProcess(["ffprobe"], returncode, stdout, b"boom")
+
+    def test_parses_probe_output(self):
+        """Test the ffprobe JSON is turned into the metadata dict."""
+        with patch("src.utils.ffmpeg_helpers.run_ffmpeg", return_value=self._completed()):
+            info = probe_video_info(Path("video.mp4"))
+
+        assert info["width"] == 1080
+        assert info["height"] == 1920
+        assert math.isclose(info["fps"], 30000 / 1001)
+        assert info["duration"] == 12.5
+        assert info["codec"] == "h264"
+        assert info["bitrate"] == 4000000
+
+    def test_ffprobe_failure_raises_ffmpeg_error(self):
+        """Test a non-zero ffprobe exit raises ffmpeg.Error."""
+        import ffmpeg
+
+        failed = self._completed(returncode=1, stdout=b"")
+        with patch("src.utils.ffmpeg_helpers.run_ffmpeg", return_value=failed):
+            with pytest.raises(ffmpeg.Error):
+                probe_video_info(Path("video.mp4"))
+
+    def test_no_video_stream(self):
+        """Test files without a video stream raise ValueError."""
+        audio_only = b'{"streams": [{"codec_type": "audio"}], "format": {"duration": "1"}}'
+        with patch(
+            "src.utils.ffmpeg_helpers.run_ffmpeg", return_value=self._completed(stdout=audio_only)
+        ):
+            with pytest.raises(ValueError, match="No video stream"):
+                probe_video_info(Path("audio.mp4"))
@@ -0,0 +1,46 @@
+"""
+Unit Tests for JSON Helpers
+
+Tests json_loads/json_dumps round trips and import-time backend selection.
+"""
+
+import builtins
+
+import pytest
+
+from src.utils.json_utils import json_dumps, json_loads
+
+
+class TestJsonHelpers:
+    """Test json_loads() and json_dumps()."""
+
+    def test_round_trip(self):
+        """Test dumped bytes parse back to the same object."""
+        data = {"words": [{"word": "Café", "start": 0.5}], "ok": True, "none": None}
+
+        encoded = json_dumps(data)
+
+        assert isinstance(encoded, bytes)
+        assert json_loads(encoded) == data
+
+    def test_dumps_is_compact(self):
+        """Test output has no whitespace separators."""
+        assert json_dumps({"a": [1, 2]}) == b'{"a":[1,2]}'
+
+    def test_loads_accepts_str(self):
+        """Test str input is accepted as well as bytes."""
+        assert json_loads('{"a": 1}') == {"a": 1}
+
+    def test_loads_invalid_raises_value_error(self):
+        """Test invalid JSON raises ValueError."""
+        with pytest.raises(ValueError):
+            json_loads(b"{not json")
+
+    def test_no_import_per_call(self, monkeypatch):
+        """Test the backend is chosen at import time, not on every call."""
+        def fail_import(*args, **kwargs):
+            raise AssertionError("json helpers must not import per call")
+
+        monkeypatch.setattr(builtins, "__import__", fail_import)
+
+        assert json_loads(json_dumps([1])) == [1]
@@ -0,0 +1,26 @@
+"""
+Unit Tests for Logging Utilities
+
+Tests queued file logging set up by setup_logging().
+"""
+
+import logging
+
+from src.utils import logging as logging_utils
+
+
+class TestFileLogging:
+    """Test the background file log listener."""
+
+    def test_file_handler_is_queued(self, tmp_path):
+        """Test file logs are written by the background listener."""
+        log_file = tmp_path / "logs" / "run.log"
+        logging_utils.setup_logging(log_file=log_file)
+        try:
+            logging.getLogger("test").info("queued message")
+
+            # Stopping the listener flushes pending records
+            logging_utils._stop_file_listener()
+            assert "queued message" in log_file.read_text()
+        finally:
+            logging_utils.setup_logging()
@@ -2,86 +2,168 @@
 Unit Tests for Pexels API Client
 
 Tests B-roll fetching with mocked API responses.
+
+Safe to run under pytest-xdist (``pytest -n auto``): every worker builds
+its own module-scoped fetcher under its own ``tmp_path_factory`` base,
+and the cache and rate-limit state are reset before each test.
 """
 
-import json
+import io
 import pytest
+import shutil
 import time
+from contextlib import nullcontext
 from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import Mock, patch, mock_open
 
 from src.api.pexels_client import BRollFetcher, PexelsAPIError
+from src.utils.json_utils import json_dumps, json_loads
 
 
-@pytest.fixture
-def temp_cache_dir(tmp_path):
-    """Create temporary cache directory."""
-    cache_dir = tmp_path / "broll_cache"
-    cache_dir.mkdir()
-    return cache_dir
+def _read_json(path: Path):
+    """Parse a JSON file written by the client (orjson when installed)."""
+    return json_loads(path.read_bytes())
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def shared_tmp(tmp_path_factory):
+    """Single unnumbered temp directory for every file this module creates."""
+    return tmp_path_factory.mktemp("pexels", numbered=False)
+
+
+@pytest.fixture(scope="module")
+def temp_cache_dir(shared_tmp):
+    """Create temporary cache directory (shared by the module)."""
+    cache_dir = shared_tmp / "broll_cache"
+    yield cache_dir
+    shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+@pytest.fixture(scope="module")
 def fetcher(temp_cache_dir):
-    """Create BRollFetcher instance with temp cache."""
+    """Create BRollFetcher instance with temp cache (shared by the module)."""
     return BRollFetcher(api_key="test_api_key", cache_dir=temp_cache_dir)
 
 
-@pytest.fixture
-def sample_csv(tmp_path):
-    """Create sample B-roll plan CSV."""
-    csv_content = """start_sec,end_sec,type,search_query,fade_in,fade_out
+@pytest.fixture(autouse=True)
+def _reset_fetcher_cache(fetcher):
+    """Empty the shared cache and reset rate-limit state before each test."""
+    for path in fetcher.cache_dir.iterdir():
+        path.unlink()
+    state = {"requests": [], "last_reset": time.time()}
+    fetcher.rate_limit_file.write_bytes(json_dumps(state))
+    fetcher._rl_cache = state
+
+
+SAMPLE_CSV = """start_sec,end_sec,type,search_query,fade_in,fade_out
 5.0,12.0,pip,team collaboration,0.5,0.5
 15.0,25.0,pip,office workspace,0.5,0.5
 30.0,40.0,fullframe,product demo,1.0,1.0
 """
-    csv_path = tmp_path / "broll_plan.csv"
-    csv_path.write_text(csv_content, encoding="utf-8")
-    return csv_path
+
+
+# SAMPLE_CSV as parsed by _parse_csv (copied per use; fetch_from_plan adds "path")
+_PLAN_CLIPS = (
+    {"start_time": 5.0, "end_time": 12.0, "type": "pip",
+     "search_query": "team collaboration", "fade_in": 0.5, "fade_out": 0.5},
+    {"start_time": 15.0, "end_time": 25.0, "type": "pip",
+     "search_query": "office workspace", "fade_in": 0.5, "fade_out": 0.5},
+    {"start_time": 30.0, "end_time": 40.0, "type": "fullframe",
+     "search_query": "product demo", "fade_in": 1.0, "fade_out": 1.0},
+)
+
+
+@pytest.fixture(scope="module")
+def sample_csv(shared_tmp):
+    """Create sample B-roll plan CSV (written once per module)."""
+    csv_path = shared_tmp / "broll_plan.csv"
+    csv_path.write_text(SAMPLE_CSV, encoding="utf-8")
+    yield csv_path
+    csv_path.unlink(missing_ok=True)
+
+
+# Canned search response, built once; the top level is read-only (copy it to mutate)
+_PEXELS_RESPONSE = MappingProxyType({
+    "page": 1,
+    "per_page": 5,
+    "videos": [
+        {
+            "id": 123456,
+            "duration": 15,
+            "video_files": [
+                {
+                    "id": 1,
+                    "quality": "hd",
+                    "width": 1280,
+                    "height": 720,
+                    "link": "https://example.com/video-hd.mp4"
+                },
+                {
+                    "id": 2,
+                    "quality": "sd",
+                    "width": 640,
+                    "height": 360,
+                    "link": "https://example.com/video-sd.mp4"
+                }
+            ]
+        },
+        {
+            "id": 789012,
+            "duration": 20,
+            "video_files": [
+                {
+                    "id": 3,
+                    "quality": "hd",
+                    "width": 1280,
+                    "height": 720,
+                    "link": "https://example.com/video2-hd.mp4"
+                }
+            ]
+        }
+    ]
+})
 
 
 @pytest.fixture
 def mock_pexels_response():
     """Mock Pexels API response."""
-    return {
-        "page": 1,
-        "per_page": 5,
-        "videos": [
-            {
-                "id": 123456,
-                "duration": 15,
-                "video_files": [
-                    {
-                        "id": 1,
-                        "quality": "hd",
-                        "width": 1280,
-                        "height": 720,
-                        "link": "https://example.com/video-hd.mp4"
-                    },
-                    {
-                        "id": 2,
-                        "quality": "sd",
-                        "width": 640,
-                        "height": 360,
-                        "link": "https://example.com/video-sd.mp4"
-                    }
-                ]
-            },
-            {
-                "id": 789012,
-                "duration": 20,
-                "video_files": [
-                    {
-                        "id": 3,
-                        "quality": "hd",
-                        "width": 1280,
-                        "height": 720,
-                        "link": "https://example.com/video2-hd.mp4"
-                    }
-                ]
-            }
-        ]
-    }
+    return _PEXELS_RESPONSE
+
+
+@pytest.fixture
+def api(monkeypatch):
+    """
+    Replace requests.get for the Pexels client with a canned search response.
+
+    Returns the mock; tests adjust ``api.return_value`` (status code, text,
+    JSON body) to simulate errors and inspect ``api.call_args``.
+    """
+    response = Mock(status_code=200, text="")
+    response.json.return_value = _PEXELS_RESPONSE
+    get = Mock(return_value=response)
+    monkeypatch.setattr("src.api.pexels_client.requests.get", get)
+    return get
+
+
+# Body served by the mocked download responses (one chunk)
+_VIDEO_DATA = b"fake video data"
+
+
+# Known cache key for "team collaboration" (catches hash algorithm changes)
+_TEAM_COLLABORATION_MD5 = "5061897dfbf5880993e0cad09e2a26ea"
+
+
+# Fixed clock for the rate-limit tests, and 200 requests made 100s before it
+FROZEN_TIME = 1_700_000_000.0
+_REQUESTS_AT_LIMIT = [FROZEN_TIME - 100] * 200
+
+
+@pytest.fixture
+def frozen_clock(monkeypatch):
+    """Pin time.time() (as seen by the Pexels client) to FROZEN_TIME."""
+    monkeypatch.setattr("src.api.pexels_client.time.time", lambda: FROZEN_TIME)
+    return FROZEN_TIME
 
 
 class TestBRollFetcherInit:
@@ -101,13 +183,15 @@ class TestBRollFetcherInit:
 
         assert fetcher.cache_dir == Path("data/temp/broll_cache")
 
-    def test_rate_limit_file_created(self, fetcher):
+    def test_rate_limit_file_created(self, tmp_path):
         """Test rate limit tracking file is created."""
+        fetcher = BRollFetcher(api_key="test_key", cache_dir=tmp_path / "cache")
+
         assert fetcher.rate_limit_file.exists()
+        assert fetcher.rate_limit_file.parent == tmp_path / "cache"
 
         # Check initial state
-        with open(fetcher.rate_limit_file, 'r') as f:
-            state = json.load(f)
+        state = _read_json(fetcher.rate_limit_file)
 
         assert "requests" in state
         assert "last_reset" in state
@@ -117,9 +201,9 @@ class TestBRollFetcherInit:
 class TestCSVParsing:
     """Test CSV plan parsing."""
 
-    def test_parse_valid_csv(self, fetcher, sample_csv):
-        """Test parsing valid CSV file."""
-        clips = fetcher._parse_csv(sample_csv)
+    def test_parse_valid_csv(self, fetcher):
+        """Test parsing valid CSV stream."""
+        clips = fetcher._parse_csv(io.StringIO(SAMPLE_CSV))
 
         assert len(clips) == 3
         assert clips[0]["start_time"] == 5.0
@@ -129,55 +213,40 @@ class TestCSVParsing:
         assert clips[0]["fade_in"] == 0.5
         assert clips[0]["fade_out"] == 0.5
 
-    def test_parse_csv_missing_file(self, fetcher, tmp_path):
+    def test_parse_csv_from_path(self, fetcher, sample_csv):
+        """Test parsing a CSV file on disk matches the expected clips."""
+        assert fetcher._parse_csv(sample_csv) == list(_PLAN_CLIPS)
+
+    def test_parse_csv_missing_file(self, fetcher, shared_tmp):
         """Test error when CSV file doesn't exist."""
-        missing_csv = tmp_path / "nonexistent.csv"
+        missing_csv = shared_tmp / "nonexistent.csv"
 
         with pytest.raises(FileNotFoundError, match="B-roll plan CSV not found"):
             fetcher._parse_csv(missing_csv)
 
-    def test_parse_csv_missing_required_columns(self, fetcher, tmp_path):
-        """Test error when CSV missing required columns."""
-        csv_content = """start_sec,end_sec
-5.0,12.0
-"""
-        csv_path = tmp_path / "invalid.csv"
-        csv_path.write_text(csv_content, encoding="utf-8")
-
-        with pytest.raises(ValueError, match="CSV missing required columns"):
-            fetcher._parse_csv(csv_path)
-
-    def test_parse_csv_invalid_type(self, fetcher, tmp_path):
-        """Test error when type is not 'pip' or 'fullframe'."""
-        csv_content = """start_sec,end_sec,type,search_query
-5.0,12.0,invalid_type,test query
-"""
-        csv_path = tmp_path / "invalid_type.csv"
-        csv_path.write_text(csv_content, encoding="utf-8")
-
-        with pytest.raises(ValueError, match="Invalid type"):
-            fetcher._parse_csv(csv_path)
-
-    def test_parse_csv_invalid_timing(self, fetcher, tmp_path):
-        """Test error when end_sec <= start_sec."""
-        csv_content = """start_sec,end_sec,type,search_query
-12.0,5.0,pip,test query
-"""
-        csv_path = tmp_path / "invalid_timing.csv"
-        csv_path.write_text(csv_content, encoding="utf-8")
-
-        with pytest.raises(ValueError, match="end_sec must be > start_sec"):
-            fetcher._parse_csv(csv_path)
-
-    def test_parse_csv_default_fade_values(self, fetcher, tmp_path):
+    @pytest.mark.parametrize("csv_content,match", [
+        ("start_sec,end_sec\n5.0,12.0\n", "CSV missing required columns"),
+        (
+            "start_sec,end_sec,type,search_query\n5.0,12.0,invalid_type,test query\n",
+            "Invalid type",
+        ),
+        (
+            "start_sec,end_sec,type,search_query\n12.0,5.0,pip,test query\n",
+            "end_sec must be > start_sec",
+        ),
+    ], ids=["missing_required_columns", "invalid_type", "invalid_timing"])
+    def test_parse_csv_invalid(self, fetcher, csv_content, match):
+        """Test errors for missing columns, bad type, and end_sec <= start_sec."""
+        with pytest.raises(ValueError, match=match):
+            fetcher._parse_csv(io.StringIO(csv_content))
+
+    def test_parse_csv_default_fade_values(self, fetcher):
         """Test default fade values when not specified."""
         csv_content = """start_sec,end_sec,type,search_query
 5.0,12.0,pip,test query
 """
-        csv_path = tmp_path / "no_fade.csv"
-        csv_path.write_text(csv_content, encoding="utf-8")
 
-        clips = fetcher._parse_csv(csv_path)
+        clips = fetcher._parse_csv(io.StringIO(csv_content))
 
         assert clips[0]["fade_in"] == 0.5  # Default
         assert clips[0]["fade_out"] == 0.5  # Default
@@ -187,20 +256,14 @@ class TestCaching:
     """Test video caching functionality."""
 
     def test_get_cache_path_md5_hash(self, fetcher):
-        """Test cache path uses MD5 hash of query."""
-        path1 = fetcher._get_cache_path("team collaboration")
-        path2 = fetcher._get_cache_path("team collaboration")
-        path3 = fetcher._get_cache_path("different query")
+        """Test cache path uses MD5 hash of the normalized query."""
+        path = fetcher._get_cache_path("  Team Collaboration ")
 
-        # Same query should produce same hash
-        assert path1 == path2
+        # md5(b"team collaboration"), as an .mp4 file in the cache dir
+        assert path == fetcher.cache_dir / f"{_TEAM_COLLABORATION_MD5}.mp4"
 
         # Different query should produce different hash
-        assert path1 != path3
-
-        # Should be .mp4 file in cache dir
-        assert path1.suffix == ".mp4"
-        assert path1.parent == fetcher.cache_dir
+        assert fetcher._get_cache_path("different query").stem != _TEAM_COLLABORATION_MD5
 
     def test_cache_lookup_miss(self, fetcher):
         """Test cache lookup when file doesn't exist."""
@@ -242,8 +305,7 @@ class TestCaching:
         assert metadata_path.exists()
 
         # Check metadata content
-        with open(metadata_path, 'r') as f:
-            metadata = json.load(f)
+        metadata = _read_json(metadata_path)
 
         assert metadata["query"] == "test query"
         assert metadata["video_url"] == "https://example.com/video.mp4"
@@ -256,45 +318,32 @@ class TestCaching:
 class TestPexelsAPI:
     """Test Pexels API interactions."""
 
-    @patch('requests.get')
-    def test_search_videos_success(self, mock_get, fetcher, mock_pexels_response):
+    def test_search_videos_success(self, api, fetcher, mock_pexels_response):
         """Test successful Pexels API search."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_pexels_response
-        mock_get.return_value = mock_response
-
         result = fetcher._search_videos("test query", per_page=5)
 
         assert result == mock_pexels_response
         assert len(result["videos"]) == 2
 
         # Check API request
-        mock_get.assert_called_once()
-        call_args = mock_get.call_args
-        assert call_args[0][0] == "https://api.pexels.com/videos/search"
-        assert call_args[1]["headers"]["Authorization"] == "test_api_key"
-        assert call_args[1]["params"]["query"] == "test query"
-        assert call_args[1]["params"]["per_page"] == 5
-        assert call_args[1]["params"]["orientation"] == "landscape"
+        api.assert_called_once()
+        assert api.call_args.args == ("https://api.pexels.com/videos/search",)
+        assert api.call_args.kwargs["headers"]["Authorization"] == "test_api_key"
+        assert api.call_args.kwargs["params"] == {
+            "query": "test query", "per_page": 5, "orientation": "landscape",
+        }
 
-    @patch('requests.get')
-    def test_search_videos_rate_limit_error(self, mock_get, fetcher):
+    def test_search_videos_rate_limit_error(self, api, fetcher):
         """Test handling of rate limit error (429)."""
-        mock_response = Mock()
-        mock_response.status_code = 429
-        mock_get.return_value = mock_response
+        api.return_value.status_code = 429
 
         with pytest.raises(PexelsAPIError, match="Rate limit exceeded"):
             fetcher._search_videos("test query")
 
-    @patch('requests.get')
-    def test_search_videos_api_error(self, mock_get, fetcher):
+    def test_search_videos_api_error(self, api, fetcher):
         """Test handling of API error (500)."""
-        mock_response = Mock()
-        mock_response.status_code = 500
-        mock_response.text = "Internal Server Error"
-        mock_get.return_value = mock_response
+        api.return_value.status_code = 500
+        api.return_value.text = "Internal Server Error"
 
         with pytest.raises(PexelsAPIError, match="API error 500"):
             fetcher._search_videos("test query")
@@ -348,63 +397,55 @@ class TestPexelsAPI:
 class TestDownloading:
     """Test video downloading."""
 
-    @patch('requests.get')
-    def test_download_file_success(self, mock_get, fetcher):
-        """Test successful file download."""
-        mock_response = Mock()
-        mock_response.iter_content.return_value = [b"chunk1", b"chunk2"]
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
-
-        output_path = fetcher.cache_dir / "test_video.mp4"
-
-        fetcher._download_file("https://example.com/video.mp4", output_path)
-
-        assert output_path.exists()
-        assert output_path.read_bytes() == b"chunk1chunk2"
-
+    @pytest.mark.parametrize("outcomes,retries,expected_sleeps,expected_data", [
+        ([True], 3, 0, _VIDEO_DATA),         # first attempt succeeds
+        ([False, True], 3, 1, _VIDEO_DATA),  # one retry, then success
+        ([False, False], 2, 1, None),        # retries exhausted
+    ], ids=["success", "retry", "retry_exhausted"])
     @patch('requests.get')
     @patch('time.sleep')
-    def test_download_file_retry(self, mock_sleep, mock_get, fetcher):
-        """Test download retry on failure."""
+    def test_download_file(self, mock_sleep, mock_get, fetcher,
+                           outcomes, retries, expected_sleeps, expected_data):
+        """Test download success, retry with backoff, and failure after retries."""
         import requests
 
-        # First attempt fails, second succeeds
-        mock_response_fail = Mock()
-        mock_response_fail.raise_for_status.side_effect = requests.RequestException("Connection error")
-
-        mock_response_success = Mock()
-        mock_response_success.iter_content.return_value = [b"data"]
-        mock_response_success.raise_for_status = Mock()
-
-        mock_get.side_effect = [mock_response_fail, mock_response_success]
+        responses = []
+        for ok in outcomes:
+            response = Mock()
+            if ok:
+                response.iter_content.return_value = [_VIDEO_DATA]
+            else:
+                response.raise_for_status.side_effect = requests.RequestException(
+                    "Connection error"
+                )
+            responses.append(response)
+        mock_get.side_effect = responses
 
         output_path = fetcher.cache_dir / "test_video.mp4"
+        raises = (
+            pytest.raises(PexelsAPIError, match="Download failed after")
+            if expected_data is None else nullcontext()
+        )
 
-        fetcher._download_file("https://example.com/video.mp4", output_path, retries=3)
+        with raises:
+            fetcher._download_file("https://example.com/video.mp4", output_path, retries=retries)
 
-        # Should have retried once
-        assert mock_get.call_count == 2
-        assert mock_sleep.call_count == 1
-        assert output_path.exists()
+        assert mock_get.call_count == len(outcomes)
+        assert mock_sleep.call_count == expected_sleeps
+        if expected_data is not None:
+            assert output_path.read_bytes() == expected_data
 
+    @pytest.mark.parametrize("n_chunks", [1, 4])
     @patch('requests.get')
-    @patch('time.sleep')
-    def test_download_file_retry_exhausted(self, mock_sleep, mock_get, fetcher):
-        """Test download fails after retries exhausted."""
-        import requests
-
-        mock_response = Mock()
-        mock_response.raise_for_status.side_effect = requests.RequestException("Connection error")
-        mock_get.return_value = mock_response
+    def test_download_file_chunks(self, mock_get, fetcher, n_chunks):
+        """Test every streamed chunk is written, in order."""
+        chunks = [bytes([65 + i]) * 3 for i in range(n_chunks)]
+        mock_get.return_value.iter_content.return_value = chunks
 
         output_path = fetcher.cache_dir / "test_video.mp4"
+        fetcher._download_file("https://example.com/video.mp4", output_path)
 
-        with pytest.raises(PexelsAPIError, match="Download failed after"):
-            fetcher._download_file("https://example.com/video.mp4", output_path, retries=2)
-
-        # Should have tried twice
-        assert mock_get.call_count == 2
+        assert output_path.read_bytes() == b"".join(chunks)
 
 
 class TestRateLimiting:
@@ -426,44 +467,59 @@ class TestRateLimiting:
         fetcher._rate_limit_check()
 
     @patch('time.sleep')
-    def test_rate_limit_check_at_limit(self, mock_sleep, fetcher):
+    def test_rate_limit_check_at_limit(self, mock_sleep, fetcher, frozen_clock):
         """Test rate limit check when at limit."""
-        # Simulate 200 requests in the last hour
-        current_time = time.time()
-        state = {
-            "requests": [current_time - 100 for _ in range(200)],
-            "last_reset": current_time
-        }
-        fetcher._save_rate_limit_state(state)
+        fetcher._rl_cache = {"requests": list(_REQUESTS_AT_LIMIT), "last_reset": FROZEN_TIME}
 
         fetcher._rate_limit_check()
 
-        # Should sleep
-        assert mock_sleep.called
+        # Oldest request expires 3500s from now, plus the 1s buffer
+        mock_sleep.assert_called_once_with(pytest.approx(3501.0))
 
-    def test_rate_limit_state_cleanup(self, fetcher):
+    def test_rate_limit_state_cleanup(self, fetcher, frozen_clock):
         """Test old requests are cleaned up."""
         # Add old requests (over 1 hour ago)
-        old_time = time.time() - 7200  # 2 hours ago
-        state = {
+        old_time = FROZEN_TIME - 7200  # 2 hours ago
+        fetcher._rl_cache = {
             "requests": [old_time, old_time, old_time],
             "last_reset": old_time
         }
-        fetcher._save_rate_limit_state(state)
 
         fetcher._track_request()
 
         # Old requests should be removed
-        new_state = fetcher._load_rate_limit_state()
-        assert len(new_state["requests"]) == 1
+        assert fetcher._rl_cache["requests"] == [FROZEN_TIME]
+
+    def test_rate_limit_state_write_through(self, fetcher):
+        """Test saved state is written to disk and served from memory afterwards."""
+        state = {"requests": [1.0, 2.0], "last_reset": 1.0}
+
+        fetcher._save_rate_limit_state(state)
+
+        assert _read_json(fetcher.rate_limit_file) == state
+        assert fetcher._load_rate_limit_state() is state
+
+    def test_rate_limit_state_loaded_from_file(self, fetcher):
+        """Test a fresh instance reads existing state from disk once."""
+        fetcher._save_rate_limit_state({"requests": [1.0], "last_reset": 1.0})
+
+        other = BRollFetcher(api_key="test_api_key", cache_dir=fetcher.cache_dir)
+
+        assert other._load_rate_limit_state()["requests"] == [1.0]
+        assert other._rl_cache is not None
 
 
 class TestSearchAndDownload:
     """Test integrated search and download workflow."""
 
-    @patch('src.api.pexels_client.BRollFetcher._download_file')
-    @patch('requests.get')
-    def test_search_and_download_cache_hit(self, mock_get, mock_download, fetcher):
+    @pytest.fixture(autouse=True)
+    def mocks(self, monkeypatch, api):
+        """Mock the search request (via ``api``) and the download for every test."""
+        download = Mock()
+        monkeypatch.setattr(BRollFetcher, "_download_file", download)
+        return SimpleNamespace(get=api, download=download)
+
+    def test_search_and_download_cache_hit(self, mocks, fetcher):
         """Test search returns cached video."""
         # Create cached file
         cache_path = fetcher._get_cache_path("test query")
@@ -473,45 +529,30 @@ class TestSearchAndDownload:
 
         # Should return cached path without API call
         assert result == cache_path
-        mock_get.assert_not_called()
-        mock_download.assert_not_called()
+        mocks.get.assert_not_called()
+        mocks.download.assert_not_called()
 
-    @patch('src.api.pexels_client.BRollFetcher._download_file')
-    @patch('requests.get')
-    def test_search_and_download_cache_miss(self, mock_get, mock_download,
-                                            fetcher, mock_pexels_response):
+    def test_search_and_download_cache_miss(self, mocks, fetcher):
         """Test search downloads new video."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_pexels_response
-        mock_get.return_value = mock_response
-
         result = fetcher.search_and_download("test query", duration_needed=10)
 
         # Should have called API and download
-        assert mock_get.called
-        assert mock_download.called
+        assert mocks.get.called
+        assert mocks.download.called
         assert result is not None
 
-    @patch('requests.get')
-    def test_search_and_download_no_results(self, mock_get, fetcher):
+    def test_search_and_download_no_results(self, mocks, fetcher):
         """Test search with no results."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"videos": []}
-        mock_get.return_value = mock_response
+        mocks.get.return_value.json.return_value = {"videos": []}
 
         result = fetcher.search_and_download("test query", duration_needed=10)
 
         assert result is None
 
-    @patch('requests.get')
-    def test_search_and_download_api_error(self, mock_get, fetcher):
+    def test_search_and_download_api_error(self, mocks, fetcher):
         """Test graceful handling of API errors."""
-        mock_response = Mock()
-        mock_response.status_code = 500
-        mock_response.text = "Server Error"
-        mock_get.return_value = mock_response
+        mocks.get.return_value.status_code = 500
+        mocks.get.return_value.text = "Server Error"
 
         result = fetcher.search_and_download("test query", duration_needed=10)
 
@@ -522,8 +563,16 @@ class TestSearchAndDownload:
 class TestFetchFromPlan:
     """Test full CSV workflow."""
 
+    @pytest.fixture
+    def plan(self, monkeypatch):
+        """Serve the parsed SAMPLE_CSV rows without reading a file (parsing is tested above)."""
+        monkeypatch.setattr(
+            BRollFetcher, "_parse_csv", lambda self, csv_source: [dict(c) for c in _PLAN_CLIPS]
+        )
+        return Path("broll_plan.csv")
+
     @patch('src.api.pexels_client.BRollFetcher.search_and_download')
-    def test_fetch_from_plan_all_success(self, mock_search, fetcher, sample_csv):
+    def test_fetch_from_plan_all_success(self, mock_search, fetcher, plan):
         """Test fetching all clips from CSV."""
         # Mock successful downloads
         mock_search.side_effect = [
@@ -532,7 +581,7 @@ class TestFetchFromPlan:
             Path("/cache/video3.mp4"),
         ]
 
-        result = fetcher.fetch_from_plan(sample_csv)
+        result = fetcher.fetch_from_plan(plan)
 
         assert len(result) == 3
         assert all("path" in clip for clip in result)
@@ -541,7 +590,7 @@ class TestFetchFromPlan:
         assert result[2]["search_query"] == "product demo"
 
     @patch('src.api.pexels_client.BRollFetcher.search_and_download')
-    def test_fetch_from_plan_partial_failure(self, mock_search, fetcher, sample_csv):
+    def test_fetch_from_plan_partial_failure(self, mock_search, fetcher, plan):
         """Test graceful degradation when some downloads fail."""
         # First and third succeed, second fails
         mock_search.side_effect = [
@@ -550,7 +599,7 @@ class TestFetchFromPlan:
             Path("/cache/video3.mp4"),
         ]
 
-        result = fetcher.fetch_from_plan(sample_csv)
+        result = fetcher.fetch_from_plan(plan)
 
         # Should return 2 successful clips
         assert len(result) == 2
@@ -558,7 +607,7 @@ class TestFetchFromPlan:
         assert result[1]["search_query"] == "product demo"
 
     @patch('src.api.pexels_client.BRollFetcher.search_and_download')
-    def test_fetch_from_plan_exception_handling(self, mock_search, fetcher, sample_csv):
+    def test_fetch_from_plan_exception_handling(self, mock_search, fetcher, plan):
         """Test exception handling during fetch."""
         # First succeeds, second raises exception, third succeeds
         mock_search.side_effect = [
@@ -567,7 +616,7 @@ class TestFetchFromPlan:
             Path("/cache/video3.mp4"),
         ]
 
-        result = fetcher.fetch_from_plan(sample_csv)
+        result = fetcher.fetch_from_plan(plan)
 
         # Should return 2 successful clips
         assert len(result) == 2
@@ -578,10 +627,10 @@ class TestClearCache:
 
     def test_clear_cache(self, fetcher):
         """Test clearing all cached files."""
-        # Create some cached files
-        (fetcher.cache_dir / "video1.mp4").write_bytes(b"data1")
-        (fetcher.cache_dir / "video2.mp4").write_bytes(b"data2")
-        (fetcher.cache_dir / "metadata.json").write_text("{}")
+        # Create some cached files (contents don't matter, so empty files are enough)
+        (fetcher.cache_dir / "video1.mp4").touch()
+        (fetcher.cache_dir / "video2.mp4").touch()
+        (fetcher.cache_dir / "metadata.json").touch()
 
         fetcher.clear_cache()
 
@@ -0,0 +1,90 @@
+"""
+Unit Tests for Stage Output Cache
+
+Tests content-addressed cache keys and store/restore of stage outputs.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.utils.stage_cache import StageCache, cache_key
+
+
+@pytest.fixture
+def input_files(tmp_path: Path):
+    """Create two small input files."""
+    audio = tmp_path / "audio.wav"
+    script = tmp_path / "script.txt"
+    audio.write_bytes(b"RIFF fake audio")
+    script.write_text("Hello world", encoding="utf-8")
+    return [audio, script]
+
+
+class TestCacheKey:
+    """Test cache_key() digest computation."""
+
+    def test_key_is_deterministic(self, input_files):
+        """Test same inputs and config produce the same key."""
+        assert cache_key(input_files, {"a": 1}) == cache_key(input_files, {"a": 1})
+
+    def test_key_changes_with_config(self, input_files):
+        """Test config changes invalidate the key."""
+        assert cache_key(input_files, {"a": 1}) != cache_key(input_files, {"a": 2})
+
+    def test_key_changes_with_input_content(self, input_files):
+        """Test input content changes invalidate the key."""
+        before = cache_key(input_files)
+        input_files[1].write_text("Hello there", encoding="utf-8")
+        assert cache_key(input_files) != before
+
+    def test_key_ignores_config_ordering(self, input_files):
+        """Test dict ordering does not affect the key."""
+        assert cache_key(input_files, {"a": 1, "b": 2}) == cache_key(input_files, {"b": 2, "a": 1})
+
+
+class TestStageCache:
+    """Test StageCache store/restore."""
+
+    def test_miss_before_store(self, tmp_path):
+        """Test nothing is cached initially."""
+        cache = StageCache(tmp_path / "cache")
+        assert not cache.is_hit("alignment", "abc")
+
+    def test_store_and_restore(self, tmp_path, input_files):
+        """Test stored outputs are restored with identical content."""
+        cache = StageCache(tmp_path / "cache")
+        output = tmp_path / "out" / "video.json"
+        output.parent.mkdir()
+        output.write_text('{"words": []}', encoding="utf-8")
+
+        key = cache_key(input_files)
+        cache.store("alignment", key, [output])
+        assert cache.is_hit("alignment", key)
+
+        restored = cache.restore("alignment", key, tmp_path / "restored")
+        assert restored == [tmp_path / "restored" / "video.json"]
+        assert restored[0].read_text(encoding="utf-8") == '{"words": []}'
+
+    def test_rewritten_output_does_not_change_entry(self, tmp_path, input_files):
+        """Test rewriting a stored output in place leaves the cached entry intact."""
+        cache = StageCache(tmp_path / "cache")
+        output = tmp_path / "out" / "video.json"
+        output.parent.mkdir()
+        output.write_text('{"key": "A"}', encoding="utf-8")
+        cache.store("alignment", "A", [output])
+
+        # A later miss rewrites the same output file in place for key B
+        with open(output, "w", encoding="utf-8") as f:
+            f.write('{"key": "B"}')
+        cache.store("alignment", "B", [output])
+
+        restored = cache.restore("alignment", "A", output.parent)
+        assert restored[0].read_text(encoding="utf-8") == '{"key": "A"}'
+
+        # Writing through the restored file must not touch the entry either
+        with open(restored[0], "w", encoding="utf-8") as f:
+            f.write('{"key": "C"}')
+        assert cache.restore("alignment", "A", tmp_path / "again")[0].read_text(
+            encoding="utf-8"
+        ) == '{"key": "A"}'
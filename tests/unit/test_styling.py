@@ -4,17 +4,28 @@ Unit Tests for Caption Styling Module
 Tests SRT → ASS conversion with viral styling effects.
 """
 
+import io
 import json
 import pytest
 from pathlib import Path
-
-from src.config import AudioConfig, BRollConfig, BrandConfig, CaptionConfig, Config, ExportConfig
+from types import SimpleNamespace
+
+from src.config import (
+    AudioConfig,
+    BRollConfig,
+    BrandConfig,
+    CaptionConfig,
+    CaptionStyleConfig,
+    Config,
+    ExportConfig,
+    FontConfig,
+)
 from src.modules.styling import CaptionStyler, StylingError
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_config():
-    """Create sample configuration."""
+    """Create sample configuration (read-only, shared by the session)."""
     return Config(
         brand=BrandConfig(name="Test Brand"),
         captions=CaptionConfig(),
@@ -24,11 +35,9 @@ def sample_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def custom_style_config():
-    """Create configuration with custom styling."""
-    from src.config import FontConfig, CaptionStyleConfig
-
+    """Create configuration with custom styling (read-only, shared by the session)."""
     return Config(
         brand=BrandConfig(name="Test Brand"),
         captions=CaptionConfig(
@@ -49,10 +58,7 @@ def custom_style_config():
     )
 
 
-@pytest.fixture
-def sample_srt_file(tmp_path):
-    """Create a sample SRT file."""
-    srt_content = """1
+SAMPLE_SRT = """1
 00:00:00,000 --> 00:00:00,500
 Hello
 
@@ -76,17 +82,56 @@ a
 00:00:02,500 --> 00:00:03,000
 test
 """
+
+
+@pytest.fixture
+def sample_srt_file(tmp_path):
+    """Create a sample SRT file."""
     srt_path = tmp_path / "captions.srt"
-    srt_path.write_text(srt_content, encoding="utf-8")
+    srt_path.write_text(SAMPLE_SRT, encoding="utf-8")
     return srt_path
 
 
-@pytest.fixture
-def temp_output(tmp_path):
-    """Create temporary output directory."""
-    output_dir = tmp_path / "output"
-    output_dir.mkdir()
-    return output_dir
+def _style_sample(config, work_dir):
+    """
+    Style SAMPLE_SRT with ``config`` and read the output back once.
+
+    Returns:
+        SimpleNamespace with the ProcessorResult (``result``), the ASS output
+        ``path``, its text (``content``) and its ``Dialogue:`` lines
+        (``dialogue_lines``)
+    """
+    srt_path = work_dir / "captions.srt"
+    srt_path.write_text(SAMPLE_SRT, encoding="utf-8")
+    output_path = work_dir / "styled.ass"
+
+    result = CaptionStyler(config).process(srt_path, output_path)
+    content = output_path.read_text(encoding="utf-8")
+
+    return SimpleNamespace(
+        result=result,
+        path=output_path,
+        content=content,
+        dialogue_lines=[line for line in content.split('\n') if line.startswith('Dialogue:')],
+    )
+
+
+@pytest.fixture(scope="session")
+def styled_default(sample_config, tmp_path_factory):
+    """SAMPLE_SRT styled once with the default config (see _style_sample)."""
+    return _style_sample(sample_config, tmp_path_factory.mktemp("styling"))
+
+
+@pytest.fixture(scope="session")
+def styled_custom(custom_style_config, tmp_path_factory):
+    """SAMPLE_SRT styled once with the custom config (see _style_sample)."""
+    return _style_sample(custom_style_config, tmp_path_factory.mktemp("styling_custom"))
+
+
+@pytest.fixture(scope="session")
+def temp_output(tmp_path_factory):
+    """Create temporary output directory (shared; tests use distinct file names)."""
+    return tmp_path_factory.mktemp("styling_out")
 
 
 class TestCaptionStylerInit:
@@ -123,89 +168,54 @@ class TestCaptionStylerInit:
 class TestSRTToASSConversion:
     """Test SRT → ASS conversion."""
 
-    def test_basic_conversion(self, sample_config, sample_srt_file, temp_output):
+    def test_basic_conversion(self, styled_default):
         """Test basic SRT to ASS conversion."""
-        styler = CaptionStyler(sample_config)
-        output_path = temp_output / "styled.ass"
-
-        result = styler.process(sample_srt_file, output_path)
-
-        assert result.success is True
-        assert output_path.exists()
-        assert result.metadata["caption_count"] == 6
-
-    def test_ass_file_structure(self, sample_config, sample_srt_file, temp_output):
-        """Test ASS file has correct structure."""
-        styler = CaptionStyler(sample_config)
-        output_path = temp_output / "styled.ass"
-
-        styler.process(sample_srt_file, output_path)
-
-        content = output_path.read_text(encoding="utf-8")
-
-        # Check for required ASS sections
-        assert "[Script Info]" in content
-        assert "[V4+ Styles]" in content
-        assert "[Events]" in content
-
-        # Check for style definition
-        assert "Style: Default" in content
-        assert "Arial" in content  # Default font
-
-    def test_blur_effect_applied(self, sample_config, sample_srt_file, temp_output):
-        """Test blur effect (\\be1) is applied to captions."""
-        styler = CaptionStyler(sample_config)
-        output_path = temp_output / "styled.ass"
-
-        styler.process(sample_srt_file, output_path)
-
-        content = output_path.read_text(encoding="utf-8")
-
-        # Check for blur effect in dialogue lines
-        assert "{\\be1}" in content
-
-        # Each caption should have blur effect
-        dialogue_lines = [line for line in content.split('\n') if line.startswith('Dialogue:')]
-        for line in dialogue_lines:
-            assert "{\\be1}" in line
-
-    def test_caption_text_preserved(self, sample_config, sample_srt_file, temp_output):
-        """Test caption text is preserved from SRT."""
-        styler = CaptionStyler(sample_config)
-        output_path = temp_output / "styled.ass"
-
-        styler.process(sample_srt_file, output_path)
-
-        content = output_path.read_text(encoding="utf-8")
-
-        # Check all words are present
-        assert "Hello" in content
-        assert "world" in content
-        assert "this" in content
-        assert "is" in content
-        assert "test" in content
-
-    def test_timing_preserved(self, sample_config, sample_srt_file, temp_output):
-        """Test caption timing is preserved during conversion."""
-        styler = CaptionStyler(sample_config)
-        output_path = temp_output / "styled.ass"
-
-        styler.process(sample_srt_file, output_path)
-
-        content = output_path.read_text(encoding="utf-8")
-
-        # Check for ASS timestamp format (H:MM:SS.cc)
-        # First caption: 0:00:00.00 → 0:00:00.50
-        assert "0:00:00.00" in content
-        assert "0:00:00.50" in content
-
-    def test_custom_video_dimensions(self, sample_config, sample_srt_file, temp_output):
+        assert styled_default.result.success is True
+        assert styled_default.path.exists()
+        assert styled_default.result.metadata["caption_count"] == 6
+
+    @pytest.mark.parametrize("needle,where", [
+        # Required ASS sections and the default style
+        ("[Script Info]", "any"),
+        ("[V4+ Styles]", "any"),
+        ("[Events]", "any"),
+        ("Style: Default", "any"),
+        ("Arial", "any"),
+        # Blur effect on every caption
+        ("{\\be1}", "dialogue"),
+        # Caption text preserved from SRT
+        ("Hello", "any"),
+        ("world", "any"),
+        ("this", "any"),
+        ("is", "any"),
+        ("test", "any"),
+        # Timing in ASS format (H:MM:SS.cc); first caption 0:00:00.00 → 0:00:00.50
+        ("0:00:00.00", "any"),
+        ("0:00:00.50", "any"),
+        # White text and black outline in ASS BGR format
+        ("&H00FFFFFF", "any"),
+        ("&H00000000", "any"),
+    ], ids=[
+        "script_info", "styles_section", "events_section", "default_style", "default_font",
+        "blur", "text_hello", "text_world", "text_this", "text_is", "text_test",
+        "start_time", "end_time", "white_text_bgr", "black_outline_bgr",
+    ])
+    def test_ass_contains(self, styled_default, needle, where):
+        """Test the styled ASS output contains the expected structure, text and colors."""
+        if where == "dialogue":
+            assert styled_default.dialogue_lines
+            for line in styled_default.dialogue_lines:
+                assert needle in line
+        else:
+            assert needle in styled_default.content
+
+    def test_custom_video_dimensions(self, sample_config, temp_output):
         """Test custom video dimensions."""
         styler = CaptionStyler(sample_config)
         output_path = temp_output / "styled.ass"
 
         result = styler.process(
-            sample_srt_file,
+            io.StringIO(SAMPLE_SRT),
             output_path,
             video_width=1920,
             video_height=1080
@@ -222,41 +232,11 @@ class TestSRTToASSConversion:
 class TestColorConversion:
     """Test color conversion to ASS BGR format."""
 
-    def test_white_color_bgr(self, sample_config, sample_srt_file, temp_output):
-        """Test white color converts to BGR correctly."""
-        styler = CaptionStyler(sample_config)
-        output_path = temp_output / "styled.ass"
-
-        styler.process(sample_srt_file, output_path)
-
-        content = output_path.read_text(encoding="utf-8")
-
-        # White in ASS BGR format: &H00FFFFFF
-        assert "&H00FFFFFF" in content
-
-    def test_black_outline_bgr(self, sample_config, sample_srt_file, temp_output):
-        """Test black outline converts to BGR correctly."""
-        styler = CaptionStyler(sample_config)
-        output_path = temp_output / "styled.ass"
-
-        styler.process(sample_srt_file, output_path)
-
-        content = output_path.read_text(encoding="utf-8")
-
-        # Black in ASS BGR format: &H00000000
-        assert "&H00000000" in content
-
-    def test_custom_colors(self, custom_style_config, sample_srt_file, temp_output):
+    def test_custom_colors(self, styled_custom):
         """Test custom colors are applied."""
-        styler = CaptionStyler(custom_style_config)
-        output_path = temp_output / "styled.ass"
-
-        styler.process(sample_srt_file, output_path)
-
         # Gold (#FFD700) should be in the file
         # In BGR format: &H0000D7FF
-        content = output_path.read_text(encoding="utf-8")
-        assert "&H0000D7FF" in content  # Gold in BGR
+        assert "&H0000D7FF" in styled_custom.content  # Gold in BGR
 
 
 class TestReadability:
@@ -301,8 +281,6 @@ class TestReadability:
 
     def test_small_font_warning(self):
         """Test warning for font size below 24pt."""
-        from src.config import FontConfig
-
         config = Config(
             brand=BrandConfig(name="Test"),
             captions=CaptionConfig(
@@ -321,8 +299,6 @@ class TestReadability:
 
     def test_thin_outline_warning(self):
         """Test warning for outline width below 2px."""
-        from src.config import CaptionStyleConfig
-
         config = Config(
             brand=BrandConfig(name="Test"),
             captions=CaptionConfig(
@@ -349,6 +325,12 @@ class TestValidation:
 
         assert len(errors) == 0
 
+    def test_validate_srt_stream(self, sample_config):
+        """Test validation passes for valid SRT content in a stream."""
+        styler = CaptionStyler(sample_config)
+
+        assert styler.validate(io.StringIO(SAMPLE_SRT)) == []
+
     def test_validate_missing_file(self, sample_config, tmp_path):
         """Test validation fails for missing file."""
         styler = CaptionStyler(sample_config)
@@ -359,24 +341,20 @@ class TestValidation:
         assert len(errors) > 0
         assert any("not found" in e.lower() for e in errors)
 
-    def test_validate_empty_file(self, sample_config, tmp_path):
-        """Test validation fails for empty file."""
+    def test_validate_empty_file(self, sample_config):
+        """Test validation fails for empty content."""
         styler = CaptionStyler(sample_config)
-        empty_file = tmp_path / "empty.srt"
-        empty_file.write_text("", encoding="utf-8")
 
-        errors = styler.validate(empty_file)
+        errors = styler.validate(io.StringIO(""))
 
         assert len(errors) > 0
         assert any("empty" in e.lower() for e in errors)
 
-    def test_validate_invalid_srt_format(self, sample_config, tmp_path):
+    def test_validate_invalid_srt_format(self, sample_config):
         """Test validation fails for invalid SRT format."""
         styler = CaptionStyler(sample_config)
-        invalid_file = tmp_path / "invalid.srt"
-        invalid_file.write_text("This is not an SRT file", encoding="utf-8")
 
-        errors = styler.validate(invalid_file)
+        errors = styler.validate(io.StringIO("This is not an SRT file"))
 
         assert len(errors) > 0
         assert any("timestamp" in e.lower() or "format" in e.lower() for e in errors)
@@ -385,37 +363,35 @@ class TestValidation:
 class TestEdgeCases:
     """Test edge cases and error handling."""
 
-    def test_single_caption(self, sample_config, tmp_path, temp_output):
+    def test_single_caption(self, sample_config, temp_output):
         """Test converting SRT with single caption."""
         srt_content = """1
 00:00:00,000 --> 00:00:01,000
 Single
 """
-        srt_path = tmp_path / "single.srt"
-        srt_path.write_text(srt_content, encoding="utf-8")
+        srt_src = io.StringIO(srt_content)
 
         styler = CaptionStyler(sample_config)
         output_path = temp_output / "single.ass"
 
-        result = styler.process(srt_path, output_path)
+        result = styler.process(srt_src, output_path)
 
         assert result.success is True
         assert result.metadata["caption_count"] == 1
 
-    def test_multiline_caption(self, sample_config, tmp_path, temp_output):
+    def test_multiline_caption(self, sample_config, temp_output):
         """Test caption with multiple lines."""
         srt_content = """1
 00:00:00,000 --> 00:00:01,000
 Line one
 Line two
 """
-        srt_path = tmp_path / "multiline.srt"
-        srt_path.write_text(srt_content, encoding="utf-8")
+        srt_src = io.StringIO(srt_content)
 
         styler = CaptionStyler(sample_config)
         output_path = temp_output / "multiline.ass"
 
-        result = styler.process(srt_path, output_path)
+        result = styler.process(srt_src, output_path)
 
         assert result.success is True
 
@@ -423,7 +399,7 @@ Line two
         content = output_path.read_text(encoding="utf-8")
         assert "\\N" in content
 
-    def test_utf8_characters(self, sample_config, tmp_path, temp_output):
+    def test_utf8_characters(self, sample_config, temp_output):
         """Test captions with UTF-8 characters."""
         srt_content = """1
 00:00:00,000 --> 00:00:01,000
@@ -437,13 +413,12 @@ résumé
 00:00:02,000 --> 00:00:03,000
 naïve
 """
-        srt_path = tmp_path / "utf8.srt"
-        srt_path.write_text(srt_content, encoding="utf-8")
+        srt_src = io.StringIO(srt_content)
 
         styler = CaptionStyler(sample_config)
         output_path = temp_output / "utf8.ass"
 
-        result = styler.process(srt_path, output_path)
+        result = styler.process(srt_src, output_path)
 
         assert result.success is True
 
@@ -452,45 +427,38 @@ naïve
         assert "résumé" in content
         assert "naïve" in content
 
-    def test_empty_srt_file(self, sample_config, tmp_path, temp_output):
+    def test_empty_srt_file(self, sample_config, temp_output):
         """Test error on empty SRT file."""
-        srt_path = tmp_path / "empty.srt"
-        srt_path.write_text("", encoding="utf-8")
+        srt_src = io.StringIO("")
 
         styler = CaptionStyler(sample_config)
         output_path = temp_output / "output.ass"
 
         with pytest.raises(StylingError, match="No captions found"):
-            styler.process(srt_path, output_path)
+            styler.process(srt_src, output_path)
 
 
 class TestMetadata:
     """Test metadata in ProcessorResult."""
 
-    def test_metadata_fields(self, sample_config, sample_srt_file, temp_output):
+    def test_metadata_fields(self, styled_default):
         """Test all expected metadata fields are present."""
-        styler = CaptionStyler(sample_config)
-        output_path = temp_output / "styled.ass"
-
-        result = styler.process(sample_srt_file, output_path)
+        metadata = styled_default.result.metadata
 
-        assert "caption_count" in result.metadata
-        assert "video_resolution" in result.metadata
-        assert "font" in result.metadata
-        assert "processing_time" in result.metadata
+        assert "caption_count" in metadata
+        assert "video_resolution" in metadata
+        assert "font" in metadata
+        assert "processing_time" in metadata
 
-    def test_metadata_values(self, sample_config, sample_srt_file, temp_output):
+    def test_metadata_values(self, styled_default):
         """Test metadata values are correct."""
-        styler = CaptionStyler(sample_config)
-        output_path = temp_output / "styled.ass"
-
-        result = styler.process(sample_srt_file, output_path)
+        metadata = styled_default.result.metadata
 
-        assert result.metadata["caption_count"] == 6
-        assert result.metadata["video_resolution"] == "1280×720"
-        assert "Arial" in result.metadata["font"]
-        assert "28pt" in result.metadata["font"]
-        assert result.metadata["processing_time"] >= 0
+        assert metadata["caption_count"] == 6
+        assert metadata["video_resolution"] == "1280×720"
+        assert "Arial" in metadata["font"]
+        assert "28pt" in metadata["font"]
+        assert metadata["processing_time"] >= 0
 
 
 class TestEstimateDuration:
@@ -0,0 +1,18 @@
+"""
+Unit Tests for Text Processing Utilities
+
+Tests script normalization and tokenization for alignment.
+"""
+
+from src.utils.text_processing import normalize_for_alignment, split_into_words, tokenize
+
+
+class TestTokenize:
+    """Test tokenize()."""
+
+    def test_matches_normalize_then_split(self):
+        """Test the fused tokenizer matches the two-step normalization."""
+        text = 'Hello, "World"! [music] It\'s AI-powered (really)…  done.'
+
+        assert tokenize(text) == split_into_words(normalize_for_alignment(text))
+        assert tokenize(text, lower=False) == ['Hello', 'World', "It's", 'AI-powered', 'done']
@@ -0,0 +1,153 @@
+"""
+Unit Tests for Input Validation
+
+Tests format gating and single-stat file checks for video, script and
+audio inputs.
+"""
+
+import wave
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.validation import (
+    ERR_UNSUPPORTED_SCRIPT,
+    ERR_UNSUPPORTED_VIDEO,
+    stat_once,
+    validate_audio,
+    validate_script,
+    validate_video,
+)
+
+
+def _write_wav(path: Path, channels: int = 1, sample_rate: int = 16000) -> Path:
+    """Write a short silent WAV file."""
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(b"\x00\x00" * channels * 160)
+    return path
+
+
+class TestValidateVideo:
+    """Test validate_video()."""
+
+    def test_unsupported_extension(self, tmp_path):
+        """Test bad extensions are rejected without the file existing."""
+        errors = validate_video(tmp_path / "video.txt")
+        assert len(errors) == 1
+        assert ERR_UNSUPPORTED_VIDEO in errors[0]
+
+    def test_missing_file(self, tmp_path):
+        """Test missing videos report not found."""
+        errors = validate_video(tmp_path / "missing.mp4")
+        assert errors == [f"Video file not found: {tmp_path / 'missing.mp4'}"]
+
+    def test_empty_file(self, tmp_path):
+        """Test zero-byte videos are rejected."""
+        video = tmp_path / "empty.mp4"
+        video.touch()
+        assert "empty" in validate_video(video)[0]
+
+    def test_directory(self, tmp_path):
+        """Test directories with a video extension are rejected."""
+        directory = tmp_path / "folder.mp4"
+        directory.mkdir()
+        assert "not a file" in validate_video(directory)[0]
+
+    def test_bad_container_header_skips_ffprobe(self, tmp_path):
+        """Test files without an MP4 header are rejected before probing."""
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"dummy video data")
+
+        with patch("src.utils.validation.probe_video_info") as mock_probe:
+            errors = validate_video(video)
+
+        assert "Not a valid MP4 video file" in errors[0]
+        mock_probe.assert_not_called()
+
+    def test_valid_header_is_probed(self, tmp_path):
+        """Test files with an MP4 header are passed on to ffprobe."""
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"\x00\x00\x00\x18ftypmp42" + b"\x00" * 16)
+        info = {"width": 1080, "height": 1920, "fps": 30.0, "duration": 12.5}
+
+        with patch("src.utils.validation.probe_video_info", return_value=info) as mock_probe:
+            assert validate_video(video) == []
+            assert validate_video(video) == []
+
+        # Unchanged files are probed once
+        mock_probe.assert_called_once()
+
+
+class TestValidateScript:
+    """Test validate_script()."""
+
+    def test_valid_script(self, tmp_path):
+        """Test a non-empty text script passes."""
+        script = tmp_path / "script.txt"
+        script.write_text("Hello world", encoding="utf-8")
+        assert validate_script(script) == []
+
+    def test_whitespace_only_script(self, tmp_path):
+        """Test whitespace-only scripts count as empty."""
+        script = tmp_path / "script.txt"
+        script.write_text("   \n\n", encoding="utf-8")
+        assert "empty" in validate_script(script)[0]
+
+    def test_unsupported_extension(self, tmp_path):
+        """Test unsupported script formats are rejected."""
+        assert ERR_UNSUPPORTED_SCRIPT in validate_script(tmp_path / "script.pdf")[0]
+
+
+class TestValidateAudio:
+    """Test validate_audio()."""
+
+    def test_valid_audio(self, tmp_path):
+        """Test 16 kHz mono WAV passes."""
+        assert validate_audio(_write_wav(tmp_path / "audio.wav")) == []
+
+    @pytest.mark.parametrize("channels,sample_rate,expected", [
+        (2, 16000, "mono"),
+        (1, 44100, "sample rate"),
+    ])
+    def test_wrong_format(self, tmp_path, channels, sample_rate, expected):
+        """Test stereo or non-16 kHz audio is rejected."""
+        audio = _write_wav(tmp_path / "audio.wav", channels, sample_rate)
+        assert expected in validate_audio(audio)[0]
+
+    def test_invalid_wav(self, tmp_path):
+        """Test non-WAV content is rejected."""
+        audio = tmp_path / "audio.wav"
+        audio.write_bytes(b"not a wav file")
+        assert "Invalid WAV file" in validate_audio(audio)[0]
+
+
+class TestStatCache:
+    """Test stat_once() caching."""
+
+    def test_missing_path_returns_error(self, tmp_path):
+        """Test failed stats are returned, not raised."""
+        assert isinstance(stat_once(tmp_path / "missing.mp4"), FileNotFoundError)
+
+    def test_failed_stat_not_cached(self, tmp_path):
+        """Test a file created after a failed stat is seen."""
+        script = tmp_path / "script.txt"
+        cache = {}
+        assert isinstance(stat_once(script, cache), OSError)
+
+        script.write_text("Hello world", encoding="utf-8")
+        assert stat_once(script, cache).st_size == 11
+
+    def test_reuses_cached_result(self, tmp_path):
+        """Test successful stats are reused from the given cache."""
+        script = tmp_path / "script.txt"
+        script.write_text("Hello world", encoding="utf-8")
+        cache = {}
+        first = stat_once(script, cache)
+
+        with patch("src.utils.validation.os.stat") as mock_stat:
+            assert stat_once(script, cache) is first
+        mock_stat.assert_not_called()